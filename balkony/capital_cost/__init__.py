@@ -1,25 +1,44 @@
-from .blenders import BlenderCost
-from .centrifuges import CentrifugeCost
-from .compressors import CompressorCost
-from .conveyors import ConveyorCost
-from .crystallizers import CrystallizerCost
-from .drives import DriveCost
-from .dryers import DryerCost
-from .dust_collectors import DustCollectorCost
-from .evaporators import EvaporatorCost
-from .fans import FanCost
-from .filters import FilterCost
-from .furnaces import FurnanceCost
-from .heat_exchangers import HeatExchangerCost
-from .heaters import HeaterCost
-from .mixers import MixerCost
-from .packing import PackingCost
-from .pumps import PumpCost
-from .reactors import ReactorCost
-from .screens import ScreenCost
-from .tanks import TankCost
-from .trays import TrayCost
-from .towers import TowerCost
-from .turbines import TurbineCost
-from .vaporizers import VaporizerCost
-from .vessels import VesselCost
\ No newline at end of file
+# Each class is imported from its module on first access, so using one
+# equipment class does not pay for importing the other 24.
+_LAZY: dict[str, str] = {
+    'BlenderCost':       'blenders',
+    'CentrifugeCost':    'centrifuges',
+    'ColumnCost':        'columns',
+    'CompressorCost':    'compressors',
+    'ConveyorCost':      'conveyors',
+    'CrystallizerCost':  'crystallizers',
+    'DriveCost':         'drives',
+    'DryerCost':         'dryers',
+    'DustCollectorCost': 'dust_collectors',
+    'EvaporatorCost':    'evaporators',
+    'FanCost':           'fans',
+    'FilterCost':        'filters',
+    'FurnanceCost':      'furnaces',
+    'HeatExchangerCost': 'heat_exchangers',
+    'HeaterCost':        'heaters',
+    'MixerCost':         'mixers',
+    'PackingCost':       'packing',
+    'PumpCost':          'pumps',
+    'ReactorCost':       'reactors',
+    'ScreenCost':        'screens',
+    'TankCost':          'tanks',
+    'TrayCost':          'trays',
+    'TowerCost':         'towers',
+    'TurbineCost':       'turbines',
+    'VaporizerCost':     'vaporizers',
+    'VesselCost':        'vessels',
+}
+
+__all__ = list(_LAZY)
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        # __import__ rather than importlib.import_module, so that lazy imports
+        # still show up in python -X importtime.
+        value = getattr(__import__(_LAZY[name], globals(), None, [name], 1), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,7 @@
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
 
-class BlenderCost:
+class BlenderCost(metaclass=Interned):
     class Type(Enum):
         Kneader = { 'min_size': 0.14, 'max_size': 3.0, 'data': (5.0141, 0.5867, 0.3224), 'unit':'m3', 'Fbare': 1.12}
         Ribbon =  { 'min_size': 0.7, 'max_size': 11.0, 'data': (4.1366, 0.5072, 0.0070), 'unit':'m3', 'Fbare': 1.12 }
@@ -14,6 +14,14 @@ class BlenderCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
     def purchased(self, volume: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             volume (m3) - Volume of blender\n
@@ -30,6 +38,26 @@ class BlenderCost:
         """
         FBM= self._type.value['Fbare']
         cp0 = self._equipment.cost(volume, CEPCI)
-        return EquipmentCostResult(status= cp0.status,
+        return EquipmentCostResult(code= cp0.code,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM)
+
+    def purchased_many(self, volume, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            volume (m3) - Volume of blender\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(volume, CEPCI)
+
+    def bare_module_many(self, volume, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            volume (m3) - Volume of blender\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM= self._type.value['Fbare']
+        cp0 = self._equipment.cost_many(volume, CEPCI)
+        return EquipmentCostBatchResult(code= cp0.code,
+                                        CEPCI= cp0.CEPCI,
+                                        value= cp0.value*FBM)
@@ -0,0 +1,96 @@
+import inspect
+from dataclasses import dataclass
+from typing import Tuple
+import numpy as np
+from .core import CostStatus
+from .core.status import MASKS, SIZE_CHECK, range_codes, size_flags, status_view
+
+@dataclass(frozen=True)
+class BudgetResult:
+    '''
+    Largest size bought with budget at CEPCI. code holds the CostStatus bits
+    of that size, and of the fixed inputs (e.g. pressure) for bare module
+    costs.
+    '''
+    code: int
+    size: float
+    budget: float
+    CEPCI: float
+    checks: Tuple[str, ...] = SIZE_CHECK
+
+    @property
+    def status(self) -> dict[str, Tuple[str, bool]]:
+        return status_view(self.code, self.checks)
+
+@dataclass(frozen=True)
+class BudgetBatchResult:
+    '''
+    Columnar counterpart of BudgetResult.
+    '''
+    code: np.ndarray
+    size: np.ndarray
+    budget: np.ndarray
+    CEPCI: np.ndarray
+    checks: Tuple[str, ...] = SIZE_CHECK
+
+    def __len__(self) -> int:
+        return len(self.size)
+
+    @property
+    def status(self) -> dict[str, np.ndarray]:
+        return {key: range_codes(self.code, key) for key in self.checks}
+
+    def result(self, index: int) -> BudgetResult:
+        '''
+        index (-) - Row of the batch\n
+        return - Scalar result of the row
+        '''
+        return BudgetResult(code=CostStatus(int(self.code[index])),
+                            size=float(self.size[index]),
+                            budget=float(np.broadcast_to(self.budget, self.size.shape)[index]),
+                            CEPCI=float(np.broadcast_to(self.CEPCI, self.size.shape)[index]),
+                            checks=self.checks)
+
+def max_size_many(estimator, budget, method: str = 'bare_module', CEPCI = 397, **inputs) -> BudgetBatchResult:
+    '''
+    estimator (-) - Equipment cost object, e.g. HeatExchangerCost(HeatExchangerCost.Type.FixedTube)\n
+    budget ($) - Array of budgets\n
+    method (-) - 'purchased' or 'bare_module'\n
+    CEPCI (-) - Chemical plant cost index, scalar or array aligned with budget\n
+    inputs (-) - Other arguments of the cost method (pressure, diameter...), held fixed, scalars or arrays\n
+    return (-) - Largest size costing the budget, on the branch where cost grows with size; NaN (flagged
+    INVALID_INPUT) where no size is that cheap
+    '''
+    if method not in ('purchased', 'bare_module'):
+        raise Exception(f"Invalid method ({method})")
+    equipment = estimator.equipment
+    size = next(iter(inspect.signature(getattr(estimator, method)).parameters))
+    if size in inputs or 'size' in inputs:
+        raise Exception(f"The size ({size}) is the unknown")
+    budget = np.asarray(budget, dtype=float)
+    CEPCI = np.asarray(CEPCI, dtype=float)
+    # The cost is Cp0(size) times a factor of the other inputs only, so the
+    # factor is read once at a reference size.
+    reference = equipment.properties.min_size
+    fixed = getattr(estimator, method + '_many')(reference, **inputs, CEPCI=CEPCI)
+    factor = fixed.value/equipment.cost_many(reference, CEPCI).value
+    with np.errstate(divide='ignore', invalid='ignore'):
+        value = equipment.inverse_many(budget/factor, CEPCI)
+    code = size_flags(value, equipment.properties.min_size, equipment.properties.max_size)
+    code |= np.broadcast_to(fixed.code & np.uint8(0xFF & ~MASKS['size']), code.shape)
+    return BudgetBatchResult(code=code,
+                             size=value,
+                             budget=budget,
+                             CEPCI=CEPCI,
+                             checks=fixed.checks)
+
+def max_size(estimator, budget: float, method: str = 'bare_module', CEPCI: float = 397, **inputs) -> BudgetResult:
+    '''
+    estimator (-) - Equipment cost object, e.g. PumpCost(PumpCost.Type.Centrifugal)\n
+    budget ($) - Budget\n
+    method (-) - 'purchased' or 'bare_module'\n
+    CEPCI (-) - Chemical plant cost index\n
+    inputs (-) - Other arguments of the cost method (pressure, diameter...), held fixed\n
+    return (-) - Largest size costing the budget, on the branch where cost grows with size
+    '''
+    return max_size_many(estimator, [budget], method, CEPCI, **inputs).result(0)
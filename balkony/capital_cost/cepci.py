@@ -0,0 +1,45 @@
+import numpy as np
+
+# Annual average Chemical Engineering Plant Cost Index (1957-59 = 100).
+CEPCI_ANNUAL: dict[int, float] = {
+    1990: 357.6, 1991: 361.3, 1992: 358.2, 1993: 359.2, 1994: 368.1,
+    1995: 381.1, 1996: 381.7, 1997: 386.5, 1998: 389.5, 1999: 390.6,
+    2000: 394.1, 2001: 394.3, 2002: 395.6, 2003: 402.0, 2004: 444.2,
+    2005: 468.2, 2006: 499.6, 2007: 525.4, 2008: 575.4, 2009: 521.9,
+    2010: 550.8, 2011: 585.7, 2012: 584.6, 2013: 567.3, 2014: 576.1,
+    2015: 556.8, 2016: 541.7, 2017: 567.5, 2018: 603.1, 2019: 607.5,
+    2020: 596.2, 2021: 708.0, 2022: 816.0, 2023: 797.9,
+}
+
+_YEARS = np.array(list(CEPCI_ANNUAL), dtype=float)
+_VALUES = np.array(list(CEPCI_ANNUAL.values()), dtype=float)
+
+def cepci(year, month = None):
+    '''
+    year (-) - Calendar year, scalar or array\n
+    month (-) - Month (1-12), scalar or array aligned with year, or None for the annual average\n
+    return (-) - Chemical plant cost index
+
+    Monthly values are interpolated linearly between annual averages, each
+    taken at mid-year, and held at the first/last average outside them.
+    '''
+    year_array = np.asarray(year)
+    if np.any((year_array < _YEARS[0]) | (year_array > _YEARS[-1])):
+        raise Exception(f"CEPCI is tabulated for {int(_YEARS[0])}-{int(_YEARS[-1])} only ({year})")
+    if month is None:
+        value = _VALUES[(year_array - int(_YEARS[0])).astype(int)]
+    else:
+        month_array = np.asarray(month)
+        if np.any((month_array < 1) | (month_array > 12)):
+            raise Exception(f"Invalid month ({month})")
+        value = np.interp(year_array + (month_array - 0.5)/12, _YEARS + 0.5, _VALUES)
+    return float(value) if np.ndim(value) == 0 else value
+
+def escalate(result, year, month = None):
+    '''
+    result ($) - EquipmentCostResult or EquipmentCostBatchResult\n
+    year (-) - Target year, scalar or array\n
+    month (-) - Target month, or None for the annual average\n
+    return ($) - result rescaled to the CEPCI of year/month
+    '''
+    return result.rescale(cepci(year, month))
@@ -0,0 +1,91 @@
+import math
+from dataclasses import dataclass
+import numpy as np
+from .columns import ColumnCost, ColumnCostResult
+from .core.status import OK, flag_mask
+from .trays import TrayCost
+
+TRAYS: np.ndarray = np.arange(1, 151)
+DIAMETERS: np.ndarray = np.geomspace(0.3, 6.0, 200)
+
+@dataclass(frozen=True)
+class ColumnDesign:
+    '''
+    Cheapest column of the trays x diameters grid. value holds the total bare
+    module cost of every grid point, NaN where the diameter is too small for
+    the vapor load or the trays too few for the separation.
+    '''
+    num_trays: int
+    diameter: float
+    height: float
+    reflux: float
+    result: ColumnCostResult
+    trays: np.ndarray
+    diameters: np.ndarray
+    value: np.ndarray
+
+def reflux_ratio(stages, min_stages: float, min_reflux: float) -> np.ndarray:
+    '''
+    stages (-) - Number of theoretical stages, scalar or array\n
+    min_stages (-) - Minimum number of stages (total reflux)\n
+    min_reflux (-) - Minimum reflux ratio\n
+    return (-) - Reflux ratio from the Gilliland correlation (Eduljee form), NaN for stages <= min_stages
+    '''
+    stages = np.asarray(stages, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Y = (stages - min_stages)/(stages + 1)
+        X = np.maximum(1 - Y/0.75, 0)**(1/0.5668)
+        reflux = (X + min_reflux)/(1 - X)
+    return np.where(stages > min_stages, reflux, np.nan)
+
+def optimize_column(column: ColumnCost, pressure: float, min_stages: float, min_reflux: float, distillate: float,
+                    latent_heat: float, vapor_flux: float, trays = TRAYS, diameters = DIAMETERS, efficiency: float = 0.7,
+                    tray_spacing: float = 0.6, extra_height: float = 3.0, CEPCI: float = 397) -> ColumnDesign:
+    '''
+    column (-) - Tray column to cost, e.g. ColumnCost(internals=TrayCost(TrayCost.Type.Valve))\n
+    pressure (barg) - Operating pressure\n
+    min_stages (-) - Minimum number of theoretical stages (Fenske)\n
+    min_reflux (-) - Minimum reflux ratio (Underwood)\n
+    distillate (kmol/s) - Distillate flow\n
+    latent_heat (kJ/kmol) - Heat of vaporization of the overhead vapor\n
+    vapor_flux (kmol/s/m2) - Largest vapor flow per column cross-section\n
+    trays (-) - Numbers of trays to scan\n
+    diameters (m) - Diameters to scan\n
+    efficiency (-) - Overall tray efficiency; stages = trays*efficiency\n
+    tray_spacing (m) - Distance between trays; height = trays*tray_spacing + extra_height\n
+    extra_height (m) - Height above the top tray and below the bottom one\n
+    CEPCI (-) - Chemical plant cost indexes\n
+    return ($) - Number of trays and diameter with the lowest total bare module cost, among the grid points
+    whose size and pressure are in range when there are any
+    '''
+    if not isinstance(column.internals, TrayCost):
+        raise Exception("Only tray columns have a number of trays")
+    trays = np.asarray(trays, dtype=float).ravel()
+    diameters = np.asarray(diameters, dtype=float).ravel()
+    reflux = reflux_ratio(trays*efficiency, min_stages, min_reflux)
+    vapor = distillate*(reflux + 1)
+    height = trays*tray_spacing + extra_height
+    # Each input varies along one axis only, so the tray, pressure factor and
+    # exchanger costs are evaluated once per tray count or diameter, and only
+    # the shell volume spans the whole grid.
+    duty = vapor*latent_heat
+    grid = column.bare_module_many(diameters[None, :], height[:, None], pressure, num_trays=trays[:, None], CEPCI=CEPCI,
+                                   **{name + '_duty': duty[:, None] for name in column.exchangers})
+    with np.errstate(invalid='ignore'):
+        feasible = (math.pi/4*diameters[None, :]**2*vapor_flux >= vapor[:, None])
+    value = np.where(feasible, grid.value, np.nan)
+    ranked = np.where(flag_mask(grid.code, OK), value, np.nan)
+    if np.isnan(ranked).all():
+        ranked = value
+    if np.isnan(ranked).all():
+        raise Exception("No number of trays and diameter satisfy the separation and the vapor load")
+    i, j = np.unravel_index(np.nanargmin(ranked), ranked.shape)
+    return ColumnDesign(num_trays=int(trays[i]),
+                        diameter=float(diameters[j]),
+                        height=float(height[i]),
+                        reflux=float(reflux[i]),
+                        result=column.bare_module(float(diameters[j]), float(height[i]), pressure, num_trays=int(trays[i]), CEPCI=CEPCI,
+                                                  **{name + '_duty': float(duty[i]) for name in column.exchangers}),
+                        trays=trays,
+                        diameters=diameters,
+                        value=value)
@@ -0,0 +1,217 @@
+import functools
+import math
+from dataclasses import dataclass
+from typing import Tuple
+import numpy as np
+from .core import CostStatus, EquipmentCostBatchResult, EquipmentCostResult, Interned
+from .core.status import range_codes, status_view
+from .heat_exchangers import HeatExchangerCost
+from .packing import PackingCost
+from .towers import TowerCost
+from .trays import TrayCost
+
+def _checks(items) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(check for item in items for check in item.checks))
+
+@dataclass(frozen=True)
+class ColumnCostResult:
+    '''
+    Itemized cost of a column: shell, internals, and the reboiler and
+    condenser when the column has them. code ORs the CostStatus bits of the
+    items; status flags a check when any item is out of its range.
+    '''
+    items: dict[str, EquipmentCostResult]
+    CEPCI: float
+
+    @property
+    def value(self) -> float:
+        return math.fsum(item.value for item in self.items.values())
+
+    @property
+    def code(self) -> int:
+        code = CostStatus.OK
+        for item in self.items.values():
+            code |= item.code
+        return code
+
+    @property
+    def checks(self) -> Tuple[str, ...]:
+        return _checks(self.items.values())
+
+    @property
+    def status(self) -> dict[str, Tuple[str, bool]]:
+        return status_view(self.code, self.checks)
+
+    @property
+    def total(self) -> EquipmentCostResult:
+        return EquipmentCostResult(code=self.code, checks=self.checks, CEPCI=self.CEPCI, value=self.value)
+
+@dataclass(frozen=True)
+class ColumnCostBatchResult:
+    '''
+    Columnar counterpart of ColumnCostResult.
+    '''
+    items: dict[str, EquipmentCostBatchResult]
+    CEPCI: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    @property
+    def value(self) -> np.ndarray:
+        return sum(item.value for item in self.items.values())
+
+    @property
+    def code(self) -> np.ndarray:
+        return functools.reduce(np.bitwise_or, (item.code for item in self.items.values()))
+
+    @property
+    def checks(self) -> Tuple[str, ...]:
+        return _checks(self.items.values())
+
+    @property
+    def status(self) -> dict[str, np.ndarray]:
+        code = self.code
+        return {key: range_codes(code, key) for key in self.checks}
+
+    @property
+    def total(self) -> EquipmentCostBatchResult:
+        return EquipmentCostBatchResult(code=self.code, checks=self.checks, CEPCI=self.CEPCI, value=self.value)
+
+    def result(self, index: int) -> ColumnCostResult:
+        '''
+        index (-) - Row of the batch\n
+        return - Scalar result of the row
+        '''
+        items = {name: item.result(index) for name, item in self.items.items()}
+        return ColumnCostResult(items=items, CEPCI=next(iter(items.values())).CEPCI)
+
+class ColumnCost(metaclass=Interned):
+    '''
+    Distillation column built from a TowerCost shell, TrayCost or PackingCost
+    internals, and optional reboiler and condenser HeatExchangerCost. Duties
+    are turned into exchanger areas with area = duty/(U*deltaTemp).
+    '''
+    def __init__(self, shell: TowerCost = TowerCost(),
+                 internals: TrayCost | PackingCost = TrayCost(TrayCost.Type.Sieve),
+                 reboiler: HeatExchangerCost | None = HeatExchangerCost(HeatExchangerCost.Type.KettleReboiler),
+                 condenser: HeatExchangerCost | None = HeatExchangerCost(HeatExchangerCost.Type.FixedTube),
+                 reboiler_U: float = 0.85, reboiler_deltaTemp: float = 20.0,
+                 condenser_U: float = 0.85, condenser_deltaTemp: float = 15.0) -> None:
+        '''
+        shell (-) - Cost of the vessel\n
+        internals (-) - Cost of the trays or of the packing\n
+        reboiler (-) - Cost of the reboiler, or None\n
+        condenser (-) - Cost of the condenser, or None\n
+        reboiler_U (kW/m2/K) - Overall heat transfer coefficient of the reboiler\n
+        reboiler_deltaTemp (K) - Mean temperature difference of the reboiler\n
+        condenser_U (kW/m2/K) - Overall heat transfer coefficient of the condenser\n
+        condenser_deltaTemp (K) - Mean temperature difference of the condenser
+        '''
+        if not isinstance(internals, (TrayCost, PackingCost)):
+            raise Exception(f"Invalid internals ({type(internals).__name__})")
+        self._shell, self._internals = shell, internals
+        self._exchangers = {name: (exchanger, U*deltaTemp) for name, exchanger, U, deltaTemp in
+                            (('reboiler', reboiler, reboiler_U, reboiler_deltaTemp), ('condenser', condenser, condenser_U, condenser_deltaTemp))
+                            if exchanger is not None}
+
+    @property
+    def internals(self) -> TrayCost | PackingCost:
+        return self._internals
+
+    @property
+    def exchangers(self) -> dict[str, HeatExchangerCost]:
+        '''
+        return (-) - Heat exchangers of the column by name ('reboiler', 'condenser'); each takes a <name>_duty input
+        '''
+        return {name: exchanger for name, (exchanger, _) in self._exchangers.items()}
+
+    def _evaluate(self, method: str, many: bool, diameter, height, pressure, reboiler_duty, condenser_duty,
+                  num_trays, packed_volume, CEPCI) -> dict:
+        suffix = '_many' if many else ''
+        call = lambda estimator, *args: getattr(estimator, method + suffix)(*args, CEPCI=CEPCI)
+        section = math.pi/4*(np.asarray(diameter, dtype=float) if many else diameter)**2
+        volume = section*(np.asarray(height, dtype=float) if many else height)
+        items = {'shell': call(self._shell, volume, pressure, diameter) if method == 'bare_module' else call(self._shell, volume)}
+        if isinstance(self._internals, TrayCost):
+            if num_trays is None or packed_volume is not None:
+                raise Exception("A tray column takes num_trays, not packed_volume")
+            items['internals'] = call(self._internals, section, num_trays)
+        else:
+            if num_trays is not None:
+                raise Exception("A packed column takes packed_volume, not num_trays")
+            items['internals'] = call(self._internals, volume if packed_volume is None else packed_volume)
+        for name, duty in (('reboiler', reboiler_duty), ('condenser', condenser_duty)):
+            if name not in self._exchangers:
+                if duty is not None:
+                    raise Exception(f"The column has no {name}")
+                continue
+            if duty is None:
+                raise Exception(f"Missing {name}_duty")
+            exchanger, transfer = self._exchangers[name]
+            area = (np.asarray(duty, dtype=float) if many else duty)/transfer
+            items[name] = call(exchanger, area, pressure) if method == 'bare_module' else call(exchanger, area)
+        return items
+
+    def purchased(self, diameter: float, height: float, reboiler_duty: float | None = None, condenser_duty: float | None = None,
+                  num_trays: int | None = None, packed_volume: float | None = None, CEPCI: float = 397) -> ColumnCostResult:
+        """
+            diameter (m) - diameter of column\n
+            height (m) - height of column\n
+            reboiler_duty (kW) - Heat duty of reboiler\n
+            condenser_duty (kW) - Heat duty of condenser\n
+            num_trays (-) - number of trays, for tray columns\n
+            packed_volume (m3) - volume of packing, the whole column by default\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of each item of the column
+        """
+        items = self._evaluate('purchased', False, diameter, height, None, reboiler_duty, condenser_duty, num_trays, packed_volume, CEPCI)
+        return ColumnCostResult(items=items, CEPCI=CEPCI)
+
+    def bare_module(self, diameter: float, height: float, pressure: float, reboiler_duty: float | None = None,
+                    condenser_duty: float | None = None, num_trays: int | None = None, packed_volume: float | None = None,
+                    CEPCI: float = 397) -> ColumnCostResult:
+        """
+            diameter (m) - diameter of column\n
+            height (m) - height of column\n
+            pressure (barg) - Operating pressure\n
+            reboiler_duty (kW) - Heat duty of reboiler\n
+            condenser_duty (kW) - Heat duty of condenser\n
+            num_trays (-) - number of trays, for tray columns\n
+            packed_volume (m3) - volume of packing, the whole column by default\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) of each item of the column
+        """
+        items = self._evaluate('bare_module', False, diameter, height, pressure, reboiler_duty, condenser_duty, num_trays, packed_volume, CEPCI)
+        return ColumnCostResult(items=items, CEPCI=CEPCI)
+
+    def purchased_many(self, diameter, height, reboiler_duty = None, condenser_duty = None, num_trays = None,
+                       packed_volume = None, CEPCI = 397) -> ColumnCostBatchResult:
+        """
+            diameter (m) - diameter of column\n
+            height (m) - height of column\n
+            reboiler_duty (kW) - Heat duty of reboiler\n
+            condenser_duty (kW) - Heat duty of condenser\n
+            num_trays (-) - number of trays, for tray columns\n
+            packed_volume (m3) - volume of packing, the whole column by default\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of each item of the column for each row
+        """
+        items = self._evaluate('purchased', True, diameter, height, None, reboiler_duty, condenser_duty, num_trays, packed_volume, CEPCI)
+        return ColumnCostBatchResult(items=items, CEPCI=np.asarray(CEPCI, dtype=float))
+
+    def bare_module_many(self, diameter, height, pressure, reboiler_duty = None, condenser_duty = None, num_trays = None,
+                         packed_volume = None, CEPCI = 397) -> ColumnCostBatchResult:
+        """
+            diameter (m) - diameter of column\n
+            height (m) - height of column\n
+            pressure (barg) - Operating pressure\n
+            reboiler_duty (kW) - Heat duty of reboiler\n
+            condenser_duty (kW) - Heat duty of condenser\n
+            num_trays (-) - number of trays, for tray columns\n
+            packed_volume (m3) - volume of packing, the whole column by default\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) of each item of the column for each row
+        """
+        items = self._evaluate('bare_module', True, diameter, height, pressure, reboiler_duty, condenser_duty, num_trays, packed_volume, CEPCI)
+        return ColumnCostBatchResult(items=items, CEPCI=np.asarray(CEPCI, dtype=float))
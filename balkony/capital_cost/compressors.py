@@ -1,7 +1,7 @@
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
 
-class CompressorCost:
+class CompressorCost(metaclass=Interned):
     class Material(Enum):
         CarbonSteel = {'Centrifugal': 2.78, 'Axial': 3.85, 'Reciprocating': 3.37, 'Rotary': 2.41}
         StainlessSteel = {'Centrifugal': 5.77, 'Axial': 8.03, 'Reciprocating': 7.01, 'Rotary': 5.07}
@@ -22,6 +22,18 @@ class CompressorCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
+    @property
+    def material(self) -> Material:
+        return self._material
+
     def purchased(self, power: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             power (kW) - Power of compressor\n
@@ -38,6 +50,26 @@ class CompressorCost:
         """
         FBM = self._material.value[self._type.name]
         cp0 = self._equipment.cost(power, CEPCI)
-        return EquipmentCostResult(status= cp0.status,
+        return EquipmentCostResult(code= cp0.code,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM)
+
+    def purchased_many(self, power, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            power (kW) - Power of compressor\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(power, CEPCI)
+
+    def bare_module_many(self, power, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            power (kW) - Power of compressor\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM = self._material.value[self._type.name]
+        cp0 = self._equipment.cost_many(power, CEPCI)
+        return EquipmentCostBatchResult(code= cp0.code,
+                                        CEPCI= cp0.CEPCI,
+                                        value= cp0.value*FBM)
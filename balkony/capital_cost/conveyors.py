@@ -1,7 +1,7 @@
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
 
-class ConveyorCost:
+class ConveyorCost(metaclass=Interned):
     class Type(Enum):
         AutoBatch = {'min_size': 0.5, 'max_size': 1.7, 'data': (4.7681, 0.9740, 0.0240), 'unit':'m', 'Fbare': 1.20}
         Centrifugal = {'min_size': 0.5, 'max_size': 1.0, 'data': ( 4.3657,  0.8764,  -0.0049), 'unit':'m', 'Fbare': 1.25}
@@ -15,6 +15,14 @@ class ConveyorCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
     def purchased(self, diameter: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             diameter (m) - Diameter of conveyors\n
@@ -31,6 +39,26 @@ class ConveyorCost:
         """
         FBM= self._type.value['Fbare']
         cp0 = self._equipment.cost(diameter, CEPCI)
-        return EquipmentCostResult(status= cp0.status,
+        return EquipmentCostResult(code= cp0.code,
                                    CEPCI= CEPCI,
-                                   value= cp0.value*FBM)
\ No newline at end of file
+                                   value= cp0.value*FBM)
+
+    def purchased_many(self, diameter, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            diameter (m) - Diameter of conveyors\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(diameter, CEPCI)
+
+    def bare_module_many(self, diameter, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            diameter (m) - Diameter of conveyors\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM= self._type.value['Fbare']
+        cp0 = self._equipment.cost_many(diameter, CEPCI)
+        return EquipmentCostBatchResult(code= cp0.code,
+                                        CEPCI= cp0.CEPCI,
+                                        value= cp0.value*FBM)
@@ -1,3 +1,9 @@
 from .equipment_purchased import EquipmentPurchased
 from .equipment_result import EquipmentCostResult
-from .equipment_properties import EquipmentProperties
\ No newline at end of file
+from .equipment_batch_result import EquipmentCostBatchResult
+from .equipment_result_array import EquipmentCostResultArray
+from .equipment_properties import EquipmentProperties
+from .interned import Interned
+from .structure import Structure
+from .status import CostStatus
+from .cost_cache import CachedCost, CacheInfo, LRUCache
@@ -0,0 +1,97 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple
+from .equipment_result import EquipmentCostResult
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    size: int
+
+class LRUCache:
+    '''
+    Bounded, thread-safe least-recently-used cache with hit/miss counters.
+    '''
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise Exception(f"Cache size must be positive ({maxsize})")
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        '''
+        key (-) - Hashable cache key\n
+        compute (-) - Called on a miss to produce the value\n
+        return (-) - Cached or freshly computed value
+        '''
+        with self._lock:
+            if key in self._data:
+                self._hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self._misses += 1
+        value = compute()
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        '''
+        key (-) - Entry to drop, or None to clear the whole cache
+        '''
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
+
+class CachedCost:
+    '''
+    Opt-in memoization of an equipment estimator. purchased and bare_module
+    results are kept in a bounded LRU cache keyed by the call arguments;
+    every other attribute is delegated to the wrapped estimator.
+    '''
+    def __init__(self, estimator, maxsize: int = 1024) -> None:
+        self._estimator = estimator
+        self._cache = LRUCache(maxsize)
+
+    @property
+    def estimator(self):
+        return self._estimator
+
+    def __getattr__(self, name: str) -> Any:
+        if name in ('_estimator', '_cache'):
+            raise AttributeError(name)
+        return getattr(self._estimator, name)
+
+    def _call(self, method: str, args: tuple, kwargs: dict) -> EquipmentCostResult:
+        key = (method, args, tuple(kwargs.items()))
+        return self._cache.get_or_compute(key, lambda: getattr(self._estimator, method)(*args, **kwargs))
+
+    def purchased(self, *args, **kwargs) -> EquipmentCostResult:
+        return self._call('purchased', args, kwargs)
+
+    def bare_module(self, *args, **kwargs) -> EquipmentCostResult:
+        return self._call('bare_module', args, kwargs)
+
+    def cache_info(self) -> CacheInfo:
+        return self._cache.info()
+
+    def invalidate(self) -> None:
+        self._cache.invalidate()
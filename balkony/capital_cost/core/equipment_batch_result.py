@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from typing import Tuple
+import numpy as np
+from .equipment_result import EquipmentCostResult
+from .status import CostStatus, SIZE_CHECK, count_flags, flag_mask, range_codes
+
+@dataclass(frozen=True)
+class EquipmentCostBatchResult:
+    '''
+    Columnar counterpart of EquipmentCostResult. code is an uint8 array of
+    CostStatus bits with the shape of value; status derives the per-check range codes
+    (0 - OK, 1 - below range, 2 - above range, 3 - invalid input) from it. When rows of different
+    equipment are mixed, checked maps a check to the rows it was performed on;
+    status reports -1 for the other rows.
+    '''
+    code: np.ndarray
+    value: np.ndarray
+    CEPCI: np.ndarray
+    checks: Tuple[str, ...] = SIZE_CHECK
+    checked: dict[str, np.ndarray] | None = None
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    @property
+    def status(self) -> dict[str, np.ndarray]:
+        status = {key: range_codes(self.code, key) for key in self.checks}
+        for key, rows in (self.checked or {}).items():
+            status[key] = np.where(rows, status[key], np.int8(-1))
+        return status
+
+    def has(self, flag: CostStatus) -> np.ndarray:
+        '''
+        flag (-) - CostStatus member or combination; OK selects rows without warnings\n
+        return (-) - Boolean mask of the rows carrying any bit of flag
+        '''
+        return flag_mask(self.code, flag)
+
+    def count(self, flag: CostStatus | None = None) -> int | dict[CostStatus, int]:
+        '''
+        flag (-) - CostStatus to count, or None for every flag\n
+        return (-) - Number of rows carrying flag, or a count per flag
+        '''
+        if flag is None:
+            return count_flags(self.code)
+        return int(np.count_nonzero(self.has(flag)))
+
+    def where(self, flag: CostStatus) -> np.ndarray:
+        '''
+        flag (-) - CostStatus member or combination\n
+        return (-) - Indices of the rows carrying flag
+        '''
+        return np.flatnonzero(self.has(flag))
+
+    def filter(self, flag: CostStatus) -> 'EquipmentCostBatchResult':
+        '''
+        flag (-) - CostStatus member or combination\n
+        return - Flattened batch holding only the rows carrying flag
+        '''
+        mask = self.has(flag).ravel()
+        CEPCI = self.CEPCI if self.CEPCI.ndim == 0 else np.broadcast_to(self.CEPCI, self.value.shape).ravel()[mask]
+        checked = None if self.checked is None else {key: rows.ravel()[mask] for key, rows in self.checked.items()}
+        return EquipmentCostBatchResult(code=self.code.ravel()[mask],
+                                        checks=self.checks,
+                                        CEPCI=CEPCI,
+                                        value=self.value.ravel()[mask],
+                                        checked=checked)
+
+    def rescale(self, new_CEPCI) -> 'EquipmentCostBatchResult':
+        '''
+        new_CEPCI (-) - Chemical plant cost index to escalate to, scalar or array aligned with the rows\n
+        return ($) - Same estimates at new_CEPCI, without re-evaluating the cost curves
+        '''
+        new_CEPCI = np.asarray(new_CEPCI, dtype=float)
+        return EquipmentCostBatchResult(code=self.code,
+                                        checks=self.checks,
+                                        CEPCI=new_CEPCI,
+                                        value=self.value*(new_CEPCI/self.CEPCI),
+                                        checked=self.checked)
+
+    def result(self, index: int) -> EquipmentCostResult:
+        '''
+        index (-) - Row of the batch\n
+        return - Scalar result of the row
+        '''
+        CEPCI = self.CEPCI if self.CEPCI.ndim == 0 else self.CEPCI[index]
+        checks = self.checks
+        if self.checked is not None:
+            checks = tuple(key for key in checks if key not in self.checked or self.checked[key][index])
+        return EquipmentCostResult(code=CostStatus(int(self.code[index])),
+                                   checks=checks,
+                                   CEPCI=float(CEPCI),
+                                   value=float(self.value[index]))
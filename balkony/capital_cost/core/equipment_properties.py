@@ -1,9 +1,9 @@
 from dataclasses import dataclass
 from typing import Tuple
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EquipmentProperties:
     data: Tuple[float, float, float]
     unit: str
     min_size: float
-    max_size: float
\ No newline at end of file
+    max_size: float
@@ -1,27 +1,119 @@
 import math
+import numpy as np
 from .equipment_properties import EquipmentProperties
 from .equipment_result import EquipmentCostResult
+from .equipment_batch_result import EquipmentCostBatchResult
+from .status import CostStatus, MESSAGES, OK, SIZE_ABOVE, SIZE_BELOW, INVALID_INPUT, size_flags
 
 class EquipmentPurchased():
+    __slots__ = ('_properties',)
+
     def __init__(self, properties) -> None:
         self._properties: EquipmentProperties = properties
 
     @property
     def properties(self) -> EquipmentProperties:
         return self._properties
-    
+
     def cost(self, size: float, CEPCI: float = 397) -> EquipmentCostResult:
         K1, K2, K3 = self.properties.data
         log_size = math.log(size,10)
         cp0 = 10**(K1 + K2*log_size + K3*(log_size**2))
-        return EquipmentCostResult(status= {'size': self.check_range(size)},
+        return EquipmentCostResult(code= self.range_code(size),
                                    CEPCI= CEPCI,
                                    value= (CEPCI/397.0)*cp0)
-    
+
+    def cost_many(self, size, CEPCI = 397) -> EquipmentCostBatchResult:
+        '''
+        size (-) - Array (or any buffer) of equipment sizes\n
+        CEPCI (-) - Chemical plant cost index, scalar or array aligned with size\n
+        return ($) - Purchased costs of equipment, NaN where flagged INVALID_INPUT
+        '''
+        K1, K2, K3 = self.properties.data
+        size = np.asarray(size, dtype=float)
+        CEPCI = np.asarray(CEPCI, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_size = np.log(size)/math.log(10)
+            cp0 = 10**(K1 + K2*log_size + K3*(log_size**2))
+        code = self.check_range_many(size)
+        value = np.where(code & INVALID_INPUT, np.nan, (CEPCI/397.0)*cp0)
+        return EquipmentCostBatchResult(code= np.broadcast_to(code, value.shape),
+                                        CEPCI= CEPCI,
+                                        value= value)
+
+    def derivative(self, size: float, CEPCI: float = 397) -> float:
+        '''
+        size (-) - Equipment size\n
+        CEPCI (-) - Chemical plant cost index\n
+        return ($/-) - Derivative of the purchased cost with respect to size
+        '''
+        K1, K2, K3 = self.properties.data
+        log_size = math.log(size,10)
+        cp0 = 10**(K1 + K2*log_size + K3*(log_size**2))
+        return (CEPCI/397.0)*cp0*(K2 + 2*K3*log_size)/size
+
+    def derivative_many(self, size, CEPCI = 397) -> np.ndarray:
+        '''
+        size (-) - Array of equipment sizes\n
+        CEPCI (-) - Chemical plant cost index, scalar or array aligned with size\n
+        return ($/-) - Derivatives of the purchased costs with respect to size, NaN for non-positive sizes
+        '''
+        K1, K2, K3 = self.properties.data
+        size = np.asarray(size, dtype=float)
+        CEPCI = np.asarray(CEPCI, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_size = np.log(size)/math.log(10)
+            cp0 = 10**(K1 + K2*log_size + K3*(log_size**2))
+            slope = (CEPCI/397.0)*cp0*(K2 + 2*K3*log_size)/size
+        return np.where(size > 0, slope, np.nan)
+
+    def inverse(self, cost: float, CEPCI: float = 397) -> float:
+        '''
+        cost ($) - Purchased cost\n
+        CEPCI (-) - Chemical plant cost index\n
+        return (-) - Size with that purchased cost, on the branch where cost grows with size (NaN if none)
+        '''
+        return float(self.inverse_many(cost, CEPCI))
+
+    def inverse_many(self, cost, CEPCI = 397) -> np.ndarray:
+        '''
+        cost ($) - Array of purchased costs\n
+        CEPCI (-) - Chemical plant cost index, scalar or array aligned with cost\n
+        return (-) - Sizes with those purchased costs, on the branch where cost grows with size. Where a concave
+        correlation never reaches the cost, the size at its peak; NaN where no size is that cheap
+        '''
+        K1, K2, K3 = self.properties.data
+        cost = np.asarray(cost, dtype=float)
+        CEPCI = np.asarray(CEPCI, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            C = K1 - np.log10(cost*397.0/CEPCI)
+            D = K2**2 - 4*K3*C
+            # Root of K3 L^2 + K2 L + C = 0 where dlog(Cp0)/dL = sqrt(D) >= 0,
+            # in the form that stays accurate as K3 goes to 0.
+            log_size = np.where(K2 + np.sqrt(D) != 0, -2*C/(K2 + np.sqrt(D)), -K2/K3 if K3 else np.nan)
+            if K3 < 0:
+                log_size = np.where(D < 0, -K2/(2*K3), log_size)
+        return np.where(cost > 0, 10**log_size, np.nan)
+
     def check_range(self, size: float) -> str:
+        return MESSAGES['size'][self.range_code(size)]
+
+    def range_code(self, size: float) -> CostStatus:
+        '''
+        size (-) - Equipment size\n
+        return (-) - Status bits (OK, SIZE_BELOW or SIZE_ABOVE)
+        '''
         if size >= self.properties.min_size and size <= self.properties.max_size:
-            return ("OK", True)
+            return OK
         elif size < self.properties.min_size:
-            return ("Warning - Below minimum size", False)
+            return SIZE_BELOW
         else:
-            return ("Warning - Above maximum size", False)
+            return SIZE_ABOVE
+
+    def check_range_many(self, size) -> np.ndarray:
+        '''
+        size (-) - Array of equipment sizes\n
+        return (-) - CostStatus bits per size (SIZE_BELOW, SIZE_ABOVE or INVALID_INPUT)
+        '''
+        size = np.asarray(size, dtype=float)
+        return size_flags(size, self.properties.min_size, self.properties.max_size)
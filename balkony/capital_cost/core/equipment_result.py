@@ -1,8 +1,53 @@
 from dataclasses import dataclass
 from typing import Tuple
+from .status import SIZE_CHECK, status_code, status_view
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, init=False)
 class EquipmentCostResult:
-    status: dict[str, Tuple[str, bool]]
+    '''
+    code is a bitfield of range warnings (see core.status) and checks names
+    the checks it covers; the human-readable status dict is derived from
+    both on access. The former status dict is still accepted in place of
+    code and checks, positionally or as status=.
+    '''
+    code: int
     value: float
-    CEPCI: float
\ No newline at end of file
+    CEPCI: float
+    checks: Tuple[str, ...] = SIZE_CHECK
+
+    def __init__(self, code: int | dict | None = None, value: float | None = None, CEPCI: float | None = None,
+                 checks: Tuple[str, ...] = SIZE_CHECK, *, status: dict[str, Tuple[str, bool]] | None = None) -> None:
+        if isinstance(code, dict):
+            code, status = None, code
+        if status is not None:
+            if code is not None:
+                raise Exception("Give either code or status")
+            code, checks = status_code(status)
+        object.__setattr__(self, 'code', code)
+        object.__setattr__(self, 'value', value)
+        object.__setattr__(self, 'CEPCI', CEPCI)
+        object.__setattr__(self, 'checks', checks)
+
+    @classmethod
+    def from_status(cls, status: dict[str, Tuple[str, bool]], value: float, CEPCI: float) -> 'EquipmentCostResult':
+        '''
+        status (-) - Human-readable status, as (message, ok) per check\n
+        value ($) - Cost\n
+        CEPCI (-) - Chemical plant cost index\n
+        return ($) - Result with the code and checks encoding status
+        '''
+        return cls(status=status, value=value, CEPCI=CEPCI)
+
+    @property
+    def status(self) -> dict[str, Tuple[str, bool]]:
+        return status_view(self.code, self.checks)
+
+    def rescale(self, new_CEPCI: float) -> 'EquipmentCostResult':
+        '''
+        new_CEPCI (-) - Chemical plant cost index to escalate to\n
+        return ($) - Same estimate at new_CEPCI, without re-evaluating the cost curve
+        '''
+        return EquipmentCostResult(code=self.code,
+                                   checks=self.checks,
+                                   CEPCI=new_CEPCI,
+                                   value=self.value*(new_CEPCI/self.CEPCI))
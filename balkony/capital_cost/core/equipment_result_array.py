@@ -0,0 +1,67 @@
+from array import array
+from typing import Iterable, Iterator
+import numpy as np
+from .equipment_result import EquipmentCostResult
+from .equipment_batch_result import EquipmentCostBatchResult
+from .status import CostStatus, SIZE_CHECK, SIZE_PRESSURE_CHECK, row_checks
+
+CHECKS: tuple[tuple[str, ...], ...] = (SIZE_CHECK, SIZE_PRESSURE_CHECK)
+
+class EquipmentCostResultArray:
+    '''
+    Append-only collection of EquipmentCostResult stored column-wise in
+    typed arrays (17 bytes per row). Rows are rebuilt as EquipmentCostResult
+    on access.
+    '''
+    __slots__ = ('_code', '_checks', '_value', '_CEPCI')
+
+    def __init__(self, results: Iterable[EquipmentCostResult] = ()) -> None:
+        self._code = array('B')
+        self._checks = array('B')
+        self._value = array('d')
+        self._CEPCI = array('d')
+        self.extend(results)
+
+    def __len__(self) -> int:
+        return len(self._value)
+
+    def __getitem__(self, index: int) -> EquipmentCostResult:
+        return EquipmentCostResult(code=CostStatus(self._code[index]),
+                                   checks=CHECKS[self._checks[index]],
+                                   CEPCI=self._CEPCI[index],
+                                   value=self._value[index])
+
+    def __iter__(self) -> Iterator[EquipmentCostResult]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def append(self, result: EquipmentCostResult) -> None:
+        self._code.append(result.code)
+        self._checks.append(CHECKS.index(result.checks))
+        self._value.append(result.value)
+        self._CEPCI.append(result.CEPCI)
+
+    def extend(self, results: Iterable[EquipmentCostResult]) -> None:
+        for result in results:
+            self.append(result)
+
+    @property
+    def value(self) -> np.ndarray:
+        return np.array(self._value, dtype=float)
+
+    @property
+    def CEPCI(self) -> np.ndarray:
+        return np.array(self._CEPCI, dtype=float)
+
+    def to_batch(self) -> EquipmentCostBatchResult:
+        '''
+        return - Columnar copy of the collection; checks only apply to the rows that performed them
+        '''
+        index = np.array(self._checks, dtype=np.intp)
+        checks, checked = row_checks({key: np.isin(index, [i for i, names in enumerate(CHECKS) if key in names])
+                                      for key in SIZE_PRESSURE_CHECK if any(key in CHECKS[i] for i in set(self._checks))})
+        return EquipmentCostBatchResult(code=np.array(self._code, dtype=np.uint8),
+                                        checks=checks,
+                                        CEPCI=self.CEPCI,
+                                        value=self.value,
+                                        checked=checked)
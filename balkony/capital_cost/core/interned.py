@@ -0,0 +1,77 @@
+import inspect
+import threading
+
+def _setattr(self, name, value) -> None:
+    if '_Interned__arguments' in vars(self):
+        raise Exception(f"{type(self).__name__} instances are shared and immutable (cannot set {name})")
+    object.__setattr__(self, name, value)
+
+def _delattr(self, name) -> None:
+    if '_Interned__arguments' in vars(self):
+        raise Exception(f"{type(self).__name__} instances are shared and immutable (cannot delete {name})")
+    object.__delattr__(self, name)
+
+def _put(cache: dict, key, value, maxsize: int) -> None:
+    cache[key] = value
+    while len(cache) > maxsize:
+        del cache[next(iter(cache))]
+
+class Interned(type):
+    '''
+    Metaclass returning one shared instance per distinct set of constructor
+    arguments. Arguments are normalized against the signature of __init__,
+    so PumpCost(t) and PumpCost(type=t, material=default) are the same
+    object. Instances are frozen once __init__ returns: setting or deleting
+    an attribute raises. At most maxsize instances (and call spellings) are
+    kept, the oldest dropped first.
+    '''
+    maxsize: int = 1024
+
+    def __init__(cls, name, bases, namespace) -> None:
+        super().__init__(name, bases, namespace)
+        cls._calls: dict[tuple, tuple] = {}
+        cls._instances: dict[tuple, object] = {}
+        cls._lock = threading.Lock()
+        cls._signature = inspect.signature(cls.__init__)
+        # __call__ takes *args, **kwargs: publish the constructor's own
+        # signature (without self) for inspect.signature and help().
+        cls.__signature__ = cls._signature.replace(parameters=list(cls._signature.parameters.values())[1:])
+        cls.__setattr__ = _setattr
+        cls.__delattr__ = _delattr
+
+    def __call__(cls, *args, **kwargs):
+        call = (args, tuple(kwargs.items()))
+        try:
+            instance = cls._instances.get(cls._calls.get(call))
+            if instance is not None:
+                return instance
+        except TypeError:
+            call = None
+        bound = cls._signature.bind(None, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(list(bound.arguments.items())[1:])
+        key = tuple(arguments.values())
+        try:
+            instance = cls._instances.get(key)
+        except TypeError:
+            key = None
+        if instance is None:
+            instance = super().__call__(*args, **kwargs)
+            object.__setattr__(instance, '_Interned__arguments', arguments)
+            if key is None:
+                return instance
+        with cls._lock:
+            # Another thread may have built the same instance meanwhile.
+            instance = cls._instances.setdefault(key, instance)
+            if call is not None:
+                _put(cls._calls, call, key, cls.maxsize)
+            while len(cls._instances) > cls.maxsize:
+                del cls._instances[next(iter(cls._instances))]
+        return instance
+
+    def arguments(cls, instance) -> dict:
+        '''
+        instance (-) - Instance of the class\n
+        return (-) - Its constructor arguments, normalized against __init__ (defaults included)
+        '''
+        return dict(vars(instance)['_Interned__arguments'])
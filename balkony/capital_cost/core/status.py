@@ -0,0 +1,121 @@
+from enum import IntFlag
+from typing import Tuple
+import numpy as np
+
+class CostStatus(IntFlag):
+    '''
+    Range check outcome of a cost estimate. Scalar results carry one value,
+    batch results an uint8 array of them.
+    '''
+    OK = 0
+    SIZE_BELOW = 1
+    SIZE_ABOVE = 2
+    PRESSURE_BELOW = 4
+    PRESSURE_ABOVE = 8
+    INVALID_INPUT = 16
+
+OK = CostStatus.OK
+SIZE_BELOW = CostStatus.SIZE_BELOW
+SIZE_ABOVE = CostStatus.SIZE_ABOVE
+PRESSURE_BELOW = CostStatus.PRESSURE_BELOW
+PRESSURE_ABOVE = CostStatus.PRESSURE_ABOVE
+INVALID_INPUT = CostStatus.INVALID_INPUT
+
+SIZE_CHECK: Tuple[str, ...] = ('size',)
+SIZE_PRESSURE_CHECK: Tuple[str, ...] = ('size', 'pressure')
+
+MASKS: dict[str, CostStatus] = {'size': SIZE_BELOW | SIZE_ABOVE,
+                                'pressure': PRESSURE_BELOW | PRESSURE_ABOVE}
+SHIFTS: dict[str, int] = {'size': 0, 'pressure': 2}
+
+MESSAGES: dict[str, dict[int, Tuple[str, bool]]] = {
+    'size': {OK: ("OK", True),
+             SIZE_BELOW: ("Warning - Below minimum size", False),
+             SIZE_ABOVE: ("Warning - Above maximum size", False)},
+    'pressure': {OK: ('OK', True),
+                 PRESSURE_BELOW: ('Warning - Lower pressure limit.', False),
+                 PRESSURE_ABOVE: ('Warning - Upper pressure limit.', False)},
+}
+INVALID_MESSAGE: Tuple[str, bool] = ('Error - Invalid input', False)
+INVALID_RANGE: int = 3
+
+def status_view(code: int, checks: Tuple[str, ...]) -> dict[str, Tuple[str, bool]]:
+    '''
+    code (-) - Status bitfield\n
+    checks (-) - Checks performed, e.g. ('size', 'pressure')\n
+    return (-) - Human-readable status, as (message, ok) per check; every check reads as invalid on invalid input
+    '''
+    if code & INVALID_INPUT:
+        return {**{key: INVALID_MESSAGE for key in checks}, 'input': INVALID_MESSAGE}
+    return {key: MESSAGES[key][code & MASKS[key]] for key in checks}
+
+def range_codes(code: np.ndarray, key: str) -> np.ndarray:
+    '''
+    code (-) - Array of status bitfields\n
+    key (-) - Check, 'size' or 'pressure'\n
+    return (-) - int8 range codes of the check (0 - OK, 1 - below range, 2 - above range, 3 - invalid input)
+    '''
+    code = np.asarray(code)
+    return np.where(code & INVALID_INPUT, np.int8(INVALID_RANGE), ((code & MASKS[key]) >> SHIFTS[key]).astype(np.int8))
+
+def status_code(status: dict[str, Tuple[str, bool]]) -> tuple[int, Tuple[str, ...]]:
+    '''
+    status (-) - Human-readable status, as (message, ok) per check (the former status dict)\n
+    return (-) - Status bitfield and the checks it covers
+    '''
+    code, checks = OK, []
+    for key, message in status.items():
+        if tuple(message) == INVALID_MESSAGE:
+            code |= INVALID_INPUT
+            if key != 'input':
+                checks.append(key)
+            continue
+        bits = [bit for bit, known in MESSAGES.get(key, {}).items() if known == tuple(message)]
+        if not bits:
+            raise Exception(f"Unknown status ({key}: {message})")
+        code |= bits[0]
+        checks.append(key)
+    return code, tuple(checks)
+
+def row_checks(rows: dict[str, np.ndarray]) -> tuple[Tuple[str, ...], dict[str, np.ndarray] | None]:
+    '''
+    rows (-) - Boolean mask of the rows each check was performed on\n
+    return (-) - Checks performed on any row, and the masks of those not performed on every row (None if all were)
+    '''
+    checks = tuple(key for key in MASKS if key in rows) or SIZE_CHECK
+    checked = {key: mask for key, mask in rows.items() if not mask.all()}
+    return checks, checked or None
+
+def flag_mask(code: np.ndarray, flag: int) -> np.ndarray:
+    '''
+    code (-) - Array of status bitfields\n
+    flag (-) - CostStatus member or combination; OK selects rows without warnings\n
+    return (-) - True where a row has any of the bits of flag
+    '''
+    code = np.asarray(code)
+    return code == 0 if flag == OK else (code & flag) != 0
+
+def count_flags(code: np.ndarray) -> dict[CostStatus, int]:
+    '''
+    code (-) - Array of status bitfields\n
+    return (-) - Number of rows carrying each flag (OK counts rows without warnings)
+    '''
+    histogram = np.bincount(np.asarray(code, dtype=np.uint8).ravel(), minlength=32)
+    codes = np.arange(len(histogram))
+    counts = {OK: int(histogram[0])}
+    for flag in CostStatus:
+        if flag != OK:
+            counts[flag] = int(histogram[(codes & flag) != 0].sum())
+    return counts
+
+def size_flags(size: np.ndarray, min_size, max_size) -> np.ndarray:
+    '''
+    size (-) - Array of equipment sizes\n
+    min_size (-) - Lower size limit, scalar or aligned with size\n
+    max_size (-) - Upper size limit, scalar or aligned with size\n
+    return (-) - uint8 CostStatus bits (SIZE_BELOW, SIZE_ABOVE, or INVALID_INPUT for non-positive or NaN sizes)
+    '''
+    code = np.where(size < min_size, np.uint8(SIZE_BELOW), np.uint8(OK))
+    code[size > max_size] = SIZE_ABOVE
+    code[~(size > 0)] = INVALID_INPUT
+    return code
@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+import numpy as np
+
+@dataclass(frozen=True)
+class Structure:
+    '''
+    Wall-thickness pressure factor of vessels and towers. The shell
+    thickness t = (P + 1) D/(2 S E - 1.2 P) + CA gives Fp = t/t_min, at least
+    1, and Fp = 1.25 under vacuum (P < -0.5 barg).
+
+    max_stress (bar) - Maximum allowable stress S\n
+    min_thickness (m) - Minimum wall thickness t_min\n
+    corrosion_allowance (m) - Corrosion allowance CA\n
+    weld_efficiency (-) - Weld efficiency E
+    '''
+    max_stress: float = 944
+    min_thickness: float = 0.0063
+    corrosion_allowance: float = 0.00315
+    weld_efficiency: float = 0.9
+
+    def pressure_factor(self, pressure: float, diameter: float) -> float:
+        '''
+        pressure (barg) - Operating pressure\n
+        diameter (m) - Diameter of vessel\n
+        return (-) - Pressure factor
+        '''
+        t = (pressure + 1)*diameter/(2*self.max_stress*self.weld_efficiency - 1.2*pressure) + self.corrosion_allowance
+        if pressure < -0.5:
+            return 1.25
+        else:
+            Fp = t/self.min_thickness
+            if Fp < 1.0:
+                return 1.0
+            return Fp
+
+    def pressure_factor_many(self, pressure, diameter) -> np.ndarray:
+        '''
+        pressure (barg) - Array of operating pressures\n
+        diameter (m) - Array of diameters, broadcast against pressure\n
+        return (-) - Pressure factors, computed with masks in a single output buffer
+        '''
+        pressure = np.asarray(pressure, dtype=float)
+        diameter = np.asarray(diameter, dtype=float)
+        Fp = np.asarray(np.multiply(pressure + 1, diameter))
+        Fp /= 2*self.max_stress*self.weld_efficiency - 1.2*pressure
+        Fp += self.corrosion_allowance
+        Fp /= self.min_thickness
+        np.maximum(Fp, 1.0, out=Fp)
+        np.copyto(Fp, 1.25, where=pressure < -0.5)
+        return Fp
+
+    def pressure_factor_derivative(self, pressure: float, diameter: float) -> tuple[float, float]:
+        '''
+        pressure (barg) - Operating pressure\n
+        diameter (m) - Diameter of vessel\n
+        return (1/barg, 1/m) - Derivatives of the pressure factor with respect to pressure and diameter
+        '''
+        stress = 2*self.max_stress*self.weld_efficiency - 1.2*pressure
+        t = (pressure + 1)*diameter/stress + self.corrosion_allowance
+        if pressure < -0.5 or t/self.min_thickness < 1.0:
+            return 0.0, 0.0
+        return diameter*(stress + 1.2*(pressure + 1))/(stress**2*self.min_thickness), (pressure + 1)/(stress*self.min_thickness)
+
+    def pressure_factor_derivative_many(self, pressure, diameter) -> tuple[np.ndarray, np.ndarray]:
+        pressure = np.asarray(pressure, dtype=float)
+        diameter = np.asarray(diameter, dtype=float)
+        stress = 2*self.max_stress*self.weld_efficiency - 1.2*pressure
+        t = (pressure + 1)*diameter/stress + self.corrosion_allowance
+        flat = (pressure < -0.5) | (t/self.min_thickness < 1.0)
+        return (np.where(flat, 0.0, diameter*(stress + 1.2*(pressure + 1))/(stress**2*self.min_thickness)),
+                np.where(flat, 0.0, (pressure + 1)/(stress*self.min_thickness)))
+
+    def breakpoints(self, pressure, diameter) -> dict[str, tuple]:
+        '''
+        pressure (barg) - Operating pressure, scalar or array\n
+        diameter (m) - Diameter of vessel, scalar or array\n
+        return (-) - Where the factor switches formula: the vacuum limit and the minimum thickness pressure
+        for the given diameter, and the minimum thickness diameter for the given pressure (NaN under vacuum)
+        '''
+        pressure = np.asarray(pressure, dtype=float)
+        diameter = np.asarray(diameter, dtype=float)
+        thickness = self.min_thickness - self.corrosion_allowance
+        stress = 2*self.max_stress*self.weld_efficiency
+        with np.errstate(divide='ignore', invalid='ignore'):
+            clamp_pressure = (thickness*stress - diameter)/(diameter + 1.2*thickness)
+            clamp_diameter = np.where(pressure < -0.5, np.nan, thickness*(stress - 1.2*pressure)/(pressure + 1))
+        return {'pressure': (-0.5, clamp_pressure), 'diameter': (clamp_diameter,)}
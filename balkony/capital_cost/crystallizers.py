@@ -1,7 +1,7 @@
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
 
-class CrystallizerCost:
+class CrystallizerCost(metaclass=Interned):
     class Type(Enum):
         Batch = {'min_size':  1.5, 'max_size': 30.0, 'data': (4.5097, 0.1731, 0.1344), 'unit':'m3', 'Fbare': 1.60}
 
@@ -12,6 +12,14 @@ class CrystallizerCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
     def purchased(self, volume: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             volume (m3) - Volume of crystallizer\n
@@ -28,6 +36,26 @@ class CrystallizerCost:
         """
         FBM= self._type.value['Fbare']
         cp0 = self._equipment.cost(volume, CEPCI)
-        return EquipmentCostResult(status= cp0.status,
+        return EquipmentCostResult(code= cp0.code,
                                    CEPCI= CEPCI,
-                                   value= cp0.value*FBM)
\ No newline at end of file
+                                   value= cp0.value*FBM)
+
+    def purchased_many(self, volume, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            volume (m3) - Volume of crystallizer\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(volume, CEPCI)
+
+    def bare_module_many(self, volume, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            volume (m3) - Volume of crystallizer\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM= self._type.value['Fbare']
+        cp0 = self._equipment.cost_many(volume, CEPCI)
+        return EquipmentCostBatchResult(code= cp0.code,
+                                        CEPCI= cp0.CEPCI,
+                                        value= cp0.value*FBM)
@@ -0,0 +1,78 @@
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+import numpy as np
+
+@dataclass(frozen=True)
+class Fixed:
+    value: float
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        return np.full(n, float(self.value))
+
+    def ppf(self, q: float) -> float:
+        return float(self.value)
+
+@dataclass(frozen=True)
+class Normal:
+    mean: float
+    std: float
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        return rng.normal(self.mean, self.std, n)
+
+    def ppf(self, q: float) -> float:
+        return NormalDist(self.mean, self.std).inv_cdf(q) if self.std > 0 else float(self.mean)
+
+@dataclass(frozen=True)
+class LogNormal:
+    '''
+    median (-) - Median of the variable\n
+    sigma (-) - Standard deviation of its natural logarithm
+    '''
+    median: float
+    sigma: float
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        return rng.lognormal(math.log(self.median), self.sigma, n)
+
+    def ppf(self, q: float) -> float:
+        return self.median*math.exp(self.sigma*NormalDist().inv_cdf(q)) if self.sigma > 0 else float(self.median)
+
+@dataclass(frozen=True)
+class Uniform:
+    low: float
+    high: float
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        return rng.uniform(self.low, self.high, n)
+
+    def ppf(self, q: float) -> float:
+        return self.low + q*(self.high - self.low)
+
+@dataclass(frozen=True)
+class Triangular:
+    low: float
+    mode: float
+    high: float
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        return rng.triangular(self.low, self.mode, self.high, n)
+
+    def ppf(self, q: float) -> float:
+        width = self.high - self.low
+        if width == 0:
+            return float(self.mode)
+        split = (self.mode - self.low)/width
+        if q < split:
+            return self.low + math.sqrt(q*width*(self.mode - self.low))
+        return self.high - math.sqrt((1 - q)*width*(self.high - self.mode))
+
+Distribution = Fixed | Normal | LogNormal | Uniform | Triangular
+
+def as_distribution(value) -> Distribution:
+    '''
+    value (-) - Distribution, or a number taken as Fixed\n
+    return (-) - Distribution of the input
+    '''
+    return value if hasattr(value, 'sample') else Fixed(value)
@@ -1,7 +1,7 @@
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
 
-class DriveCost:
+class DriveCost(metaclass=Interned):
     class Type(Enum):
         GasTurbine = { 'min_size': 7500.0, 'max_size': 23000.0, 'data': (-21.7702, 13.2175, -1.5279), 'unit':'kW', 'Fbare': 3.51 }
         InternalCombustion = { 'min_size': 10.0, 'max_size': 10000.0, 'data': (2.7635, 0.8574, -0.0098), 'unit':'kW', 'Fbare': 2.02 }
@@ -17,6 +17,14 @@ class DriveCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
     def purchased(self, power: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             power (kW) - Power of drive\n
@@ -33,6 +41,26 @@ class DriveCost:
         """
         FBM = self._type.value['Fbare']
         cp0 = self._equipment.cost(power, CEPCI)
-        return EquipmentCostResult(status= cp0.status,
+        return EquipmentCostResult(code= cp0.code,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM)
+
+    def purchased_many(self, power, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            power (kW) - Power of drive\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(power, CEPCI)
+
+    def bare_module_many(self, power, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            power (kW) - Power of drive\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM = self._type.value['Fbare']
+        cp0 = self._equipment.cost_many(power, CEPCI)
+        return EquipmentCostBatchResult(code= cp0.code,
+                                        CEPCI= cp0.CEPCI,
+                                        value= cp0.value*FBM)
@@ -1,7 +1,7 @@
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
 
-class DustCollectorCost:
+class DustCollectorCost(metaclass=Interned):
     class Type(Enum):
         Baghouse = { 'min_size': 0.08, 'max_size': 350.0, 'data': (4.5007, 0.4182, 0.0813), 'unit':'m3', 'Fbare': 2.86}
         CycloneScrubbers =  { 'min_size': 0.06, 'max_size': 200.0, 'data': (3.6298, 0.5009, 0.0411), 'unit':'m3', 'Fbare': 2.86 }
@@ -15,6 +15,14 @@ class DustCollectorCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
     def purchased(self, volume: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             volume (m3) - Volume of dust collectors\n
@@ -31,6 +39,26 @@ class DustCollectorCost:
         """
         FBM= self._type.value['Fbare']
         cp0 = self._equipment.cost(volume, CEPCI)
-        return EquipmentCostResult(status= cp0.status,
+        return EquipmentCostResult(code= cp0.code,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM)
+
+    def purchased_many(self, volume, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            volume (m3) - Volume of dust collectors\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(volume, CEPCI)
+
+    def bare_module_many(self, volume, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            volume (m3) - Volume of dust collectors\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM= self._type.value['Fbare']
+        cp0 = self._equipment.cost_many(volume, CEPCI)
+        return EquipmentCostBatchResult(code= cp0.code,
+                                        CEPCI= cp0.CEPCI,
+                                        value= cp0.value*FBM)
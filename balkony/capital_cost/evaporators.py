@@ -1,8 +1,10 @@
+import numpy as np
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
+from .core.status import SIZE_PRESSURE_CHECK
 from .pressure import EvaporatorPressure
 
-class EvaporatorCost:
+class EvaporatorCost(metaclass=Interned):
     class Material(Enum):
         CarbonSteel = {'ForcedCirculation': 2.93, 'FallingFilm': 2.23, 'AgitatedFilm': 2.23, 'ShortTube': 2.93, 'LongTube': 2.93}
         CuAlloy = {'ForcedCirculation': 3.68, 'FallingFilm': 2.8, 'AgitatedFilm': 2.8, 'ShortTube': 3.68, 'LongTube': 3.68}
@@ -27,6 +29,22 @@ class EvaporatorCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
+    @property
+    def material(self) -> Material:
+        return self._material
+
+    @property
+    def pressure(self) -> EvaporatorPressure:
+        return self._pressure
+
     def purchased(self, area: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             area (m2) - Area of evaporator\n
@@ -45,6 +63,29 @@ class EvaporatorCost:
         FBM = self._material.value[self._type.name]
         Fp = self._pressure.factor(pressure)
         cp0 = self._equipment.cost(area, CEPCI)
-        return EquipmentCostResult(status= {'size': cp0.status['size'], 'pressure': Fp.status},
+        return EquipmentCostResult(code= cp0.code | Fp.code, checks= SIZE_PRESSURE_CHECK,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM*Fp.value)
+
+    def purchased_many(self, area, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            area (m2) - Area of evaporator\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(area, CEPCI)
+
+    def bare_module_many(self, area, pressure, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            area (m2) - Area of evaporator\n
+            pressure (barg) - Operating pressure\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM = self._material.value[self._type.name]
+        Fp = self._pressure.factor_many(pressure)
+        cp0 = self._equipment.cost_many(area, CEPCI)
+        value = cp0.value*FBM*Fp.value
+        return EquipmentCostBatchResult(code= np.broadcast_to(cp0.code | Fp.code, value.shape), checks= SIZE_PRESSURE_CHECK,
+                                        CEPCI= cp0.CEPCI,
+                                        value= value)
@@ -1,8 +1,10 @@
+import numpy as np
 from enum import Enum
 from .pressure import FanPressure
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
+from .core.status import SIZE_PRESSURE_CHECK
 
-class FanCost:
+class FanCost(metaclass=Interned):
     class Material(Enum):
         CarbonSteel = {'CentrifugalRadial': 2.74, 'BackwardCurve': 2.74, 'AxialVane': 2.74, 'AxialTube': 2.74}
         Fiberglass = {'CentrifugalRadial': 5.03, 'BackwardCurve': 5.03, 'AxialVane': 5.03, 'AxialTube': 5.03}
@@ -25,6 +27,22 @@ class FanCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
+    @property
+    def material(self) -> Material:
+        return self._material
+
+    @property
+    def pressure(self) -> FanPressure:
+        return self._pressure
+
     def purchased(self, flowrate: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             flowrate (m3/s) - Gas flowrate of fans\n
@@ -43,6 +61,29 @@ class FanCost:
         FBM = self._material.value[self._type.name]
         Fp = self._pressure.factor(rise_pressure)
         cp0 = self._equipment.cost(flowrate, CEPCI)
-        return EquipmentCostResult(status= {'size': cp0.status['size'], 'pressure': Fp.status},
+        return EquipmentCostResult(code= cp0.code | Fp.code, checks= SIZE_PRESSURE_CHECK,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM*Fp.value)
+
+    def purchased_many(self, flowrate, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            flowrate (m3/s) - Gas flowrate of fans\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(flowrate, CEPCI)
+
+    def bare_module_many(self, flowrate, rise_pressure, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            flowrate (m3/s) - Gas flowrate of fans\n
+            rise pressure (kPa) - Rise pressure\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM = self._material.value[self._type.name]
+        Fp = self._pressure.factor_many(rise_pressure)
+        cp0 = self._equipment.cost_many(flowrate, CEPCI)
+        value = cp0.value*FBM*Fp.value
+        return EquipmentCostBatchResult(code= np.broadcast_to(cp0.code | Fp.code, value.shape), checks= SIZE_PRESSURE_CHECK,
+                                        CEPCI= cp0.CEPCI,
+                                        value= value)
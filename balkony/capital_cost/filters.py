@@ -1,7 +1,7 @@
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
 
-class FilterCost:
+class FilterCost(metaclass=Interned):
     class Type(Enum):
         Bent = { 'min_size': 0.9, 'max_size': 115.0, 'data': (5.1055, 0.4999, 0.0001), 'unit':'m2', 'Fbare': 1.65 }
         Cartridge = { 'min_size': 15.0, 'max_size': 200.0, 'data': (3.2107, 0.7597, 0.0027), 'unit':'m2', 'Fbare': 1.65 }
@@ -22,6 +22,14 @@ class FilterCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
     def purchased(self, area: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             area (m2) - Area of filter\n
@@ -38,6 +46,26 @@ class FilterCost:
         """
         FBM= self._type.value['Fbare']
         cp0 = self._equipment.cost(area, CEPCI)
-        return EquipmentCostResult(status= cp0.status,
+        return EquipmentCostResult(code= cp0.code,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM)
+
+    def purchased_many(self, area, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            area (m2) - Area of filter\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(area, CEPCI)
+
+    def bare_module_many(self, area, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            area (m2) - Area of filter\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM= self._type.value['Fbare']
+        cp0 = self._equipment.cost_many(area, CEPCI)
+        return EquipmentCostBatchResult(code= cp0.code,
+                                        CEPCI= cp0.CEPCI,
+                                        value= cp0.value*FBM)
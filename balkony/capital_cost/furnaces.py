@@ -1,8 +1,10 @@
+import numpy as np
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
+from .core.status import SIZE_PRESSURE_CHECK
 from .pressure import FurnacePressure
 
-class FurnanceCost:
+class FurnanceCost(metaclass=Interned):
     class Material(Enum):
         CarbonSteel = {'ReformerFurnace': 2.14, 'PyrolysisFurnace': 2.14, 'NonreactiveFiredHeater': 2.19}
         StainlessSteel = {'ReformerFurnace': 2.54, 'PyrolysisFurnace': 2.54, 'NonreactiveFiredHeater': 2.19}
@@ -23,6 +25,22 @@ class FurnanceCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
+    @property
+    def material(self) -> Material:
+        return self._material
+
+    @property
+    def pressure(self) -> FurnacePressure:
+        return self._pressure
+
     def purchased(self, duty: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             duty (kW) - Duty of furnace\n
@@ -43,6 +61,32 @@ class FurnanceCost:
         Ft = 1 + 0.00184*deltaTemp - 0.00000335*(deltaTemp**2)
         Fp = self._pressure.factor(pressure)
         cp0 = self._equipment.cost(duty, CEPCI)
-        return EquipmentCostResult(status= {'size': cp0.status['size'], 'pressure': Fp.status},
+        return EquipmentCostResult(code= cp0.code | Fp.code, checks= SIZE_PRESSURE_CHECK,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM*Fp.value*Ft)
+
+    def purchased_many(self, duty, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            duty (kW) - Duty of furnace\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(duty, CEPCI)
+
+    def bare_module_many(self, duty, pressure, deltaTemp = 0, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            duty (kW) - Duty of furnace\n
+            pressure (barg) - Operating pressure\n
+            deltaTemp (°C) - Amount of superheat
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM = self._material.value[self._type.name]
+        deltaTemp = np.asarray(deltaTemp, dtype=float)
+        Ft = 1 + 0.00184*deltaTemp - 0.00000335*(deltaTemp**2)
+        Fp = self._pressure.factor_many(pressure)
+        cp0 = self._equipment.cost_many(duty, CEPCI)
+        value = cp0.value*FBM*Fp.value*Ft
+        return EquipmentCostBatchResult(code= np.broadcast_to(cp0.code | Fp.code, value.shape), checks= SIZE_PRESSURE_CHECK,
+                                        CEPCI= cp0.CEPCI,
+                                        value= value)
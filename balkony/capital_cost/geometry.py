@@ -0,0 +1,114 @@
+import math
+from dataclasses import dataclass
+from enum import Enum
+import numpy as np
+from .core import EquipmentCostBatchResult, EquipmentCostResult, Structure
+from .core.status import SIZE_CHECK
+from .vessels import VesselCost
+
+RATIO: tuple[float, float] = (2.5, 5.0)
+
+@dataclass(frozen=True)
+class VesselDesign:
+    '''
+    Cylinder of the given volume with the lowest bare module cost. result
+    holds that cost.
+    '''
+    diameter: float
+    length: float
+    result: EquipmentCostResult
+
+    @property
+    def ratio(self) -> float:
+        return self.length/self.diameter
+
+@dataclass(frozen=True)
+class VesselDesignBatch:
+    '''
+    Columnar counterpart of VesselDesign.
+    '''
+    diameter: np.ndarray
+    length: np.ndarray
+    result: EquipmentCostBatchResult
+
+    def __len__(self) -> int:
+        return len(self.diameter)
+
+    @property
+    def ratio(self) -> np.ndarray:
+        return self.length/self.diameter
+
+    def design(self, index: int) -> VesselDesign:
+        '''
+        index (-) - Row of the batch\n
+        return - Scalar design of the row
+        '''
+        return VesselDesign(diameter=float(self.diameter[index]), length=float(self.length[index]), result=self.result.result(index))
+
+def _members(enum: type, value, rows: int) -> list[Enum]:
+    values = [value]*rows if isinstance(value, (Enum, str)) else list(value)
+    if len(values) != rows:
+        raise Exception(f"Expected {rows} {enum.__qualname__} values ({len(values)})")
+    return [enum[item] if isinstance(item, str) else item for item in values]
+
+def optimize_vessel_many(volume, pressure, type: VesselCost.Type | list = VesselCost.Type.Vertical,
+                         material: VesselCost.Material | list = VesselCost.Material.CarbonSteel,
+                         ratio: tuple[float, float] = RATIO, struct: Structure = Structure(),
+                         CEPCI: float = 397) -> VesselDesignBatch:
+    '''
+    volume (m3) - Array of required volumes\n
+    pressure (barg) - Operating pressures, scalar or array aligned with volume\n
+    type (-) - VesselCost.Type, or one per row\n
+    material (-) - VesselCost.Material (or its name), or one per row\n
+    ratio (-) - Lowest and highest allowed length to diameter ratio\n
+    struct (-) - Wall structure of the vessels\n
+    CEPCI (-) - Chemical plant cost index\n
+    return ($) - Diameter and length of each vessel with their bare module cost. Volumes outside the
+    min_size/max_size range keep their SIZE_BELOW/SIZE_ABOVE flags
+    '''
+    low, high = ratio
+    if not 0 < low <= high:
+        raise Exception(f"Invalid L/D bounds ({low}, {high})")
+    volume = np.atleast_1d(np.asarray(volume, dtype=float))
+    pressure = np.broadcast_to(np.asarray(pressure, dtype=float), volume.shape)
+    # The volume fixes Cp0 and Fp grows with the diameter, so the slimmest
+    # vessel is the cheapest. Where Fp sits at its floor (minimum thickness,
+    # or vacuum) cost ties over a range of diameters, and the stubbiest of
+    # them is kept.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slim = np.cbrt(4*volume/(math.pi*high))
+        stubby = np.cbrt(4*volume/(math.pi*low))
+        floor = struct.breakpoints(pressure, 1.0)['diameter'][0]
+        diameter = np.where(pressure < -0.5, stubby, np.where(slim <= floor, np.minimum(floor, stubby), slim))
+        length = 4*volume/(math.pi*diameter**2)
+
+    types = _members(VesselCost.Type, type, len(volume))
+    materials = _members(VesselCost.Material, material, len(volume))
+    value = np.empty(volume.shape)
+    code = np.empty(volume.shape, dtype=np.uint8)
+    groups: dict[tuple[Enum, Enum], list[int]] = {}
+    for row, key in enumerate(zip(types, materials)):
+        groups.setdefault(key, []).append(row)
+    checks = SIZE_CHECK
+    for (type, material), rows in groups.items():
+        rows = np.array(rows, dtype=np.intp)
+        result = VesselCost(type, material, struct).bare_module_many(volume[rows], pressure[rows], diameter[rows], CEPCI)
+        value[rows], code[rows], checks = result.value, result.code, result.checks
+    return VesselDesignBatch(diameter=diameter,
+                             length=length,
+                             result=EquipmentCostBatchResult(code=code, checks=checks, CEPCI=np.asarray(float(CEPCI)), value=value))
+
+def optimize_vessel(volume: float, pressure: float, type: VesselCost.Type = VesselCost.Type.Vertical,
+                    material: VesselCost.Material = VesselCost.Material.CarbonSteel,
+                    ratio: tuple[float, float] = RATIO, struct: Structure = Structure(), CEPCI: float = 397) -> VesselDesign:
+    '''
+    volume (m3) - Required volume\n
+    pressure (barg) - Operating pressure\n
+    type (-) - VesselCost.Type\n
+    material (-) - VesselCost.Material\n
+    ratio (-) - Lowest and highest allowed length to diameter ratio\n
+    struct (-) - Wall structure of the vessel\n
+    CEPCI (-) - Chemical plant cost index\n
+    return ($) - Diameter and length of the vessel with its bare module cost
+    '''
+    return optimize_vessel_many([volume], pressure, type, material, ratio, struct, CEPCI).design(0)
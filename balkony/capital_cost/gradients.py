@@ -0,0 +1,126 @@
+import inspect
+from dataclasses import dataclass
+import numpy as np
+from .core import EquipmentCostBatchResult, EquipmentCostResult
+
+TRAY_BREAKPOINTS: tuple[float, ...] = (20.0,)
+
+@dataclass(frozen=True)
+class CostGradient:
+    '''
+    Cost and its exact partial derivatives with respect to each input but
+    CEPCI. breakpoints lists, per input, the values where the cost formula
+    switches piece: there the derivative is the one of the piece used by the
+    cost itself, and it may jump on the other side.
+    '''
+    result: EquipmentCostResult
+    partials: dict[str, float]
+    breakpoints: dict[str, tuple[float, ...]]
+
+    @property
+    def value(self) -> float:
+        return self.result.value
+
+@dataclass(frozen=True)
+class CostGradientBatch:
+    '''
+    Columnar counterpart of CostGradient. Each breakpoints array has one row
+    of breakpoints per cost row, as some depend on the other inputs (e.g.
+    the minimum thickness pressure of a vessel depends on its diameter).
+    '''
+    result: EquipmentCostBatchResult
+    partials: dict[str, np.ndarray]
+    breakpoints: dict[str, np.ndarray]
+
+    @property
+    def value(self) -> np.ndarray:
+        return self.result.value
+
+def _points(points, shape: tuple[int, ...], many: bool):
+    if not many:
+        return tuple(float(point) for point in points)
+    if not points:
+        return np.zeros(shape + (0,))
+    return np.stack([np.broadcast_to(np.asarray(point, dtype=float), shape) for point in points], axis=-1)
+
+def _gradient(estimator, method: str, inputs: dict, many: bool):
+    if method not in ('purchased', 'bare_module'):
+        raise Exception(f"Invalid method ({method})")
+    suffix = '_many' if many else ''
+    names = list(inspect.signature(getattr(estimator, method)).parameters)
+    if 'size' in inputs:
+        inputs[names[0]] = inputs.pop('size')
+    try:
+        arguments = inspect.signature(getattr(estimator, method)).bind(**inputs)
+    except TypeError as error:
+        raise Exception(f"Invalid inputs for {type(estimator).__name__}.{method} ({error})")
+    arguments.apply_defaults()
+    args = arguments.arguments
+    cost = getattr(estimator, method + suffix)
+    result = cost(**args)
+    value = result.value
+    shape = np.shape(value)
+
+    equipment = estimator.equipment
+    size, CEPCI = args[names[0]], args['CEPCI']
+    cp0 = getattr(equipment, 'cost' + suffix)(size, CEPCI).value
+    partials = {names[0]: value/cp0*getattr(equipment, 'derivative' + suffix)(size, CEPCI)}
+    breakpoints = {names[0]: ()}
+
+    if 'num_trays' in args:
+        num_trays = args['num_trays']
+        if method == 'purchased':
+            partials['num_trays'] = cp0
+        else:
+            FBM = estimator.material.value[estimator.type.name]
+            slope = estimator.quantity_factor_derivative(num_trays)
+            partials['num_trays'] = value/num_trays + cp0*FBM*num_trays*(slope if many else float(slope))
+        breakpoints['num_trays'] = TRAY_BREAKPOINTS
+    if 'diameter' in args and names[0] != 'diameter' and hasattr(estimator, 'structure'):
+        structure = estimator.structure
+        pressure, diameter = args['pressure'], args['diameter']
+        Fp = getattr(structure, 'pressure_factor' + suffix)(pressure, diameter)
+        dFp = getattr(structure, 'pressure_factor_derivative' + suffix)(pressure, diameter)
+        scale = (value - estimator.type.value['B1']*cp0)/Fp
+        partials['pressure'], partials['diameter'] = scale*dFp[0], scale*dFp[1]
+        breakpoints.update(structure.breakpoints(pressure, diameter))
+    elif hasattr(estimator, 'pressure') and method == 'bare_module':
+        key = next(name for name in names if name in ('pressure', 'rise_pressure'))
+        factor = estimator.pressure
+        Fp = getattr(factor, 'factor' + suffix)(args[key]).value
+        offset = estimator.type.value['B1']*cp0 if 'B1' in estimator.type.value else 0.0
+        partials[key] = (value - offset)/Fp*getattr(factor, 'derivative' + suffix)(args[key])
+        breakpoints[key] = factor.breakpoints
+    if 'deltaTemp' in args:
+        # The cost at no superheat (Ft = 1) is the cost without Ft, which
+        # avoids dividing by Ft where it vanishes.
+        deltaTemp = np.asarray(args['deltaTemp'], dtype=float) if many else args['deltaTemp']
+        rest = cost(**{**args, 'deltaTemp': 0}).value
+        partials['deltaTemp'] = rest*(0.00184 - 2*0.00000335*deltaTemp)
+        breakpoints['deltaTemp'] = ()
+
+    if not many:
+        return CostGradient(result=result,
+                            partials={key: float(partial) for key, partial in partials.items()},
+                            breakpoints={key: _points(points, shape, many) for key, points in breakpoints.items()})
+    return CostGradientBatch(result=result,
+                             partials={key: np.broadcast_to(partial, shape) for key, partial in partials.items()},
+                             breakpoints={key: _points(points, shape, many) for key, points in breakpoints.items()})
+
+def gradient(estimator, method: str = 'bare_module', **inputs) -> CostGradient:
+    '''
+    estimator (-) - Equipment cost object, e.g. PumpCost(PumpCost.Type.Centrifugal)\n
+    method (-) - 'purchased' or 'bare_module'\n
+    inputs (-) - Arguments of the cost method ('size' stands for the first one)\n
+    return ($) - Cost with its partial derivatives (in $ per unit of each input) and breakpoints
+    '''
+    return _gradient(estimator, method, inputs, many=False)
+
+def gradient_many(estimator, method: str = 'bare_module', **inputs) -> CostGradientBatch:
+    '''
+    estimator (-) - Equipment cost object, e.g. PumpCost(PumpCost.Type.Centrifugal)\n
+    method (-) - 'purchased' or 'bare_module'\n
+    inputs (-) - Arguments of the *_many cost method, scalars or arrays ('size' stands for the first one)\n
+    return ($) - Costs with their partial derivatives and breakpoints for each row
+    '''
+    return _gradient(estimator, method, inputs, many=True)
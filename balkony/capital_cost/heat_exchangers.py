@@ -1,8 +1,10 @@
+import numpy as np
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
+from .core.status import SIZE_PRESSURE_CHECK
 from .pressure import HeatExchangerPressure
 
-class HeatExchangerCost:
+class HeatExchangerCost(metaclass=Interned):
     class Material(Enum):
         CarbonSteel = {'DoublePipe': 1.0, 'MultiplePipe': 1.0, 'FixedTube': 1.0, 'FloatingHead': 1.0, 'UTube': 1.0, 'Bayonet': 1.0, 'KettleReboiler': 1.0, 'ScrapedWall': 1.0, 'SpiralTube': 1.0,
                        'AirCooler': 1.0, 'FlatPlate': 1.0, 'SpiralPlate': 1.0, 'TeflonTube': 1.0}
@@ -49,6 +51,22 @@ class HeatExchangerCost:
                                                                 min_size=type.value['min_size'],
                                                                 max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
+    @property
+    def material(self) -> Material:
+        return self._material
+
+    @property
+    def pressure(self) -> HeatExchangerPressure:
+        return self._pressure
+
     def purchased(self, area: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             area (m2) - area of heat exchanger\n
@@ -69,6 +87,31 @@ class HeatExchangerCost:
         B1 = self._type.value['B1']
         B2 = self._type.value['B1']
         cp0 = self._equipment.cost(area, CEPCI)
-        return EquipmentCostResult(status= {'size': cp0.status['size'], 'pressure': Fp.status},
+        return EquipmentCostResult(code= cp0.code | Fp.code, checks= SIZE_PRESSURE_CHECK,
                                    CEPCI= CEPCI,
                                    value= cp0.value*(B1 + B2*Fm*Fp.value))
+
+    def purchased_many(self, area, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            area (m2) - area of heat exchanger\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(area, CEPCI)
+
+    def bare_module_many(self, area, pressure, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            area (m2) - area of heat exchanger\n
+            pressure (barg) - Operating pressure\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        Fm = self._material.value[self._type.name]
+        Fp = self._pressure.factor_many(pressure)
+        B1 = self._type.value['B1']
+        B2 = self._type.value['B1']
+        cp0 = self._equipment.cost_many(area, CEPCI)
+        value = cp0.value*(B1 + B2*Fm*Fp.value)
+        return EquipmentCostBatchResult(code= np.broadcast_to(cp0.code | Fp.code, value.shape), checks= SIZE_PRESSURE_CHECK,
+                                        CEPCI= cp0.CEPCI,
+                                        value= value)
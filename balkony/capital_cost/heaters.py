@@ -1,8 +1,10 @@
+import numpy as np
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
+from .core.status import SIZE_PRESSURE_CHECK
 from .pressure import HeaterPressure
 
-class HeaterCost:
+class HeaterCost(metaclass=Interned):
     class Type(Enum):
         Diphenyl = { 'min_size': 650.0, 'max_size': 10750.0, 'data': (2.2628, 0.8581, 0.0003), 'unit': 'kW', 'Fbare': 2.19}
         MoltenSalt = { 'min_size': 650.0, 'max_size': 10750.0, 'data': (1.1979, 1.4782, -0.0958), 'unit': 'kW', 'Fbare': 2.19}
@@ -17,6 +19,18 @@ class HeaterCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
+    @property
+    def pressure(self) -> HeaterPressure:
+        return self._pressure
+
     def purchased(self, duty: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             duty (kW) - Duty of heater\n
@@ -37,6 +51,32 @@ class HeaterCost:
         Ft = 1 + 0.00184*deltaTemp - 0.00000335*(deltaTemp**2)
         Fp = self._pressure.factor(pressure)
         cp0 = self._equipment.cost(duty, CEPCI)
-        return EquipmentCostResult(status= {'size': cp0.status['size'], 'pressure': Fp.status},
+        return EquipmentCostResult(code= cp0.code | Fp.code, checks= SIZE_PRESSURE_CHECK,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM*Fp.value*Ft)
+
+    def purchased_many(self, duty, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            duty (kW) - Duty of heater\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(duty, CEPCI)
+
+    def bare_module_many(self, duty, pressure, deltaTemp = 0, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            duty (kW) - Duty of heater\n
+            pressure (barg) - Operating pressure\n
+            deltaTemp (°C) - Amount of superheat
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM = self._type.value['Fbare']
+        deltaTemp = np.asarray(deltaTemp, dtype=float)
+        Ft = 1 + 0.00184*deltaTemp - 0.00000335*(deltaTemp**2)
+        Fp = self._pressure.factor_many(pressure)
+        cp0 = self._equipment.cost_many(duty, CEPCI)
+        value = cp0.value*FBM*Fp.value*Ft
+        return EquipmentCostBatchResult(code= np.broadcast_to(cp0.code | Fp.code, value.shape), checks= SIZE_PRESSURE_CHECK,
+                                        CEPCI= cp0.CEPCI,
+                                        value= value)
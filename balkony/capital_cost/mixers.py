@@ -1,7 +1,7 @@
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
 
-class MixerCost:
+class MixerCost(metaclass=Interned):
     class Type(Enum):
         Impeller = { 'min_size': 5.0, 'max_size': 150.0, 'data': (3.8511, 0.7009, -0.0003), 'unit':'kW', 'Fbare': 1.38 }
         Propeller = { 'min_size': 5.0, 'max_size': 500.0, 'data': (4.3207, 0.0359, 0.1346), 'unit':'kW', 'Fbare': 1.38 }
@@ -14,6 +14,14 @@ class MixerCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
     def purchased(self, power: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             power (kW) - Power of mixer\n
@@ -30,6 +38,26 @@ class MixerCost:
         """
         FBM= self._type.value['Fbare']
         cp0 = self._equipment.cost(power, CEPCI)
-        return EquipmentCostResult(status= cp0.status,
+        return EquipmentCostResult(code= cp0.code,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM)
+
+    def purchased_many(self, power, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            power (kW) - Power of mixer\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(power, CEPCI)
+
+    def bare_module_many(self, power, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            power (kW) - Power of mixer\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM= self._type.value['Fbare']
+        cp0 = self._equipment.cost_many(power, CEPCI)
+        return EquipmentCostBatchResult(code= cp0.code,
+                                        CEPCI= cp0.CEPCI,
+                                        value= cp0.value*FBM)
@@ -0,0 +1,196 @@
+import inspect
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+import numpy as np
+from .core import CostStatus, EquipmentCostBatchResult
+from .distributions import Distribution, as_distribution
+from .statistics import MomentAccumulator, QuantileAccumulator
+
+COEFFICIENTS: tuple[str, ...] = ('K1', 'K2', 'K3')
+
+class CostSummary(NamedTuple):
+    count: int
+    mean: float
+    std: float
+    min: float
+    max: float
+    p10: float
+    p50: float
+    p90: float
+
+def _summary(moments: MomentAccumulator, quantiles: QuantileAccumulator) -> CostSummary:
+    return CostSummary(moments.count, moments.mean if moments.count else math.nan, moments.std, moments.min, moments.max,
+                       *quantiles.quantiles((0.1, 0.5, 0.9)))
+
+@dataclass(frozen=True)
+class MonteCarloItem:
+    name: str
+    estimator: Any
+    inputs: dict[str, Distribution]
+    coefficients: dict[str, Distribution]
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    '''
+    Summary of a run. Statistics skip samples with a NaN cost (flagged
+    INVALID_INPUT), so a total sample is dropped when any of its items is.
+    Quantiles are within the relative accuracy of the model.
+    '''
+    samples: int
+    total: CostSummary
+    items: dict[str, CostSummary]
+    flags: dict[str, dict[CostStatus, int]]
+
+class MonteCarlo:
+    '''
+    Cost uncertainty by Monte Carlo sampling. Samples are drawn and costed in
+    blocks of block_size rows with one *_many call per item and block; only
+    running statistics are kept between blocks.
+
+    Block i draws from its own generator seeded by SeedSequence(seed,
+    spawn_key=(i,)), so any block can be reproduced on its own.
+    '''
+    def __init__(self, seed: int = 0, block_size: int = 10_000, method: str = 'bare_module',
+                 relative_accuracy: float = 0.001) -> None:
+        if method not in ('purchased', 'bare_module'):
+            raise Exception(f"Invalid method ({method})")
+        if block_size <= 0:
+            raise Exception(f"Block size must be positive ({block_size})")
+        self._seed, self._block_size, self._method = seed, block_size, method
+        self._relative_accuracy = relative_accuracy
+        self._items: dict[str, MonteCarloItem] = {}
+
+    @property
+    def items(self) -> dict[str, MonteCarloItem]:
+        return dict(self._items)
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    def add(self, name: str, estimator, coefficients: dict[str, Distribution] | None = None, **inputs) -> None:
+        '''
+        name (-) - Unique item name\n
+        estimator (-) - Equipment cost object, e.g. PumpCost(PumpCost.Type.Centrifugal)\n
+        coefficients (-) - Additive perturbations of K1, K2 and K3, applied as the factor 10^(dK1 + dK2*L + dK3*L^2)\n
+        inputs (-) - Distribution or number per argument of the cost method ('size' stands for the first one)
+        '''
+        if name in self._items:
+            raise Exception(f"Item '{name}' already exists")
+        parameters = inspect.signature(getattr(estimator, self._method)).parameters
+        if 'size' in inputs:
+            inputs[next(iter(parameters))] = inputs.pop('size')
+        try:
+            inspect.signature(getattr(estimator, self._method)).bind(**inputs)
+        except TypeError as error:
+            raise Exception(f"Invalid inputs for {type(estimator).__name__}.{self._method} ({error})")
+        coefficients = dict(coefficients or {})
+        if set(coefficients) - set(COEFFICIENTS):
+            raise Exception(f"Unknown coefficients ({', '.join(set(coefficients) - set(COEFFICIENTS))})")
+        self._items[name] = MonteCarloItem(name, estimator,
+                                           {key: as_distribution(inputs[key]) for key in parameters if key in inputs},
+                                           {key: as_distribution(coefficients[key]) for key in COEFFICIENTS if key in coefficients})
+
+    def generator(self, block: int) -> np.random.Generator:
+        return np.random.default_rng(np.random.SeedSequence(self._seed, spawn_key=(block,)))
+
+    def evaluate(self, block: int, n: int) -> dict[str, EquipmentCostBatchResult]:
+        '''
+        block (-) - Block index, which selects the random stream\n
+        n (-) - Number of samples in the block\n
+        return ($) - Sampled costs per item
+        '''
+        return self.cost(self.sample(self.generator(block), n))
+
+    def sample(self, rng: np.random.Generator, n: int) -> dict[str, dict[str, np.ndarray]]:
+        '''
+        rng (-) - Random generator\n
+        n (-) - Number of samples\n
+        return (-) - Sampled inputs and coefficient perturbations per item
+        '''
+        return {name: {key: distribution.sample(rng, n) for key, distribution in [*item.inputs.items(), *item.coefficients.items()]}
+                for name, item in self._items.items()}
+
+    def cost(self, samples: dict[str, dict[str, np.ndarray]]) -> dict[str, EquipmentCostBatchResult]:
+        '''
+        samples (-) - Inputs and coefficient perturbations per item, as from sample; items left out are not costed\n
+        return ($) - Costs per item
+        '''
+        results = {}
+        for name in samples:
+            item = self._items[name]
+            inputs = {key: samples[name][key] for key in item.inputs}
+            result = getattr(item.estimator, self._method + '_many')(**inputs)
+            if item.coefficients:
+                deltas = [samples[name][key] if key in item.coefficients else 0.0 for key in COEFFICIENTS]
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    log_size = np.log10(next(iter(inputs.values())))
+                factor = 10**(deltas[0] + deltas[1]*log_size + deltas[2]*log_size**2)
+                result = EquipmentCostBatchResult(code=result.code,
+                                                  checks=result.checks,
+                                                  CEPCI=result.CEPCI,
+                                                  value=result.value*factor)
+            results[name] = result
+        return results
+
+    def blocks(self, samples: int) -> list[tuple[int, int]]:
+        '''
+        samples (-) - Total number of samples\n
+        return (-) - (block index, block size) pairs covering the samples
+        '''
+        return [(block, min(self._block_size, samples - block*self._block_size))
+                for block in range(math.ceil(samples/self._block_size))]
+
+    def accumulate(self, blocks: list[tuple[int, int]]) -> 'MonteCarloPartial':
+        '''
+        blocks (-) - (block index, block size) pairs to evaluate\n
+        return ($) - Running statistics of the blocks, mergeable with other partials
+        '''
+        partial = MonteCarloPartial(list(self._items), self._relative_accuracy)
+        for block, n in blocks:
+            values = np.zeros(n)
+            for name, result in self.evaluate(block, n).items():
+                partial.update(name, result)
+                values += result.value
+            partial.update(None, values)
+        return partial
+
+    def run(self, samples: int) -> MonteCarloResult:
+        '''
+        samples (-) - Number of samples\n
+        return ($) - Statistics of every item cost and of their total
+        '''
+        if not self._items:
+            raise Exception("No items to sample")
+        return self.accumulate(self.blocks(samples)).result(samples)
+
+class MonteCarloPartial:
+    '''
+    Running statistics of part of a Monte Carlo run, per item and for the
+    total (name None).
+    '''
+    def __init__(self, names: list[str], relative_accuracy: float = 0.001) -> None:
+        self.moments = {name: MomentAccumulator() for name in [*names, None]}
+        self.quantiles = {name: QuantileAccumulator(relative_accuracy) for name in [*names, None]}
+        self.flags = {name: Counter() for name in names}
+
+    def update(self, name: str | None, result) -> None:
+        self.moments[name].update(result)
+        self.quantiles[name].update(result)
+        if name is not None:
+            self.flags[name].update(result.count())
+
+    def merge(self, other: 'MonteCarloPartial') -> None:
+        for name in other.moments:
+            self.moments[name].merge(other.moments[name])
+            self.quantiles[name].merge(other.quantiles[name])
+        for name, counts in other.flags.items():
+            self.flags[name].update(counts)
+
+    def result(self, samples: int) -> MonteCarloResult:
+        return MonteCarloResult(samples=samples,
+                                total=_summary(self.moments[None], self.quantiles[None]),
+                                items={name: _summary(self.moments[name], self.quantiles[name]) for name in self.flags},
+                                flags={name: dict(counts) for name, counts in self.flags.items()})
@@ -1,7 +1,7 @@
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
 
-class PackingCost:
+class PackingCost(metaclass=Interned):
     class Material(Enum):
         SS304 = {'Tower': 7.14}
         Polyethylene = {'Tower': 1.00}
@@ -19,6 +19,18 @@ class PackingCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
+    @property
+    def material(self) -> Material:
+        return self._material
+
     def purchased(self, volume: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             volume (m3) - volume of packing\n
@@ -35,6 +47,26 @@ class PackingCost:
         """
         FBM = self._material.value[self._type.name]
         cp0 = self._equipment.cost(volume, CEPCI)
-        return EquipmentCostResult(status= cp0.status,
+        return EquipmentCostResult(code= cp0.code,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM)
+
+    def purchased_many(self, volume, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            volume (m3) - volume of packing\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(volume, CEPCI)
+
+    def bare_module_many(self, volume, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            volume (m3) - volume of packing\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM = self._material.value[self._type.name]
+        cp0 = self._equipment.cost_many(volume, CEPCI)
+        return EquipmentCostBatchResult(code= cp0.code,
+                                        CEPCI= cp0.CEPCI,
+                                        value= cp0.value*FBM)
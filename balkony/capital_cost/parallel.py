@@ -0,0 +1,132 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import NamedTuple
+import numpy as np
+from .core import EquipmentCostBatchResult
+from .monte_carlo import MonteCarlo, MonteCarloResult
+
+class SharedArray(NamedTuple):
+    '''
+    Pickle-cheap handle of an array published in shared memory.
+    '''
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+    def attach(self) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+        memory = shared_memory.SharedMemory(name=self.name)
+        return memory, np.ndarray(self.shape, dtype=self.dtype, buffer=memory.buf)
+
+def _publish(array: np.ndarray, memories: list[shared_memory.SharedMemory]) -> tuple[SharedArray, np.ndarray]:
+    memory = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    memories.append(memory)
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)
+    view[...] = array
+    return SharedArray(memory.name, array.shape, array.dtype.str), view
+
+def _evaluate_shard(estimator, method: str, inputs: dict, outputs: dict[str, SharedArray], start: int, stop: int,
+                    memories: list[shared_memory.SharedMemory]) -> tuple[str, ...]:
+    arguments = {}
+    for key, value in inputs.items():
+        if isinstance(value, SharedArray):
+            memory, value = value.attach()
+            memories.append(memory)
+            value = value[start:stop]
+        arguments[key] = value
+    result = getattr(estimator, method + '_many')(**arguments)
+    for key, handle in outputs.items():
+        memory, array = handle.attach()
+        memories.append(memory)
+        array[start:stop] = np.broadcast_to(getattr(result, key), (stop - start,))
+    return result.checks
+
+def _batch_shard(estimator, method: str, inputs: dict, outputs: dict[str, SharedArray], start: int, stop: int) -> tuple[str, ...]:
+    # Array views into the shared blocks die with _evaluate_shard, so the
+    # blocks can be closed here.
+    memories: list[shared_memory.SharedMemory] = []
+    try:
+        return _evaluate_shard(estimator, method, inputs, outputs, start, stop, memories)
+    finally:
+        for memory in memories:
+            memory.close()
+
+def _monte_carlo_shard(model: MonteCarlo, blocks: list[tuple[int, int]]):
+    return model.accumulate(blocks)
+
+class ParallelRunner:
+    '''
+    Shards batch and Monte Carlo jobs over a process pool.
+
+    Batch inputs and outputs live in shared memory: every array is published
+    once and workers only receive its name, so shards cost no array pickling.
+    The coefficient tables are module constants, rebuilt by the imports of
+    each worker rather than shared.
+
+    Shards depend only on the job (shard_size rows, or blocks_per_shard Monte
+    Carlo blocks) and are merged in shard order, so results are identical
+    for any number of workers.
+    '''
+    def __init__(self, workers: int | None = None) -> None:
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+
+    def __enter__(self) -> 'ParallelRunner':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def batch(self, estimator, method: str = 'bare_module', shard_size: int = 100_000, **inputs) -> EquipmentCostBatchResult:
+        '''
+        estimator (-) - Equipment cost object, e.g. PumpCost(PumpCost.Type.Centrifugal)\n
+        method (-) - 'purchased' or 'bare_module'\n
+        shard_size (-) - Rows per task\n
+        inputs (-) - Arguments of the *_many method, scalars or arrays of one common length\n
+        return ($) - Costs of every row, as from estimator.<method>_many
+        '''
+        if method not in ('purchased', 'bare_module'):
+            raise Exception(f"Invalid method ({method})")
+        arrays = {key: np.asarray(value) for key, value in inputs.items()}
+        rows = {len(value) for value in arrays.values() if value.ndim}
+        if len(rows) != 1:
+            raise Exception("Batch inputs need at least one array, and arrays of one common length")
+        rows = rows.pop()
+        if rows == 0:
+            return getattr(estimator, method + '_many')(**inputs)
+        memories: list[shared_memory.SharedMemory] = []
+        outputs: dict[str, tuple[SharedArray, np.ndarray]] = {}
+        try:
+            shared = {key: _publish(value, memories)[0] if value.ndim else value.item() for key, value in arrays.items()}
+            outputs = {'value': _publish(np.empty(rows), memories),
+                       'code': _publish(np.empty(rows, dtype=np.uint8), memories),
+                       'CEPCI': _publish(np.empty(rows), memories)}
+            futures = [self._executor.submit(_batch_shard, estimator, method, shared, {key: handle for key, (handle, _) in outputs.items()},
+                                             start, min(start + shard_size, rows))
+                       for start in range(0, rows, shard_size)]
+            checks = [future.result() for future in futures][0]
+            value, code, CEPCI = (view.copy() for _, view in outputs.values())
+        finally:
+            outputs.clear()
+            for memory in memories:
+                memory.close()
+                memory.unlink()
+        return EquipmentCostBatchResult(code=code, checks=checks, CEPCI=CEPCI, value=value)
+
+    def monte_carlo(self, model: MonteCarlo, samples: int, blocks_per_shard: int = 4) -> MonteCarloResult:
+        '''
+        model (-) - Monte Carlo model\n
+        samples (-) - Number of samples\n
+        blocks_per_shard (-) - Sampling blocks per task\n
+        return ($) - Same statistics as model.run(samples), up to floating point merge order
+        '''
+        if not model.items:
+            raise Exception("No items to sample")
+        blocks = model.blocks(samples)
+        shards = [blocks[i:i + blocks_per_shard] for i in range(0, len(blocks), blocks_per_shard)]
+        partials = self._executor.map(_monte_carlo_shard, [model]*len(shards), shards)
+        total = next(partials)
+        for partial in partials:
+            total.merge(partial)
+        return total.result(samples)
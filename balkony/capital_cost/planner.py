@@ -0,0 +1,122 @@
+import inspect
+import math
+from enum import Enum
+from typing import Any, Iterable, Mapping
+import numpy as np
+from .core import EquipmentCostBatchResult
+from .core.status import row_checks
+from .registry import registry
+
+ALIASES: dict[str, str] = {'rise_pressure': 'pressure'}
+OPTIONS: tuple[str, ...] = ('material', 'tube_only', 'struct')
+
+class EquipmentPlanner:
+    '''
+    Costs a heterogeneous equipment list. Rows are grouped once by
+    (class, type, material, options), every group is evaluated with one
+    purchased_many/bare_module_many call and results are scattered back
+    in the original row order.
+
+    Each row needs a 'type' (a *Cost.Type member, or its name together with
+    an 'equipment' class) and a 'size'. Optional columns are 'material',
+    'tube_only', 'struct', 'pressure', 'diameter', 'num_trays', 'deltaTemp'
+    and 'CEPCI'.
+    '''
+    def __init__(self, table: Iterable[Mapping[str, Any]] | Mapping[str, Iterable[Any]]) -> None:
+        self._columns = self._to_columns(table)
+        if 'type' not in self._columns or 'size' not in self._columns:
+            raise Exception("Equipment table requires 'type' and 'size' columns")
+        self._rows = len(self._columns['type'])
+        self._numeric: dict[str, np.ndarray] = {}
+        options = [self._columns.get(name, [None]*self._rows) for name in OPTIONS]
+        groups: dict[tuple, list[int]] = {}
+        for row in range(self._rows):
+            groups.setdefault(self._key(row, [column[row] for column in options]), []).append(row)
+        self._groups = [(self._estimator(key), np.array(rows, dtype=np.intp)) for key, rows in groups.items()]
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @property
+    def num_groups(self) -> int:
+        return len(self._groups)
+
+    @staticmethod
+    def _to_columns(table) -> dict[str, list]:
+        if isinstance(table, Mapping):
+            return {name: list(values) for name, values in table.items()}
+        rows = list(table)
+        names = {name for row in rows for name in row}
+        return {name: [row.get(name, math.nan) for row in rows] for name in names}
+
+    def _key(self, row: int, values: list) -> tuple:
+        type = self._columns['type'][row]
+        if not isinstance(type, Enum):
+            type = self._columns['equipment'][row].Type[type]
+        cls = registry.equipment_of(type)
+        options = []
+        for name, value in zip(OPTIONS, values):
+            if isinstance(value, float) and math.isnan(value):
+                value = None
+            if name == 'material' and isinstance(value, str):
+                value = cls.Material[value]
+            options.append(value)
+        return (cls, type, *options)
+
+    @staticmethod
+    def _estimator(key: tuple):
+        cls, type, *options = key
+        return cls(type, **{name: value for name, value in zip(OPTIONS, options) if value is not None})
+
+    def _column(self, name: str) -> np.ndarray:
+        if name not in self._numeric:
+            self._numeric[name] = np.asarray(self._columns[name], dtype=float)
+        return self._numeric[name]
+
+    def _arguments(self, method, rows: np.ndarray) -> dict[str, np.ndarray]:
+        arguments = {}
+        parameters = list(inspect.signature(method).parameters.values())
+        for i, parameter in enumerate(parameters):
+            column = 'size' if i == 0 else ALIASES.get(parameter.name, parameter.name)
+            has_default = parameter.default is not inspect.Parameter.empty
+            values = self._column(column)[rows] if column in self._columns else np.full(len(rows), math.nan)
+            missing = np.isnan(values)
+            if has_default:
+                values = np.where(missing, parameter.default, values)
+            elif missing.any():
+                raise Exception(f"Missing '{column}' values required by {method.__qualname__}")
+            arguments[parameter.name] = values
+        return arguments
+
+    def _evaluate(self, method_name: str) -> EquipmentCostBatchResult:
+        value = np.full(self._rows, math.nan)
+        CEPCI = np.full(self._rows, 397.0)
+        code = np.zeros(self._rows, dtype=np.uint8)
+        performed: dict[str, np.ndarray] = {}
+        for estimator, rows in self._groups:
+            method = getattr(estimator, method_name)
+            result = method(**self._arguments(method, rows))
+            value[rows] = result.value
+            CEPCI[rows] = result.CEPCI
+            code[rows] = result.code
+            for check in result.checks:
+                performed.setdefault(check, np.zeros(self._rows, dtype=bool))[rows] = True
+        # Classes without a pressure factor never check pressure: their rows
+        # are marked as not checked rather than reported OK.
+        checks, checked = row_checks(performed)
+        return EquipmentCostBatchResult(code= code, checks= checks,
+                                        CEPCI= CEPCI,
+                                        value= value,
+                                        checked= checked)
+
+    def purchased(self) -> EquipmentCostBatchResult:
+        '''
+        return ($) - Purchased cost of every row, in the original order
+        '''
+        return self._evaluate('purchased_many')
+
+    def bare_module(self) -> EquipmentCostBatchResult:
+        '''
+        return ($) - Bare module cost of every row, in the original order
+        '''
+        return self._evaluate('bare_module_many')
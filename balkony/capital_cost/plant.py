@@ -0,0 +1,227 @@
+import inspect
+import math
+from dataclasses import dataclass
+from typing import Any, Iterator, NamedTuple
+from .core import CachedCost, CostStatus, EquipmentCostResult
+
+CONTINGENCY_AND_FEE = 1.18
+AUXILIARY_FACILITIES = 0.50
+BASE_INPUTS: dict[str, float] = {'pressure': 1.0, 'rise_pressure': 1.0, 'deltaTemp': 0.0}
+
+class PlantSubtotal(NamedTuple):
+    count: int
+    purchased: float
+    bare_module: float
+    base_bare_module: float
+
+@dataclass(slots=True)
+class PlantItem:
+    '''
+    One named equipment of a PlantCostModel. The cost fields hold the results
+    of the last evaluation (None before the first one).
+    '''
+    name: str
+    estimator: Any
+    inputs: dict[str, float]
+    purchased: EquipmentCostResult | None = None
+    bare_module: EquipmentCostResult | None = None
+    base_bare_module: EquipmentCostResult | None = None
+
+    @property
+    def group(self) -> str:
+        return type(self.estimator).__name__
+
+_SIGNATURES: dict[tuple[type, str], inspect.Signature] = {}
+
+def _signature(estimator, method: str) -> inspect.Signature:
+    key = (type(estimator), method)
+    if key not in _SIGNATURES:
+        _SIGNATURES[key] = inspect.signature(getattr(estimator, method))
+    return _SIGNATURES[key]
+
+def _unwrap(estimator):
+    # A CachedCost forwards *args, **kwargs, which hides the signature of the
+    # estimator; the model keeps its own results, so it costs the estimator itself.
+    return estimator.estimator if isinstance(estimator, CachedCost) else estimator
+
+class PlantCostModel:
+    '''
+    Plant-level capital cost built from named equipment items (Turton et al.).
+
+    total module = 1.18 * sum(C_BM), with 15% contingency and 3% fee
+    grass roots = total module + 0.50 * sum(C_BM at base conditions)
+
+    Base conditions use the default material of the equipment type at 1 barg
+    (and no deltaTemp). Edits only mark the item dirty; the next read
+    re-evaluates the dirty items and the subtotals of their equipment classes.
+    Changing CEPCI rescales the stored results instead of re-evaluating them.
+    '''
+    def __init__(self, CEPCI: float = 397) -> None:
+        self._CEPCI = CEPCI
+        self._items: dict[str, PlantItem] = {}
+        self._groups: dict[str, dict[str, PlantItem]] = {}
+        self._subtotals: dict[str, PlantSubtotal] = {}
+        self._dirty: set[str] = set()
+        self._stale: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    @property
+    def CEPCI(self) -> float:
+        return self._CEPCI
+
+    @CEPCI.setter
+    def CEPCI(self, value: float) -> None:
+        self._CEPCI = value
+        for name, item in self._items.items():
+            if 'CEPCI' in item.inputs or name in self._dirty:
+                continue
+            item.purchased = item.purchased.rescale(value)
+            item.bare_module = item.bare_module.rescale(value)
+            item.base_bare_module = item.base_bare_module.rescale(value)
+            self._stale.add(item.group)
+
+    def add(self, name: str, estimator, **inputs: float) -> None:
+        '''
+        name (-) - Unique item name\n
+        estimator (-) - Equipment cost object, e.g. PumpCost(PumpCost.Type.Centrifugal)\n
+        inputs (-) - Arguments of estimator.bare_module ('size' stands for the first one); CEPCI defaults to the model's
+        '''
+        if name in self._items:
+            raise Exception(f"Item '{name}' already exists")
+        estimator = _unwrap(estimator)
+        item = PlantItem(name, estimator, self._validate(estimator, inputs))
+        self._items[name] = item
+        self._groups.setdefault(item.group, {})[name] = item
+        self._dirty.add(name)
+
+    def update(self, name: str, estimator=None, **inputs: float) -> None:
+        '''
+        name (-) - Item to change\n
+        estimator (-) - New equipment cost object, or None to keep the current one\n
+        inputs (-) - Arguments to change, the others keep their values; a new estimator takes a full set of inputs
+        '''
+        item = self.item(name, evaluate=False)
+        estimator = _unwrap(estimator)
+        if estimator is not None and estimator is not item.estimator:
+            item.inputs = self._validate(estimator, inputs)
+            self._stale.add(item.group)
+            del self._groups[item.group][name]
+            item.estimator = estimator
+            self._groups.setdefault(item.group, {})[name] = item
+        else:
+            item.inputs = self._validate(item.estimator, {**item.inputs, **inputs})
+        self._dirty.add(name)
+
+    def remove(self, name: str) -> None:
+        item = self.item(name, evaluate=False)
+        del self._items[name]
+        del self._groups[item.group][name]
+        self._dirty.discard(name)
+        self._stale.add(item.group)
+
+    def item(self, name: str, evaluate: bool = True) -> PlantItem:
+        '''
+        name (-) - Item name\n
+        evaluate (-) - Bring the item costs up to date first\n
+        return (-) - The item with its inputs and costs
+        '''
+        if name not in self._items:
+            raise Exception(f"Unknown item '{name}'")
+        if evaluate and name in self._dirty:
+            self._evaluate(self._items[name])
+            self._dirty.discard(name)
+        return self._items[name]
+
+    def base_estimator(self, estimator):
+        '''
+        estimator (-) - Equipment cost object of an item\n
+        return (-) - Estimator of the same equipment type with its default material and options, costed at the base
+        conditions; override to change them
+        '''
+        equipment = type(estimator)
+        if not hasattr(equipment, 'arguments'):
+            raise Exception(f"No base estimator for {equipment.__name__}")
+        return equipment(equipment.arguments(estimator)['type'])
+
+    def _validate(self, estimator, inputs: dict[str, float]) -> dict[str, float]:
+        signature = _signature(estimator, 'bare_module')
+        parameters = tuple(signature.parameters)
+        if 'size' in inputs:
+            inputs = {parameters[0]: inputs['size'], **{key: value for key, value in inputs.items() if key != 'size'}}
+        try:
+            signature.bind(**inputs)
+        except TypeError as error:
+            raise Exception(f"Invalid inputs for {type(estimator).__name__}.bare_module ({error})")
+        return inputs
+
+    def _evaluate(self, item: PlantItem) -> None:
+        estimator, inputs = item.estimator, {'CEPCI': self._CEPCI, **item.inputs}
+        purchased = _signature(estimator, 'purchased').parameters
+        base = self.base_estimator(estimator)
+        item.purchased = estimator.purchased(**{key: value for key, value in inputs.items() if key in purchased})
+        item.bare_module = estimator.bare_module(**inputs)
+        item.base_bare_module = base.bare_module(**{**inputs, **{key: value for key, value in BASE_INPUTS.items() if key in inputs}})
+        self._stale.add(item.group)
+
+    def _refresh(self) -> None:
+        for name in self._dirty:
+            self._evaluate(self._items[name])
+        self._dirty.clear()
+        for group in self._stale:
+            items = self._groups.get(group)
+            if not items:
+                self._groups.pop(group, None)
+                self._subtotals.pop(group, None)
+                continue
+            self._subtotals[group] = PlantSubtotal(count=len(items),
+                                                   purchased=math.fsum(item.purchased.value for item in items.values()),
+                                                   bare_module=math.fsum(item.bare_module.value for item in items.values()),
+                                                   base_bare_module=math.fsum(item.base_bare_module.value for item in items.values()))
+        self._stale.clear()
+
+    def subtotals(self) -> dict[str, PlantSubtotal]:
+        '''
+        return ($) - Costs summed per equipment class
+        '''
+        self._refresh()
+        return dict(self._subtotals)
+
+    @property
+    def purchased(self) -> float:
+        self._refresh()
+        return math.fsum(subtotal.purchased for subtotal in self._subtotals.values())
+
+    @property
+    def bare_module(self) -> float:
+        self._refresh()
+        return math.fsum(subtotal.bare_module for subtotal in self._subtotals.values())
+
+    @property
+    def base_bare_module(self) -> float:
+        self._refresh()
+        return math.fsum(subtotal.base_bare_module for subtotal in self._subtotals.values())
+
+    @property
+    def total_module(self) -> float:
+        return CONTINGENCY_AND_FEE*self.bare_module
+
+    @property
+    def grass_roots(self) -> float:
+        return self.total_module + AUXILIARY_FACILITIES*self.base_bare_module
+
+    def flagged(self, flag: CostStatus | None = None) -> list[str]:
+        '''
+        flag (-) - CostStatus bits to look for, or None for any warning\n
+        return (-) - Names of the items whose bare module cost carries flag
+        '''
+        self._refresh()
+        mask = ~CostStatus.OK if flag is None else flag
+        return [name for name, item in self._items.items() if item.bare_module.code & mask]
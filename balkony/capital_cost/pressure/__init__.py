@@ -1,8 +1,26 @@
-from .evaporators_pressure import EvaporatorPressure
-from .fans_pressure import FanPressure
-from .furnaces_pressure import FurnacePressure
-from .heat_exchangers_pressure import HeatExchangerPressure
-from .heaters_pressure import HeaterPressure
-from .pumps_pressure import PumpPressure
-from .tanks_pressure import TankPressure
-from .vaporizers_pressure import VaporizerPressure
\ No newline at end of file
+# Pressure factor classes are imported on first access, like the equipment
+# classes of the parent package.
+_LAZY: dict[str, str] = {
+    'EvaporatorPressure':    'evaporators_pressure',
+    'FanPressure':           'fans_pressure',
+    'FurnacePressure':       'furnaces_pressure',
+    'HeatExchangerPressure': 'heat_exchangers_pressure',
+    'HeaterPressure':        'heaters_pressure',
+    'PumpPressure':          'pumps_pressure',
+    'TankPressure':          'tanks_pressure',
+    'VaporizerPressure':     'vaporizers_pressure',
+}
+
+__all__ = list(_LAZY)
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        # __import__ rather than importlib.import_module, so that lazy imports
+        # still show up in python -X importtime.
+        value = getattr(__import__(_LAZY[name], globals(), None, [name], 1), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,3 +1,4 @@
 from .pressure_factor import PressureFactor
 from .pressure_properties import PressureProperties
-from .pressure_result import PressureResult
\ No newline at end of file
+from .pressure_result import PressureResult
+from .pressure_batch_result import PressureBatchResult
\ No newline at end of file
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+import numpy as np
+from .pressure_result import PressureResult
+from ...core.status import CostStatus, range_codes
+
+@dataclass(frozen=True)
+class PressureBatchResult:
+    '''
+    Columnar counterpart of PressureResult. code is an uint8 array of
+    CostStatus bits (PRESSURE_BELOW, PRESSURE_ABOVE, INVALID_INPUT); status
+    derives the range codes (0 - OK, 1 - lower pressure limit, 2 - upper
+    pressure limit, 3 - invalid input) from it.
+    '''
+    code: np.ndarray
+    value: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    @property
+    def status(self) -> np.ndarray:
+        return range_codes(self.code, 'pressure')
+
+    def result(self, index: int) -> PressureResult:
+        '''
+        index (-) - Row of the batch\n
+        return - Scalar result of the row
+        '''
+        return PressureResult(value=float(self.value[index]), code=CostStatus(int(self.code[index])))
@@ -1,15 +1,41 @@
 import math
+import numpy as np
 from .pressure_result import PressureResult
 from .pressure_properties import PressureProperties
+from .pressure_batch_result import PressureBatchResult
+from ...core.status import INVALID_INPUT, OK, PRESSURE_ABOVE, PRESSURE_BELOW
 
 class PressureFactor:
+    __slots__ = ('_properties', '_max', '_min', '_lowers', '_uppers', '_parameters', '_index_min', '_index_max', '_breakpoints')
+
     def __init__(self, properties: list[PressureProperties]) -> None:
         self._properties = properties
-        self._max: PressureProperties = PressureProperties((math.inf, math.inf), (None, None, None))
-        self._min: PressureProperties = PressureProperties((0.0, 0.0), (None, None, None))
+        self._max: PressureProperties = self._properties[0]
+        self._min: PressureProperties = self._properties[0]
         for prop in self._properties:
             self._min = prop if prop.lower < self._min.lower else self._min
             self._max = prop if prop.upper > self._max.upper else self._max
+        self._compile()
+
+    def _compile(self) -> None:
+        '''
+        Sorts the segments into breakpoint arrays used by factor_many.
+        '''
+        segments = sorted(self._properties, key=lambda prop: prop.lower)
+        self._lowers = np.array([prop.lower for prop in segments], dtype=float)
+        self._uppers = np.array([prop.upper for prop in segments], dtype=float)
+        self._parameters = np.array([prop.parameters for prop in segments], dtype=float)
+        self._index_min = segments.index(self._min)
+        self._index_max = segments.index(self._max)
+        bounds = {prop.lower for prop in segments if prop is not self._min} | {prop.upper for prop in segments if prop is not self._max}
+        self._breakpoints = tuple(sorted(bounds))
+
+    @property
+    def breakpoints(self) -> tuple[float, ...]:
+        '''
+        return (barg) - Pressures where the factor switches segment; its derivative may jump there
+        '''
+        return self._breakpoints
 
     def factor(self, pressure: float) -> PressureResult:
         '''
@@ -17,17 +43,71 @@ class PressureFactor:
         return (-) - Pressure factor
         '''
         log_press = math.log(pressure,10)
-        for prop in self._properties:            
+        for prop in self._properties:
             if prop.is_valid_range(pressure):
                 C1, C2, C3 = prop.parameters
                 fp = 10**(C1 + C2*log_press + C3*(log_press**2))
-                return PressureResult(value=fp, status=('OK', True))
-            
+                return PressureResult(value=fp, code=OK)
+
         if pressure > self._max.upper:
             C1, C2, C3 = self._max.parameters
             fp = 10**(C1 + C2*log_press + C3*(log_press**2))
-            return PressureResult(value=fp, status=('Warning - Upper pressure limit.', False))
+            return PressureResult(value=fp, code=PRESSURE_ABOVE)
         else:
             C1, C2, C3 = self._min.parameters
             fp = 10**(C1 + C2*log_press + C3*(log_press**2))
-            return PressureResult(value=fp, status=('Warning - Lower pressure limit.', False))
\ No newline at end of file
+            return PressureResult(value=fp, code=PRESSURE_BELOW)
+
+    def _segment(self, pressure: float) -> tuple[float, float, float]:
+        for prop in self._properties:
+            if prop.is_valid_range(pressure):
+                return prop.parameters
+        return self._max.parameters if pressure > self._max.upper else self._min.parameters
+
+    def derivative(self, pressure: float) -> float:
+        '''
+        pressure (barg) - Operation pressure\n
+        return (1/barg) - Derivative of the pressure factor, on the segment used by factor
+        '''
+        C1, C2, C3 = self._segment(pressure)
+        log_press = math.log(pressure,10)
+        fp = 10**(C1 + C2*log_press + C3*(log_press**2))
+        return fp*(C2 + 2*C3*log_press)/pressure
+
+    def _index_many(self, pressure: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        index = np.searchsorted(self._uppers, pressure, side='left')
+        inside = index < len(self._uppers)
+        index = np.minimum(index, len(self._uppers) - 1)
+        inside &= self._lowers[index] <= pressure
+        above = ~inside & (pressure > self._uppers[self._index_max])
+        return np.where(inside, index, np.where(above, self._index_max, self._index_min)), inside, above
+
+    def derivative_many(self, pressure) -> np.ndarray:
+        '''
+        pressure (barg) - Array of operation pressures\n
+        return (1/barg) - Derivatives of the pressure factors, NaN for non-positive pressures
+        '''
+        pressure = np.asarray(pressure, dtype=float)
+        index, _, _ = self._index_many(pressure)
+        C1, C2, C3 = (self._parameters[:, i][index] for i in range(3))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_press = np.log(pressure)/math.log(10)
+            fp = 10**(C1 + C2*log_press + C3*(log_press**2))
+            slope = fp*(C2 + 2*C3*log_press)/pressure
+        return np.where(pressure > 0, slope, np.nan)
+
+    def factor_many(self, pressure) -> PressureBatchResult:
+        '''
+        pressure (barg) - Array of operation pressures\n
+        return (-) - Pressure factors and CostStatus bits, NaN where flagged INVALID_INPUT
+        '''
+        pressure = np.asarray(pressure, dtype=float)
+        index, inside, above = self._index_many(pressure)
+        C1, C2, C3 = (self._parameters[:, i][index] for i in range(3))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_press = np.log(pressure)/math.log(10)
+            fp = 10**(C1 + C2*log_press + C3*(log_press**2))
+        code = np.where(inside, np.uint8(OK), np.where(above, np.uint8(PRESSURE_ABOVE), np.uint8(PRESSURE_BELOW)))
+        invalid = ~(pressure > 0)
+        code[invalid] = INVALID_INPUT
+        return PressureBatchResult(value=np.where(invalid, np.nan, fp), code=code)
@@ -2,6 +2,8 @@ import math
 from typing import Tuple
 
 class PressureProperties:
+    __slots__ = ('_bounds', '_parameters')
+
     def __init__(self, bounds: Tuple[float, float], parameters: Tuple[float, float, float]) -> None:
         lower = bounds[0] if bounds[0] != None else 0.0
         upper = bounds[1] if bounds[1] != None else math.inf
@@ -1,7 +1,38 @@
 from dataclasses import dataclass
 from typing import Tuple
+from ...core.status import INVALID_INPUT, INVALID_MESSAGE, MASKS, MESSAGES, status_code
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, init=False)
 class PressureResult:
-    status: Tuple[str, bool]
-    value: float
\ No newline at end of file
+    '''
+    code holds the pressure status bits (OK, PRESSURE_BELOW or
+    PRESSURE_ABOVE, or INVALID_INPUT, see core.status). The former status tuple is still
+    accepted in place of code, positionally or as status=.
+    '''
+    code: int
+    value: float
+
+    def __init__(self, code: int | tuple | None = None, value: float | None = None, *, status: Tuple[str, bool] | None = None) -> None:
+        if isinstance(code, tuple):
+            code, status = None, code
+        if status is not None:
+            if code is not None:
+                raise Exception("Give either code or status")
+            code = status_code({'pressure': status})[0]
+        object.__setattr__(self, 'code', code)
+        object.__setattr__(self, 'value', value)
+
+    @classmethod
+    def from_status(cls, status: Tuple[str, bool], value: float) -> 'PressureResult':
+        '''
+        status (-) - Human-readable status, as (message, ok)\n
+        value (-) - Pressure factor\n
+        return (-) - Result with the code encoding status
+        '''
+        return cls(status=status, value=value)
+
+    @property
+    def status(self) -> Tuple[str, bool]:
+        if self.code & INVALID_INPUT:
+            return INVALID_MESSAGE
+        return MESSAGES['pressure'][self.code & MASKS['pressure']]
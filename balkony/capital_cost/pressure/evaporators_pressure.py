@@ -1,6 +1,8 @@
-from .core import PressureFactor, PressureProperties, PressureResult
+import numpy as np
+from .core import PressureFactor, PressureProperties, PressureResult, PressureBatchResult
+from ..core import Interned
 
-class EvaporatorPressure:
+class EvaporatorPressure(metaclass=Interned):
     def __init__(self) -> None:
         self._pressure: PressureFactor = PressureFactor([ 
                 PressureProperties((None, 10), (0.0, 0.0, 0.0)),
@@ -8,3 +10,16 @@ class EvaporatorPressure:
         
     def factor(self, pressure: float) -> PressureResult:
         return self._pressure.factor(pressure)
+
+    def factor_many(self, pressure) -> PressureBatchResult:
+        return self._pressure.factor_many(pressure)
+
+    def derivative(self, pressure: float) -> float:
+        return self._pressure.derivative(pressure)
+
+    def derivative_many(self, pressure) -> np.ndarray:
+        return self._pressure.derivative_many(pressure)
+
+    @property
+    def breakpoints(self) -> tuple[float, ...]:
+        return self._pressure.breakpoints
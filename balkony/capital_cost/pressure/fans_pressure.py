@@ -1,6 +1,8 @@
-from .core import PressureFactor, PressureProperties, PressureResult
+import numpy as np
+from .core import PressureFactor, PressureProperties, PressureResult, PressureBatchResult
+from ..core import Interned
 
-class FanPressure:
+class FanPressure(metaclass=Interned):
     def __init__(self, type: str) -> None:
         if type == 'CentrifugalRadial' or type == 'BackwardCurve':
             self._pressure: PressureFactor = PressureFactor([
@@ -12,4 +14,17 @@ class FanPressure:
                 PressureProperties((1, 4), (0.0, 0.20899, -0.0328)) ])
 
     def factor(self, pressure: float) -> PressureResult:
-        return self._pressure.factor(pressure)
\ No newline at end of file
+        return self._pressure.factor(pressure)
+
+    def factor_many(self, pressure) -> PressureBatchResult:
+        return self._pressure.factor_many(pressure)
+
+    def derivative(self, pressure: float) -> float:
+        return self._pressure.derivative(pressure)
+
+    def derivative_many(self, pressure) -> np.ndarray:
+        return self._pressure.derivative_many(pressure)
+
+    @property
+    def breakpoints(self) -> tuple[float, ...]:
+        return self._pressure.breakpoints
\ No newline at end of file
@@ -1,6 +1,8 @@
-from .core import PressureFactor, PressureProperties, PressureResult
+import numpy as np
+from .core import PressureFactor, PressureProperties, PressureResult, PressureBatchResult
+from ..core import Interned
 
-class FurnacePressure:
+class FurnacePressure(metaclass=Interned):
     def __init__(self, type: str) -> None:
         if type == 'ReformerFurnace':
             self._pressure: PressureFactor = PressureFactor([
@@ -16,4 +18,17 @@ class FurnacePressure:
                 PressureProperties((10, 200), (0.1347, -0.2368, 0.1021))])
 
     def factor(self, pressure: float) -> PressureResult:
-        return self._pressure.factor(pressure)
\ No newline at end of file
+        return self._pressure.factor(pressure)
+
+    def factor_many(self, pressure) -> PressureBatchResult:
+        return self._pressure.factor_many(pressure)
+
+    def derivative(self, pressure: float) -> float:
+        return self._pressure.derivative(pressure)
+
+    def derivative_many(self, pressure) -> np.ndarray:
+        return self._pressure.derivative_many(pressure)
+
+    @property
+    def breakpoints(self) -> tuple[float, ...]:
+        return self._pressure.breakpoints
\ No newline at end of file
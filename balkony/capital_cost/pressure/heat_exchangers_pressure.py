@@ -1,6 +1,8 @@
-from .core import PressureFactor, PressureProperties, PressureResult
+import numpy as np
+from .core import PressureFactor, PressureProperties, PressureResult, PressureBatchResult
+from ..core import Interned
 
-class HeatExchangerPressure:
+class HeatExchangerPressure(metaclass=Interned):
     def __init__(self, type: str, tube_only: bool) -> None:
         if type in ['ScrapedWall', 'DoublePipe', 'MultiplePipe']:            
             self._pressure = PressureFactor([
@@ -37,4 +39,17 @@ class HeatExchangerPressure:
                     PressureProperties((5, 140), (0.03881, -0.11272, 0.08183))])
 
     def factor(self, pressure: float) -> PressureResult:
-        return self._pressure.factor(pressure)
\ No newline at end of file
+        return self._pressure.factor(pressure)
+
+    def factor_many(self, pressure) -> PressureBatchResult:
+        return self._pressure.factor_many(pressure)
+
+    def derivative(self, pressure: float) -> float:
+        return self._pressure.derivative(pressure)
+
+    def derivative_many(self, pressure) -> np.ndarray:
+        return self._pressure.derivative_many(pressure)
+
+    @property
+    def breakpoints(self) -> tuple[float, ...]:
+        return self._pressure.breakpoints
\ No newline at end of file
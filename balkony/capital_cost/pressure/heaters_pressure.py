@@ -1,6 +1,8 @@
-from .core import PressureFactor, PressureProperties, PressureResult
+import numpy as np
+from .core import PressureFactor, PressureProperties, PressureResult, PressureBatchResult
+from ..core import Interned
 
-class HeaterPressure:
+class HeaterPressure(metaclass=Interned):
     def __init__(self, type: str) -> None:
         if type == 'SteamBoiler':            
             self._pressure = PressureFactor([
@@ -12,4 +14,17 @@ class HeaterPressure:
                 PressureProperties((10, 100), (-0.3935, 0.3957, -0.00226))]) 
 
     def factor(self, pressure: float) -> PressureResult:
-        return self._pressure.factor(pressure)
\ No newline at end of file
+        return self._pressure.factor(pressure)
+
+    def factor_many(self, pressure) -> PressureBatchResult:
+        return self._pressure.factor_many(pressure)
+
+    def derivative(self, pressure: float) -> float:
+        return self._pressure.derivative(pressure)
+
+    def derivative_many(self, pressure) -> np.ndarray:
+        return self._pressure.derivative_many(pressure)
+
+    @property
+    def breakpoints(self) -> tuple[float, ...]:
+        return self._pressure.breakpoints
\ No newline at end of file
@@ -1,8 +1,10 @@
+import numpy as np
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
+from .core.status import SIZE_PRESSURE_CHECK
 from .pressure import PumpPressure
 
-class PumpCost:
+class PumpCost(metaclass=Interned):
     class Material(Enum):
         CastIron = {'Reciprocating': 1.00, 'PositiveDisplacement': 1.00, 'Centrifugal': 1.0}
         CarbonSteel = {'Reciprocating': 1.45, 'PositiveDisplacement': 1.42, 'Centrifugal': 1.54}
@@ -26,6 +28,22 @@ class PumpCost:
                                                                                      min_size=type.value['min_size'],
                                                                                      max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
+    @property
+    def material(self) -> Material:
+        return self._material
+
+    @property
+    def pressure(self) -> PumpPressure:
+        return self._pressure
+
     def purchased(self, power: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             power (kW) - power of pump\n
@@ -46,6 +64,31 @@ class PumpCost:
         B1 = self._type.value['B1']
         B2 = self._type.value['B1']
         cp0 = self._equipment.cost(power, CEPCI)
-        return EquipmentCostResult(status= {'size': cp0.status['size'], 'pressure': Fp.status},
+        return EquipmentCostResult(code= cp0.code | Fp.code, checks= SIZE_PRESSURE_CHECK,
                                    CEPCI= CEPCI,
                                    value= cp0.value*(B1 + B2*Fm*Fp.value))
+
+    def purchased_many(self, power, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            power (kW) - power of pump\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(power, CEPCI)
+
+    def bare_module_many(self, power, pressure, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            power (kW) - power of pump\n
+            pressure (barg) - Operating pressure\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        Fm = self._material.value[self._type.name]
+        Fp = self._pressure.factor_many(pressure)
+        B1 = self._type.value['B1']
+        B2 = self._type.value['B1']
+        cp0 = self._equipment.cost_many(power, CEPCI)
+        value = cp0.value*(B1 + B2*Fm*Fp.value)
+        return EquipmentCostBatchResult(code= np.broadcast_to(cp0.code | Fp.code, value.shape), checks= SIZE_PRESSURE_CHECK,
+                                        CEPCI= cp0.CEPCI,
+                                        value= value)
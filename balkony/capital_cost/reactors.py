@@ -1,7 +1,7 @@
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
 
-class ReactorCost:
+class ReactorCost(metaclass=Interned):
     class Type(Enum):
         Autoclave = { 'min_size': 1.0, 'max_size': 15.0, 'data': (4.5587, 0.2986, 0.0020), 'unit':'m3', 'Fbare': 4.0 }
         Fermenter = { 'min_size': 0.1, 'max_size': 35.0, 'data': (4.1052, 0.5320, -0.0005), 'unit':'m3', 'Fbare': 4.0 }
@@ -18,6 +18,14 @@ class ReactorCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
     def purchased(self, volume: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             volume (m3) - Volume of reactor\n
@@ -34,6 +42,26 @@ class ReactorCost:
         """
         FBM= self._type.value['Fbare']
         cp0 = self._equipment.cost(volume, CEPCI)
-        return EquipmentCostResult(status= cp0.status,
+        return EquipmentCostResult(code= cp0.code,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM)
+
+    def purchased_many(self, volume, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            volume (m3) - Volume of reactor\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(volume, CEPCI)
+
+    def bare_module_many(self, volume, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            volume (m3) - Volume of reactor\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM= self._type.value['Fbare']
+        cp0 = self._equipment.cost_many(volume, CEPCI)
+        return EquipmentCostBatchResult(code= cp0.code,
+                                        CEPCI= cp0.CEPCI,
+                                        value= cp0.value*FBM)
@@ -0,0 +1,146 @@
+import math
+from enum import Enum
+import numpy as np
+from .core import EquipmentCostBatchResult
+from .core.status import INVALID_INPUT, size_flags
+from .blenders import BlenderCost
+from .centrifuges import CentrifugeCost
+from .compressors import CompressorCost
+from .conveyors import ConveyorCost
+from .crystallizers import CrystallizerCost
+from .drives import DriveCost
+from .dryers import DryerCost
+from .dust_collectors import DustCollectorCost
+from .evaporators import EvaporatorCost
+from .fans import FanCost
+from .filters import FilterCost
+from .furnaces import FurnanceCost
+from .heat_exchangers import HeatExchangerCost
+from .heaters import HeaterCost
+from .mixers import MixerCost
+from .packing import PackingCost
+from .pumps import PumpCost
+from .reactors import ReactorCost
+from .screens import ScreenCost
+from .tanks import TankCost
+from .trays import TrayCost
+from .towers import TowerCost
+from .turbines import TurbineCost
+from .vaporizers import VaporizerCost
+from .vessels import VesselCost
+
+EQUIPMENT: tuple[type, ...] = (BlenderCost, CentrifugeCost, CompressorCost, ConveyorCost, CrystallizerCost, DriveCost,
+                               DryerCost, DustCollectorCost, EvaporatorCost, FanCost, FilterCost, FurnanceCost,
+                               HeatExchangerCost, HeaterCost, MixerCost, PackingCost, PumpCost, ReactorCost, ScreenCost,
+                               TankCost, TowerCost, TrayCost, TurbineCost, VaporizerCost, VesselCost)
+
+class CoefficientRegistry:
+    '''
+    Flattens the Type/Material enums of every equipment class into contiguous
+    coefficient arrays addressed by integer type and material IDs. Missing
+    coefficients (e.g. B1 for classes using Fbare) are NaN, as are invalid
+    type/material combinations in the factor matrix.
+    '''
+    def __init__(self, equipment: tuple[type, ...] = EQUIPMENT) -> None:
+        self._equipment = tuple(equipment)
+        self._owners: dict[Enum, type] = {type: cls for cls in self._equipment for type in cls.Type}
+        self._types: list[Enum] = list(self._owners)
+        self._type_ids: dict[Enum, int] = {type: id for id, type in enumerate(self._types)}
+        self._materials: list[str] = []
+        for cls in self._equipment:
+            for material in getattr(cls, 'Material', ()):
+                if material.name not in self._materials:
+                    self._materials.append(material.name)
+        self._material_ids: dict[str, int] = {name: id for id, name in enumerate(self._materials)}
+
+        self.equipment_ids = np.array([self._equipment.index(self.equipment_of(type)) for type in self._types], dtype=np.int16)
+        self.K1, self.K2, self.K3 = np.array([type.value['data'] for type in self._types], dtype=float).T.copy()
+        self.min_size = np.array([type.value['min_size'] for type in self._types], dtype=float)
+        self.max_size = np.array([type.value['max_size'] for type in self._types], dtype=float)
+        self.B1 = np.array([type.value.get('B1', math.nan) for type in self._types], dtype=float)
+        self.B2 = np.array([type.value.get('B2', math.nan) for type in self._types], dtype=float)
+        self.Fbare = np.array([type.value.get('Fbare', math.nan) for type in self._types], dtype=float)
+        self.units = tuple(type.value['unit'] for type in self._types)
+
+        self.factors = np.full((len(self._types), len(self._materials)), math.nan)
+        for type, type_id in self._type_ids.items():
+            for material in getattr(self.equipment_of(type), 'Material', ()):
+                factor = material.value.get(type.name, math.nan) if isinstance(material.value, dict) else material.value
+                self.factors[type_id, self._material_ids[material.name]] = factor
+        for array in (self.equipment_ids, self.K1, self.K2, self.K3, self.min_size, self.max_size,
+                      self.B1, self.B2, self.Fbare, self.factors):
+            array.flags.writeable = False
+
+    @property
+    def equipment(self) -> tuple[type, ...]:
+        return self._equipment
+
+    @property
+    def num_types(self) -> int:
+        return len(self._types)
+
+    @property
+    def num_materials(self) -> int:
+        return len(self._materials)
+
+    def equipment_of(self, type: Enum) -> type:
+        '''
+        type (-) - Member of a nested *Cost.Type enum\n
+        return (-) - Equipment class that owns the type
+        '''
+        return self._owners[type]
+
+    def type_id(self, type: Enum) -> int:
+        return self._type_ids[type]
+
+    def type(self, type_id: int) -> Enum:
+        return self._types[type_id]
+
+    def type_ids(self, equipment: type) -> np.ndarray:
+        '''
+        equipment (-) - Equipment class\n
+        return (-) - IDs of every type of the class
+        '''
+        return np.flatnonzero(self.equipment_ids == self._equipment.index(equipment))
+
+    def material_id(self, material: Enum | str) -> int:
+        '''
+        material (-) - Member of a nested *Cost.Material enum or its name\n
+        return (-) - Material ID, shared by equally named materials of different classes
+        '''
+        return self._material_ids[material if isinstance(material, str) else material.name]
+
+    def material(self, material_id: int) -> str:
+        return self._materials[material_id]
+
+    def material_factor(self, type_id, material_id) -> np.ndarray:
+        '''
+        type_id (-) - Array of type IDs\n
+        material_id (-) - Array of material IDs aligned with type_id\n
+        return (-) - Material factor of each pair, NaN for invalid combinations
+        '''
+        return self.factors[np.asarray(type_id), np.asarray(material_id)]
+
+    def is_valid(self, type_id, material_id) -> np.ndarray:
+        return ~np.isnan(self.material_factor(type_id, material_id))
+
+    def purchased_many(self, type_id, size, CEPCI = 397) -> EquipmentCostBatchResult:
+        '''
+        type_id (-) - Array of type IDs, possibly from different equipment classes\n
+        size (-) - Array of sizes aligned with type_id, in the unit of each type\n
+        CEPCI (-) - Chemical plant cost index, scalar or array\n
+        return ($) - Purchased cost of equipment for each row
+        '''
+        type_id = np.asarray(type_id)
+        size = np.asarray(size, dtype=float)
+        CEPCI = np.asarray(CEPCI, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_size = np.log(size)/math.log(10)
+            cp0 = 10**(self.K1[type_id] + self.K2[type_id]*log_size + self.K3[type_id]*(log_size**2))
+        code = size_flags(size, self.min_size[type_id], self.max_size[type_id])
+        value = np.where(code & INVALID_INPUT, np.nan, (CEPCI/397.0)*cp0)
+        return EquipmentCostBatchResult(code= np.broadcast_to(code, value.shape),
+                                        CEPCI= CEPCI,
+                                        value= value)
+
+registry = CoefficientRegistry()
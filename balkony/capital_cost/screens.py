@@ -1,7 +1,7 @@
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
 
-class ScreenCost:
+class ScreenCost(metaclass=Interned):
     class Type(Enum):
         DSM = { 'min_size': 0.3, 'max_size': 6.0, 'data': (3.8050, 0.5856, 0.2120), 'unit':'m2', 'Fbare': 1.34 }
         Rotary = { 'min_size': 0.3, 'max_size': 15.0, 'data': (4.0485, 0.1118, 0.3260), 'unit':'m2', 'Fbare': 1.34 }
@@ -15,6 +15,14 @@ class ScreenCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
     def purchased(self, area: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             area (m2) - area of screen\n
@@ -31,6 +39,26 @@ class ScreenCost:
         """
         FBM= self._type.value['Fbare']
         cp0 = self._equipment.cost(area, CEPCI)
-        return EquipmentCostResult(status= cp0.status,
+        return EquipmentCostResult(code= cp0.code,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM)
+
+    def purchased_many(self, area, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            area (m2) - area of screen\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(area, CEPCI)
+
+    def bare_module_many(self, area, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            area (m2) - area of screen\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM= self._type.value['Fbare']
+        cp0 = self._equipment.cost_many(area, CEPCI)
+        return EquipmentCostBatchResult(code= cp0.code,
+                                        CEPCI= cp0.CEPCI,
+                                        value= cp0.value*FBM)
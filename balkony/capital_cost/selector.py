@@ -0,0 +1,138 @@
+import inspect
+from dataclasses import dataclass
+from enum import Enum
+from typing import NamedTuple
+import numpy as np
+from .core.status import OK, flag_mask
+from .registry import registry
+
+class Candidate(NamedTuple):
+    type: Enum
+    material: Enum | None
+
+@dataclass(frozen=True)
+class SelectionResult:
+    '''
+    Cheapest in-range candidates of each row, cheapest first. index points
+    into candidates; rows with fewer than k in-range candidates are padded
+    with index -1 and a NaN value.
+    '''
+    candidates: tuple[Candidate, ...]
+    index: np.ndarray
+    value: np.ndarray
+    CEPCI: float
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def ranking(self, row: int) -> list[tuple[Candidate, float]]:
+        '''
+        row (-) - Row of the selection\n
+        return ($) - In-range candidates of the row with their cost, cheapest first
+        '''
+        return [(self.candidates[i], float(value)) for i, value in zip(self.index[row], self.value[row]) if i >= 0]
+
+class ConfigurationSelector:
+    '''
+    Ranks every valid (type, material) pair of one or more equipment classes
+    by cost, for arrays of sizes. Valid pairs come from the registry.
+
+    Each bare module correlation is affine in the material factor, so every
+    type is evaluated for at most two materials; the cost of its other
+    materials follows from the registry factors without further calls.
+    '''
+    def __init__(self, equipment: type | tuple[type, ...], method: str = 'bare_module', **options) -> None:
+        '''
+        equipment (-) - Equipment class, or classes sharing the unit of their size, e.g. (PumpCost, CompressorCost)\n
+        method (-) - 'purchased' or 'bare_module'\n
+        options (-) - Constructor options applied where accepted, e.g. tube_only=False
+        '''
+        if method not in ('purchased', 'bare_module'):
+            raise Exception(f"Invalid method ({method})")
+        self._method = method
+        self._groups: list[tuple[type, Enum, list[Enum | None], dict]] = []
+        candidates = []
+        classes = equipment if isinstance(equipment, tuple) else (equipment,)
+        unknown = set(options) - {name for cls in classes for name in inspect.signature(cls).parameters}
+        if unknown:
+            raise Exception(f"Unknown options ({', '.join(sorted(unknown))})")
+        for cls in classes:
+            accepted = {key: value for key, value in options.items() if key in inspect.signature(cls).parameters}
+            for type in cls.Type:
+                materials = [None]
+                if hasattr(cls, 'Material'):
+                    type_id = registry.type_id(type)
+                    materials = [material for material in cls.Material if registry.is_valid(type_id, registry.material_id(material))]
+                self._groups.append((cls, type, materials, accepted))
+                candidates += [Candidate(type, material) for material in materials]
+        self._candidates = tuple(candidates)
+
+    @property
+    def candidates(self) -> tuple[Candidate, ...]:
+        return self._candidates
+
+    def _inputs(self, cls: type, inputs: dict) -> dict:
+        parameters = list(inspect.signature(getattr(cls, self._method)).parameters)[2:]
+        arguments = {key: value for key, value in inputs.items() if key in parameters}
+        missing = [name for name in parameters if name not in arguments
+                   and inspect.signature(getattr(cls, self._method)).parameters[name].default is inspect.Parameter.empty]
+        if missing:
+            raise Exception(f"Missing inputs for {cls.__name__}.{self._method} ({', '.join(missing)})")
+        return arguments
+
+    def costs(self, size, CEPCI: float = 397, **inputs) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        size (-) - Array of sizes (duty, area, power...)\n
+        CEPCI (-) - Chemical plant cost index\n
+        inputs (-) - Other cost arguments, scalars or arrays aligned with size\n
+        return ($) - Cost of every row and candidate, and the CostStatus bits of each, shaped (rows, candidates)
+        '''
+        size = np.atleast_1d(np.asarray(size, dtype=float))
+        used = set()
+        # Candidate-major buffers, so that each candidate writes a contiguous row.
+        value = np.empty((len(self._candidates), len(size)))
+        code = np.empty(value.shape, dtype=np.uint8)
+        column = 0
+        for cls, type, materials, options in self._groups:
+            arguments = self._inputs(cls, inputs)
+            used |= set(arguments)
+            evaluate = lambda material: getattr(cls(type, **options) if material is None else cls(type, material, **options),
+                                                self._method + '_many')(size, **arguments, CEPCI=CEPCI)
+            factors = np.array([registry.material_factor(registry.type_id(type), registry.material_id(material)) if material else 0.0
+                                for material in materials])
+            block = slice(column, column + len(materials))
+            first = evaluate(materials[0])
+            code[block] = first.code
+            value[block] = first.value
+            other = np.flatnonzero(factors != factors[0])
+            if len(other):
+                slope = (evaluate(materials[other[0]]).value - first.value)/(factors[other[0]] - factors[0])
+                value[column + 1:block.stop] += slope*(factors[1:, None] - factors[0])
+            column += len(materials)
+        unknown = set(inputs) - used
+        if unknown:
+            raise Exception(f"Unknown inputs ({', '.join(unknown)})")
+        return value.T, code.T
+
+    def select(self, size, k: int = 3, CEPCI: float = 397, **inputs) -> SelectionResult:
+        '''
+        size (-) - Array of sizes (duty, area, power...)\n
+        k (-) - Number of candidates to keep per row\n
+        CEPCI (-) - Chemical plant cost index\n
+        inputs (-) - Other cost arguments, scalars or arrays aligned with size\n
+        return ($) - Top-k cheapest candidates of each row whose size and pressure are within the correlation ranges
+        '''
+        if k <= 0:
+            raise Exception(f"k must be positive ({k})")
+        value, code = self.costs(size, CEPCI, **inputs)
+        ranked = np.where(flag_mask(code, OK) & ~np.isnan(value), value, np.inf)
+        k = min(k, ranked.shape[1])
+        index = np.argpartition(ranked, k - 1, axis=1)[:, :k] if k < ranked.shape[1] else np.tile(np.arange(k), (len(ranked), 1))
+        cost = np.take_along_axis(ranked, index, axis=1)
+        order = np.argsort(cost, axis=1, kind='stable')
+        index, cost = np.take_along_axis(index, order, axis=1), np.take_along_axis(cost, order, axis=1)
+        missing = np.isinf(cost)
+        return SelectionResult(candidates=self._candidates,
+                               index=np.where(missing, -1, index),
+                               value=np.where(missing, np.nan, cost),
+                               CEPCI=CEPCI)
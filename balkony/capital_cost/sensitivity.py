@@ -0,0 +1,146 @@
+import time
+from dataclasses import dataclass
+from typing import NamedTuple
+import numpy as np
+from .distributions import Fixed
+from .monte_carlo import MonteCarlo
+
+class TornadoBar(NamedTuple):
+    item: str
+    input: str
+    low: float
+    high: float
+    low_cost: float
+    high_cost: float
+
+    @property
+    def swing(self) -> float:
+        return abs(self.high_cost - self.low_cost)
+
+@dataclass(frozen=True)
+class TornadoResult:
+    '''
+    One-at-a-time sensitivity of the total cost. bars are sorted by swing,
+    largest first.
+    '''
+    base: float
+    bars: list[TornadoBar]
+    evaluations: int
+    seconds: float
+
+    @property
+    def seconds_per_evaluation(self) -> float:
+        return self.seconds/self.evaluations
+
+@dataclass(frozen=True)
+class SobolResult:
+    '''
+    Variance-based sensitivity of the total cost. first and total hold the
+    first-order and total-effect indices of each factor, in factors order.
+    '''
+    factors: list[tuple[str, ...]]
+    first: np.ndarray
+    total: np.ndarray
+    variance: float
+    evaluations: int
+    seconds: float
+
+    @property
+    def seconds_per_evaluation(self) -> float:
+        return self.seconds/self.evaluations
+
+    def ranking(self) -> list[tuple[tuple[str, ...], float]]:
+        '''
+        return (-) - Factors with their total-effect index, largest first
+        '''
+        order = np.argsort(-self.total)
+        return [(self.factors[i], float(self.total[i])) for i in order]
+
+class Sensitivity:
+    '''
+    Tornado and Sobol analyses of the total cost of a MonteCarlo model. The
+    factors are the inputs and coefficient perturbations that are not Fixed.
+
+    Every evaluation is a full plant total, but since the total is a sum of
+    item costs only the items touched by a factor are re-costed: a Sobol run
+    with N samples and G factor groups costs N*(items + G) item rows for
+    N*(G + 2) evaluations.
+    '''
+    def __init__(self, model: MonteCarlo) -> None:
+        self._model = model
+        self._factors = [(name, key) for name, item in model.items.items()
+                         for key, distribution in [*item.inputs.items(), *item.coefficients.items()]
+                         if not isinstance(distribution, Fixed)]
+        if not self._factors:
+            raise Exception("No uncertain inputs to analyse")
+
+    @property
+    def factors(self) -> list[tuple[str, str]]:
+        return list(self._factors)
+
+    def _distribution(self, name: str, key: str):
+        item = self._model.items[name]
+        return item.inputs[key] if key in item.inputs else item.coefficients[key]
+
+    def _costs(self, samples: dict[str, dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
+        return {name: result.value for name, result in self._model.cost(samples).items()}
+
+    def tornado(self, low: float = 0.1, high: float = 0.9) -> TornadoResult:
+        '''
+        low (-) - Quantile of the low end of each bar\n
+        high (-) - Quantile of the high end of each bar\n
+        return ($) - Total cost with all inputs at their median, and with each factor at its low and high quantile
+        '''
+        start = time.perf_counter()
+        rows = 1 + 2*len(self._factors)
+        samples = {name: {key: np.full(rows, distribution.ppf(0.5))
+                          for key, distribution in [*item.inputs.items(), *item.coefficients.items()]}
+                   for name, item in self._model.items.items()}
+        for i, (name, key) in enumerate(self._factors):
+            distribution = self._distribution(name, key)
+            samples[name][key][1 + 2*i:3 + 2*i] = distribution.ppf(low), distribution.ppf(high)
+        total = sum(self._costs(samples).values())
+        bars = [TornadoBar(name, key, *(float(value) for value in (samples[name][key][1 + 2*i], samples[name][key][2 + 2*i],
+                                                                   total[1 + 2*i], total[2 + 2*i])))
+                for i, (name, key) in enumerate(self._factors)]
+        return TornadoResult(base=float(total[0]),
+                             bars=sorted(bars, key=lambda bar: -bar.swing),
+                             evaluations=rows,
+                             seconds=time.perf_counter() - start)
+
+    def sobol(self, samples: int = 1024, seed: int = 0, by: str = 'input') -> SobolResult:
+        '''
+        samples (-) - Base sample size N\n
+        seed (-) - Seed of the A and B sample matrices\n
+        by (-) - 'input' for one factor per uncertain input, 'item' to group the inputs of each item\n
+        return (-) - First-order (Saltelli 2010) and total-effect (Jansen 1999) indices
+        '''
+        if by not in ('input', 'item'):
+            raise Exception(f"Invalid grouping ({by})")
+        start = time.perf_counter()
+        groups: dict[tuple[str, ...], list[tuple[str, str]]] = {}
+        for name, key in self._factors:
+            groups.setdefault((name, key) if by == 'input' else (name,), []).append((name, key))
+        rng = np.random.default_rng(seed)
+        A, B = self._model.sample(rng, samples), self._model.sample(rng, samples)
+        costs_A = self._costs(A)
+        fA, fB = sum(costs_A.values()), sum(self._costs(B).values())
+        variance = float(np.nanvar(np.concatenate([fA, fB]), ddof=1))
+        # Centering f(B) leaves the first-order estimator unbiased and
+        # removes the noise of the large mean plant cost.
+        centered = fB - np.nanmean(np.concatenate([fA, fB]))
+        first, total = [], []
+        for factors in groups.values():
+            names = list(dict.fromkeys(name for name, _ in factors))
+            AB = {name: dict(A[name]) for name in names}
+            for name, key in factors:
+                AB[name][key] = B[name][key]
+            fAB = fA + sum(cost - costs_A[name] for name, cost in self._costs(AB).items())
+            first.append(np.nanmean(centered*(fAB - fA))/variance)
+            total.append(0.5*np.nanmean((fA - fAB)**2)/variance)
+        return SobolResult(factors=list(groups),
+                           first=np.array(first),
+                           total=np.array(total),
+                           variance=variance,
+                           evaluations=samples*(len(groups) + 2),
+                           seconds=time.perf_counter() - start)
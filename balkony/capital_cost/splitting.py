@@ -0,0 +1,107 @@
+import inspect
+from dataclasses import dataclass
+import numpy as np
+from .core import EquipmentCostBatchResult, EquipmentCostResult
+
+@dataclass(frozen=True)
+class SplitResult:
+    '''
+    Cost of units identical parallel units of unit_size each. result holds
+    their total cost and the status of one unit.
+    '''
+    units: int
+    unit_size: float
+    result: EquipmentCostResult
+
+    @property
+    def value(self) -> float:
+        return self.result.value
+
+@dataclass(frozen=True)
+class SplitBatchResult:
+    '''
+    Columnar counterpart of SplitResult.
+    '''
+    units: np.ndarray
+    unit_size: np.ndarray
+    result: EquipmentCostBatchResult
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    @property
+    def value(self) -> np.ndarray:
+        return self.result.value
+
+    def split(self, index: int) -> SplitResult:
+        '''
+        index (-) - Row of the batch\n
+        return - Scalar result of the row
+        '''
+        return SplitResult(units=int(self.units[index]), unit_size=float(self.unit_size[index]), result=self.result.result(index))
+
+def _candidates(equipment, size: np.ndarray, max_units: int | None) -> np.ndarray:
+    K1, K2, K3 = equipment.properties.data
+    with np.errstate(divide='ignore', invalid='ignore'):
+        low = np.maximum(np.ceil(size/equipment.properties.max_size), 1)
+        high = np.floor(size/equipment.properties.min_size)
+        if max_units is not None:
+            high = np.minimum(high, max_units)
+        feasible = low <= high
+        fallback = low if max_units is None else np.minimum(low, max_units)
+        candidates = [low, high]
+        if K3 > 0:
+            # log(N*Cp0(S/N)) is a convex parabola in log N, with its minimum
+            # at the unit size 10^((1 - K2)/(2 K3)) whatever S.
+            optimum = size/10**((1 - K2)/(2*K3))
+            candidates += [np.floor(optimum), np.ceil(optimum)]
+        candidates = np.stack([np.clip(candidate, low, high) for candidate in candidates])
+    return np.where(feasible & np.isfinite(size) & (size > 0), candidates, np.where(np.isfinite(fallback), fallback, 1))
+
+def split_many(estimator, method: str = 'bare_module', max_units: int | None = None, **inputs) -> SplitBatchResult:
+    '''
+    estimator (-) - Equipment cost object, e.g. CompressorCost(CompressorCost.Type.Centrifugal)\n
+    method (-) - 'purchased' or 'bare_module'\n
+    max_units (-) - Largest number of parallel units, unbounded by default\n
+    inputs (-) - Arguments of the *_many cost method ('size' stands for the first one); the size is the total
+    capacity, every other input applies to each unit\n
+    return ($) - For each row, the number of units with the lowest total cost among those that bring each unit
+    into the size range, and that total. Rows that no split brings into range keep the fewest units that
+    could, and their range flags
+    '''
+    if method not in ('purchased', 'bare_module'):
+        raise Exception(f"Invalid method ({method})")
+    if max_units is not None and max_units < 1:
+        raise Exception(f"max_units must be positive ({max_units})")
+    names = list(inspect.signature(getattr(estimator, method)).parameters)
+    if 'size' in inputs:
+        inputs[names[0]] = inputs.pop('size')
+    if names[0] not in inputs:
+        raise Exception(f"Missing size ({names[0]})")
+    size = np.asarray(inputs.pop(names[0]), dtype=float)
+    candidates = _candidates(estimator.equipment, size, max_units)
+    unit = getattr(estimator, method + '_many')(size/candidates, **inputs)
+    total = candidates*unit.value
+    choice = np.argmin(np.where(np.isnan(total), np.inf, total), axis=0)[None]
+    pick = lambda array: np.take_along_axis(np.broadcast_to(array, candidates.shape), choice, axis=0)[0]
+    units = pick(candidates)
+    return SplitBatchResult(units=units.astype(np.int64),
+                            unit_size=size/units,
+                            result=EquipmentCostBatchResult(code=pick(unit.code),
+                                                            checks=unit.checks,
+                                                            CEPCI=unit.CEPCI if unit.CEPCI.ndim == 0 else pick(unit.CEPCI),
+                                                            value=pick(total)))
+
+def split(estimator, method: str = 'bare_module', max_units: int | None = None, **inputs) -> SplitResult:
+    '''
+    estimator (-) - Equipment cost object, e.g. CompressorCost(CompressorCost.Type.Centrifugal)\n
+    method (-) - 'purchased' or 'bare_module'\n
+    max_units (-) - Largest number of parallel units, unbounded by default\n
+    inputs (-) - Arguments of the cost method ('size' stands for the first one)\n
+    return ($) - Lowest-cost number of in-range parallel units and their total cost
+    '''
+    key = 'size' if 'size' in inputs else next(iter(inspect.signature(getattr(estimator, method)).parameters))
+    if key not in inputs:
+        raise Exception(f"Missing size ({key})")
+    inputs[key] = [inputs[key]]
+    return split_many(estimator, method, max_units, **inputs).split(0)
@@ -0,0 +1,160 @@
+import math
+from typing import Iterable
+import numpy as np
+from .core import EquipmentCostBatchResult, EquipmentCostResult, EquipmentCostResultArray
+
+def _values(data) -> np.ndarray:
+    '''
+    data (-) - EquipmentCostResult, batch or array of results, or numbers\n
+    return (-) - Finite values of data, flattened
+    '''
+    if isinstance(data, (EquipmentCostResult, EquipmentCostBatchResult, EquipmentCostResultArray)):
+        data = data.value
+    elif isinstance(data, Iterable) and not hasattr(data, '__array__'):
+        data = [item.value if isinstance(item, EquipmentCostResult) else item for item in data]
+    values = np.asarray(data, dtype=float).ravel()
+    return values[np.isfinite(values)]
+
+class MomentAccumulator:
+    '''
+    Streaming count, mean, variance, min and max. Blocks are folded in with
+    the pairwise update of Chan et al., so accumulators built on separate
+    parts of a stream merge into the statistics of the whole stream (up to
+    floating point rounding). Non-finite values are skipped.
+    '''
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max')
+
+    def __init__(self) -> None:
+        self.count, self.mean, self.m2 = 0, 0.0, 0.0
+        self.min, self.max = math.inf, -math.inf
+
+    def update(self, data) -> 'MomentAccumulator':
+        '''
+        data (-) - EquipmentCostResult, batch or array of results, or numbers\n
+        return (-) - The accumulator itself
+        '''
+        values = _values(data)
+        if len(values):
+            block = MomentAccumulator()
+            block.count, block.mean = len(values), float(values.mean())
+            block.m2 = float(((values - block.mean)**2).sum())
+            block.min, block.max = float(values.min()), float(values.max())
+            self.merge(block)
+        return self
+
+    def merge(self, other: 'MomentAccumulator') -> 'MomentAccumulator':
+        if other.count:
+            total = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta*other.count/total
+            self.m2 += other.m2 + delta**2*self.count*other.count/total
+            self.count = total
+            self.min, self.max = min(self.min, other.min), max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> float:
+        return self.m2/(self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+class QuantileAccumulator:
+    '''
+    Streaming quantiles with a log-binned sketch (DDSketch, Masson et al.
+    2019). Positive values v fall in bin ceil(log_gamma(v)), with gamma =
+    (1 + alpha)/(1 - alpha); negative values in a mirrored set of bins. Any
+    returned quantile is within relative error alpha of a true sample
+    quantile of the same rank. Merging adds bin counts, so it is exact: the
+    merged sketch equals the sketch of the combined stream.
+    '''
+    __slots__ = ('_alpha', '_log_gamma', '_positive', '_negative', '_zeros', 'count', 'min', 'max')
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise Exception(f"Relative accuracy must be in (0, 1) ({relative_accuracy})")
+        self._alpha = relative_accuracy
+        self._log_gamma = math.log((1 + relative_accuracy)/(1 - relative_accuracy))
+        self._positive: tuple[int, np.ndarray] = (0, np.zeros(0, dtype=np.int64))
+        self._negative: tuple[int, np.ndarray] = (0, np.zeros(0, dtype=np.int64))
+        self._zeros = 0
+        self.count = 0
+        self.min, self.max = math.inf, -math.inf
+
+    @property
+    def relative_accuracy(self) -> float:
+        return self._alpha
+
+    @staticmethod
+    def _add(store: tuple[int, np.ndarray], offset: int, counts: np.ndarray) -> tuple[int, np.ndarray]:
+        if not len(counts):
+            return store
+        start, bins = store
+        if not len(bins):
+            return offset, counts.copy()
+        low, high = min(start, offset), max(start + len(bins), offset + len(counts))
+        merged = np.zeros(high - low, dtype=np.int64)
+        merged[start - low:start - low + len(bins)] += bins
+        merged[offset - low:offset - low + len(counts)] += counts
+        return low, merged
+
+    def _bin(self, values: np.ndarray) -> tuple[int, np.ndarray]:
+        if not len(values):
+            return 0, np.zeros(0, dtype=np.int64)
+        keys = np.ceil(np.log(values)/self._log_gamma).astype(np.int64)
+        offset = int(keys.min())
+        return offset, np.bincount(keys - offset)
+
+    def update(self, data) -> 'QuantileAccumulator':
+        '''
+        data (-) - EquipmentCostResult, batch or array of results, or numbers\n
+        return (-) - The accumulator itself
+        '''
+        values = _values(data)
+        if len(values):
+            self._positive = self._add(self._positive, *self._bin(values[values > 0]))
+            self._negative = self._add(self._negative, *self._bin(-values[values < 0]))
+            self._zeros += int(np.count_nonzero(values == 0))
+            self.count += len(values)
+            self.min, self.max = min(self.min, float(values.min())), max(self.max, float(values.max()))
+        return self
+
+    def merge(self, other: 'QuantileAccumulator') -> 'QuantileAccumulator':
+        if other._alpha != self._alpha:
+            raise Exception(f"Cannot merge sketches of different accuracy ({self._alpha}, {other._alpha})")
+        self._positive = self._add(self._positive, *other._positive)
+        self._negative = self._add(self._negative, *other._negative)
+        self._zeros += other._zeros
+        self.count += other.count
+        self.min, self.max = min(self.min, other.min), max(self.max, other.max)
+        return self
+
+    def _value(self, key: int) -> float:
+        return 2*math.exp(key*self._log_gamma)/(1 + math.exp(self._log_gamma))
+
+    def quantile(self, q: float) -> float:
+        '''
+        q (-) - Quantile, between 0 and 1\n
+        return (-) - Estimated q-quantile (NaN for an empty accumulator)
+        '''
+        if not 0 <= q <= 1:
+            raise Exception(f"Quantile must be between 0 and 1 ({q})")
+        if not self.count:
+            return math.nan
+        rank = q*(self.count - 1)
+        start, bins = self._negative
+        negatives = int(bins.sum())
+        if rank < negatives:
+            index = int(np.searchsorted(np.cumsum(bins[::-1]), rank, side='right'))
+            value = -self._value(start + len(bins) - 1 - index)
+        elif rank < negatives + self._zeros:
+            value = 0.0
+        else:
+            start, bins = self._positive
+            index = int(np.searchsorted(np.cumsum(bins), rank - negatives - self._zeros, side='right'))
+            value = self._value(start + index)
+        return min(max(value, self.min), self.max)
+
+    def quantiles(self, qs: Iterable[float]) -> list[float]:
+        return [self.quantile(q) for q in qs]
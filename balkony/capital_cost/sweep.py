@@ -0,0 +1,154 @@
+import inspect
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Tuple
+import numpy as np
+from .core import EquipmentCostBatchResult
+from .core.status import INVALID_INPUT, MASKS, SIZE_CHECK
+from .registry import registry
+
+@dataclass(frozen=True)
+class SweepResult:
+    '''
+    Labeled N-D cost array. dims names the axes of value and code in order,
+    and coords holds the labels along each of them (Type or Material members,
+    or input values).
+    '''
+    dims: tuple[str, ...]
+    coords: dict[str, tuple | np.ndarray]
+    code: np.ndarray
+    value: np.ndarray
+    CEPCI: float
+    checks: Tuple[str, ...]
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.value.shape
+
+    @property
+    def batch(self) -> EquipmentCostBatchResult:
+        '''
+        return ($) - Costs of the grid as a batch result of the same shape, for status, has and count
+        '''
+        return EquipmentCostBatchResult(code=self.code, checks=self.checks, CEPCI=np.asarray(self.CEPCI), value=self.value)
+
+    def index(self, dim: str, label) -> int:
+        '''
+        dim (-) - Name of an axis\n
+        label (-) - Label along the axis; Type and Material members can also be given by name\n
+        return (-) - Position of the label on the axis
+        '''
+        if dim not in self.dims:
+            raise Exception(f"Unknown axis ({dim})")
+        coords = self.coords[dim]
+        if isinstance(coords, tuple):
+            names = [coord.name for coord in coords]
+            if label in coords:
+                return coords.index(label)
+            if label in names:
+                return names.index(label)
+        else:
+            match = np.flatnonzero(coords == label)
+            if len(match):
+                return int(match[0])
+        raise Exception(f"Label {label} not found on axis {dim}")
+
+    def sel(self, **labels) -> 'SweepResult':
+        '''
+        labels (-) - One label per axis to select, e.g. material='StainlessSteel', pressure=10.0\n
+        return ($) - Sub-grid without the selected axes
+        '''
+        index = tuple(self.index(dim, labels[dim]) if dim in labels else slice(None) for dim in self.dims)
+        unknown = set(labels) - set(self.dims)
+        if unknown:
+            raise Exception(f"Unknown axes ({', '.join(unknown)})")
+        dims = tuple(dim for dim in self.dims if dim not in labels)
+        return SweepResult(dims=dims,
+                           coords={dim: self.coords[dim] for dim in dims},
+                           code=self.code[index],
+                           value=self.value[index],
+                           CEPCI=self.CEPCI,
+                           checks=self.checks)
+
+def _is_axis(value) -> bool:
+    return isinstance(value, (list, tuple, range, np.ndarray))
+
+def _labels(enum: type, value) -> tuple[list[Enum], bool]:
+    labels = list(value) if _is_axis(value) else [value]
+    return [enum[label] if isinstance(label, str) else label for label in labels], _is_axis(value)
+
+def sweep(equipment: type, method: str = 'bare_module', CEPCI: float = 397, **axes: Any) -> SweepResult:
+    '''
+    equipment (-) - Equipment class, e.g. HeatExchangerCost\n
+    method (-) - 'purchased' or 'bare_module'\n
+    CEPCI (-) - Chemical plant cost index\n
+    axes (-) - 'type', 'material', 'size' (the first cost argument) and the other cost arguments; sequences
+    become axes of the grid and scalars stay fixed. type and material default to every member. Constructor
+    options such as tube_only or struct are fixed as well\n
+    return ($) - Costs of the cartesian product of the axes, ordered as type, material, size and the other
+    arguments in signature order. Invalid type/material pairs are NaN and flagged INVALID_INPUT
+    '''
+    if method not in ('purchased', 'bare_module'):
+        raise Exception(f"Invalid method ({method})")
+    parameters = [name for name in inspect.signature(getattr(equipment, method)).parameters if name not in ('self', 'CEPCI')]
+    if 'size' in axes:
+        axes[parameters[0]] = axes.pop('size')
+    if parameters[0] not in axes:
+        raise Exception(f"Missing size axis ({parameters[0]})")
+    types, type_axis = _labels(equipment.Type, axes.pop('type', tuple(equipment.Type)))
+    materials, material_axis = [None], False
+    if hasattr(equipment, 'Material'):
+        materials, material_axis = _labels(equipment.Material, axes.pop('material', tuple(equipment.Material)))
+    options = {key: axes.pop(key) for key in list(axes) if key not in parameters}
+    unknown = set(options) - set(inspect.signature(equipment).parameters)
+    if unknown:
+        raise Exception(f"Unknown inputs for {equipment.__name__} ({', '.join(unknown)})")
+
+    dims, coords = [], {}
+    for dim, labels, is_axis in (('type', types, type_axis), ('material', materials, material_axis)):
+        if is_axis:
+            dims.append(dim)
+            coords[dim] = tuple(labels)
+    inputs = {}
+    for name in parameters:
+        if name in axes:
+            inputs[name] = np.asarray(axes[name], dtype=float)
+            if _is_axis(axes[name]):
+                dims.append(name)
+                coords[name] = inputs[name].ravel()
+    sizes = inputs.pop(parameters[0]).ravel()
+    # Each other input varies along its own axis of the factor grid.
+    factor_dims = [name for name in inputs if name in coords]
+    for name in factor_dims:
+        shape = [1]*len(factor_dims)
+        shape[factor_dims.index(name)] = -1
+        inputs[name] = inputs[name].reshape(shape)
+    factor_shape = tuple(len(coords[name]) for name in factor_dims)
+    expand = (-1,) + (1,)*len(factor_shape)
+
+    value = np.full((len(types), len(materials), len(sizes)) + factor_shape, np.nan)
+    code = np.full(value.shape, INVALID_INPUT, dtype=np.uint8)
+    checks = SIZE_CHECK
+    for i, type in enumerate(types):
+        curve = None
+        for j, material in enumerate(materials):
+            if material is not None and not registry.is_valid(registry.type_id(type), registry.material_id(material)):
+                continue
+            estimator = equipment(type, **options) if material is None else equipment(type, material, **options)
+            if curve is None:
+                # Size only enters through Cp0: its curve is computed once per
+                # type and shared by every material and other input.
+                reference = type.value['min_size']
+                curve = estimator.equipment.cost_many(np.append(sizes, reference), CEPCI)
+            factor = getattr(estimator, method + '_many')(reference, **inputs, CEPCI=CEPCI)
+            checks = factor.checks
+            np.multiply(curve.value[:-1].reshape(expand), np.broadcast_to(factor.value/curve.value[-1], factor_shape), out=value[i, j])
+            np.bitwise_or(curve.code[:-1].reshape(expand), np.broadcast_to(factor.code & np.uint8(0xFF & ~MASKS['size']), factor_shape), out=code[i, j])
+
+    shape = tuple(len(coords[dim]) for dim in dims)
+    return SweepResult(dims=tuple(dims),
+                       coords=coords,
+                       code=code.reshape(shape),
+                       value=value.reshape(shape),
+                       CEPCI=CEPCI,
+                       checks=checks)
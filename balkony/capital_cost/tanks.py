@@ -1,8 +1,10 @@
+import numpy as np
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
+from .core.status import SIZE_PRESSURE_CHECK
 from .pressure import TankPressure
 
-class TankCost:
+class TankCost(metaclass=Interned):
     class Material(Enum):
         CarbonSteel = {'APIFixedRoof': 1.0, 'APIFloatingRoof': 1.0}
         StainlessSteelClad = {'APIFixedRoof': 1.75, 'APIFloatingRoof': 1.75}
@@ -26,6 +28,22 @@ class TankCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
+    @property
+    def material(self) -> Material:
+        return self._material
+
+    @property
+    def pressure(self) -> TankPressure:
+        return self._pressure
+
     def purchased(self, volume: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             volume (m3) - Volume of tank\n
@@ -46,6 +64,31 @@ class TankCost:
         B1 = self._type.value['B1']
         B2 = self._type.value['B1']
         cp0 = self._equipment.cost(volume, CEPCI)
-        return EquipmentCostResult(status= {'size': cp0.status['size'], 'pressure': Fp.status},
+        return EquipmentCostResult(code= cp0.code | Fp.code, checks= SIZE_PRESSURE_CHECK,
                                    CEPCI= CEPCI,
                                    value= cp0.value*(B1 + B2*Fm*Fp.value))
+
+    def purchased_many(self, volume, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            volume (m3) - Volume of tank\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(volume, CEPCI)
+
+    def bare_module_many(self, volume, pressure, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            volume (m3) - Volume of tank\n
+            pressure (barg) - Operating pressure\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        Fm = self._material.value[self._type.name]
+        Fp = self._pressure.factor_many(pressure)
+        B1 = self._type.value['B1']
+        B2 = self._type.value['B1']
+        cp0 = self._equipment.cost_many(volume, CEPCI)
+        value = cp0.value*(B1 + B2*Fm*Fp.value)
+        return EquipmentCostBatchResult(code= np.broadcast_to(cp0.code | Fp.code, value.shape), checks= SIZE_PRESSURE_CHECK,
+                                        CEPCI= cp0.CEPCI,
+                                        value= value)
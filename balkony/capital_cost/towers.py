@@ -1,25 +1,10 @@
+import numpy as np
 from enum import Enum
-from dataclasses import dataclass
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned, Structure
 
-class TowerCost:
-    @dataclass(frozen=True)
-    class Structure:
-        max_stress: float = 944
-        min_thickness: float = 0.0063
-        corrosion_allowance: float = 0.00315
-        weld_efficiency: float = 0.9
+class TowerCost(metaclass=Interned):
+    Structure = Structure
 
-        def pressure_factor(self, pressure: float, diameter: float):
-            t = (pressure + 1)*diameter/(2*self.max_stress*self.weld_efficiency - 1.2*pressure) + self.corrosion_allowance
-            if pressure < -0.5:
-                return 1.25
-            else:
-                Fp = t/self.min_thickness
-                if Fp < 1.0:
-                    return 1.0
-                return Fp
-            
     class Material(Enum):
         CarbonSteel = 1.0
         StainlessSteelClad = 1.75
@@ -39,6 +24,22 @@ class TowerCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
+    @property
+    def material(self) -> Material:
+        return self._material
+
+    @property
+    def structure(self) -> Structure:
+        return self._structure
+
     def purchased(self, volume: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             volume (m3) - Volume of tower\n
@@ -61,6 +62,33 @@ class TowerCost:
         B2 = self._type.value['B1']
         FBM = B1 + B2*Fm*Fp
         cp0 = self._equipment.cost(volume, CEPCI)
-        return EquipmentCostResult(status= cp0.status,
+        return EquipmentCostResult(code= cp0.code,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM)
+
+    def purchased_many(self, volume, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            volume (m3) - Volume of tower\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(volume, CEPCI)
+
+    def bare_module_many(self, volume, pressure, diameter, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            volume (m3) - Volume of tower\n
+            pressure (barg) - Operating pressure\n
+            diameter (m) - diameter of tower\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        Fp = self._structure.pressure_factor_many(pressure, diameter)
+        Fm = self._material.value
+        B1 = self._type.value['B1']
+        B2 = self._type.value['B1']
+        FBM = B1 + B2*Fm*Fp
+        cp0 = self._equipment.cost_many(volume, CEPCI)
+        value = cp0.value*FBM
+        return EquipmentCostBatchResult(code= np.broadcast_to(cp0.code, value.shape),
+                                        CEPCI= cp0.CEPCI,
+                                        value= value)
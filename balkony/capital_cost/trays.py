@@ -1,8 +1,9 @@
 import math
+import numpy as np
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
 
-class TrayCost:
+class TrayCost(metaclass=Interned):
     class Material(Enum):
         CarbonSteel = {'Sieve': 1.05, 'Valve': 1.05, 'Demisters': 1.05}
         StainlessSteel = {'Sieve': 1.89, 'Valve': 1.89, 'Demisters': 1.05}
@@ -23,6 +24,30 @@ class TrayCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
+    @property
+    def material(self) -> Material:
+        return self._material
+
+    @staticmethod
+    def quantity_factor_derivative(num_trays):
+        '''
+        num_trays (-) - Number of trays, scalar or array\n
+        return (-) - Derivative of the quantity factor Fq, zero from 20 trays on where Fq is 1
+        '''
+        num_trays = np.asarray(num_trays, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_trays = np.log10(num_trays)
+            slope = (0.08516 - 2*0.3473*log_trays)/(num_trays*math.log(10))
+        return np.where(num_trays >= 20, 0.0, slope)
+
     def purchased(self, area: float, num_trays: int,  CEPCI: float = 397) -> EquipmentCostResult:
         """
             area (m2) - area of tray\n
@@ -31,7 +56,7 @@ class TrayCost:
             return ($) - Purchased cost of equipment
         """
         cp0 = self._equipment.cost(area, CEPCI)
-        return EquipmentCostResult(status= cp0.status,
+        return EquipmentCostResult(code= cp0.code,
                                    CEPCI= CEPCI,
                                    value= cp0.value*num_trays)       
 
@@ -48,6 +73,38 @@ class TrayCost:
             Fq = 0.4771 + 0.08516*(math.log10(num_trays)) - 0.3473*(math.log10(num_trays)**2)
         FBM = self._material.value[self._type.name]
         cp0 = self._equipment.cost(area, CEPCI)
-        return EquipmentCostResult(status= cp0.status,
+        return EquipmentCostResult(code= cp0.code,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM*Fq*num_trays)
+
+    def purchased_many(self, area, num_trays, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            area (m2) - area of tray\n
+            num_trays (-) - number of trays\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        num_trays = np.asarray(num_trays, dtype=float)
+        cp0 = self._equipment.cost_many(area, CEPCI)
+        value = cp0.value*num_trays
+        return EquipmentCostBatchResult(code= np.broadcast_to(cp0.code, value.shape),
+                                        CEPCI= cp0.CEPCI,
+                                        value= value)
+
+    def bare_module_many(self, area, num_trays, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            area (m2) - area of tray\n
+            num_trays (-) - number of trays\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        num_trays = np.asarray(num_trays, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_trays = np.log10(num_trays)
+        Fq = np.where(num_trays >= 20, 1, 0.4771 + 0.08516*log_trays - 0.3473*(log_trays**2))
+        FBM = self._material.value[self._type.name]
+        cp0 = self._equipment.cost_many(area, CEPCI)
+        value = cp0.value*FBM*Fq*num_trays
+        return EquipmentCostBatchResult(code= np.broadcast_to(cp0.code, value.shape),
+                                        CEPCI= cp0.CEPCI,
+                                        value= value)
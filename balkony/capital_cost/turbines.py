@@ -1,7 +1,7 @@
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
 
-class TurbineCost:
+class TurbineCost(metaclass=Interned):
     class Material(Enum):
         CarbonSteel = {'AxialGas': 3.54, 'RadialGas': 3.54, 'RadialLiquid': 3.54}
         StainlessSteel = {'AxialGas': 6.16, 'RadialGas': 6.16, 'RadialLiquid': 6.16}
@@ -21,6 +21,18 @@ class TurbineCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
+    @property
+    def material(self) -> Material:
+        return self._material
+
     def purchased(self, power: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             power (kW) - Power of turbine\n
@@ -37,6 +49,26 @@ class TurbineCost:
         """
         FBM = self._material.value[self._type.name]
         cp0 = self._equipment.cost(power, CEPCI)
-        return EquipmentCostResult(status= cp0.status,
+        return EquipmentCostResult(code= cp0.code,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM)
+
+    def purchased_many(self, power, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            power (kW) - Power of turbine\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(power, CEPCI)
+
+    def bare_module_many(self, power, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            power (kW) - Power of turbine\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM = self._material.value[self._type.name]
+        cp0 = self._equipment.cost_many(power, CEPCI)
+        return EquipmentCostBatchResult(code= cp0.code,
+                                        CEPCI= cp0.CEPCI,
+                                        value= cp0.value*FBM)
@@ -1,8 +1,10 @@
+import numpy as np
 from enum import Enum
-from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult
+from .core import EquipmentProperties, EquipmentPurchased, EquipmentCostResult, EquipmentCostBatchResult, Interned
+from .core.status import SIZE_PRESSURE_CHECK
 from .pressure import VaporizerPressure
 
-class VaporizerCost:
+class VaporizerCost(metaclass=Interned):
     class Material(Enum):
         CarbonSteel = {'InternalCoils': 3.04, 'JacketedVessels': 2.73}
         Copper = {'InternalCoils': 3.83, 'JacketedVessels': 3.45}
@@ -29,6 +31,22 @@ class VaporizerCost:
                                                                  min_size=type.value['min_size'],
                                                                  max_size=type.value['max_size']))
 
+    @property
+    def equipment(self) -> EquipmentPurchased:
+        return self._equipment
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
+    @property
+    def material(self) -> Material:
+        return self._material
+
+    @property
+    def pressure(self) -> VaporizerPressure:
+        return self._pressure
+
     def purchased(self, volume: float, CEPCI: float = 397) -> EquipmentCostResult:
         """
             volume (m3) - Gas volume of vaporizer\n
@@ -47,6 +65,29 @@ class VaporizerCost:
         FBM = self._material.value[self._type.name]
         Fp = self._pressure.factor(pressure)
         cp0 = self._equipment.cost(volume, CEPCI)
-        return EquipmentCostResult(status= {'size': cp0.status['size'], 'pressure': Fp.status},
+        return EquipmentCostResult(code= cp0.code | Fp.code, checks= SIZE_PRESSURE_CHECK,
                                    CEPCI= CEPCI,
                                    value= cp0.value*FBM*Fp.value)
+
+    def purchased_many(self, volume, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            volume (m3) - Gas volume of vaporizer\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Purchased cost of equipment for each row
+        """
+        return self._equipment.cost_many(volume, CEPCI)
+
+    def bare_module_many(self, volume, pressure, CEPCI = 397) -> EquipmentCostBatchResult:
+        """
+            volume (m3) - Volume of vaporizer\n
+            pressure (barg) - Operating pressure\n
+            CEPCI (-) - Chemical plant cost indexes\n
+            return ($) - Bare module cost (Direct and indirect costs) for each row
+        """
+        FBM = self._material.value[self._type.name]
+        Fp = self._pressure.factor_many(pressure)
+        cp0 = self._equipment.cost_many(volume, CEPCI)
+        value = cp0.value*FBM*Fp.value
+        return EquipmentCostBatchResult(code= np.broadcast_to(cp0.code | Fp.code, value.shape), checks= SIZE_PRESSURE_CHECK,
+                                        CEPCI= cp0.CEPCI,
+                                        value= value)
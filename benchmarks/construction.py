@@ -0,0 +1,40 @@
+'''
+Construction cost of the equipment estimators, with and without interning.
+
+    python -m benchmarks.construction
+'''
+import timeit
+from contextlib import contextmanager
+from balkony.capital_cost import FanCost, HeatExchangerCost, PumpCost, VesselCost
+from balkony.capital_cost.core import Interned
+
+CASES = {
+    'PumpCost': lambda: PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.StainlessSteel),
+    'HeatExchangerCost': lambda: HeatExchangerCost(HeatExchangerCost.Type.FixedTube, tube_only=False),
+    'FanCost': lambda: FanCost(FanCost.Type.AxialVane),
+    'VesselCost': lambda: VesselCost(VesselCost.Type.Vertical, VesselCost.Material.NiAlloy),
+}
+
+@contextmanager
+def uncached():
+    '''
+    Disables interning, so every call builds the estimator and its pressure
+    objects from scratch as before.
+    '''
+    call = Interned.__call__
+    Interned.__call__ = type.__call__
+    try:
+        yield
+    finally:
+        Interned.__call__ = call
+
+def main(number: int = 20000) -> None:
+    print(f"{'estimator':<20}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+    for name, build in CASES.items():
+        with uncached():
+            before = timeit.timeit(build, number=number)/number*1e6
+        after = timeit.timeit(build, number=number)/number*1e6
+        print(f"{name:<20}{before:>14.2f}{after:>14.2f}{before/after:>9.1f}x")
+
+if __name__ == '__main__':
+    main()
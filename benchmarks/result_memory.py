@@ -0,0 +1,48 @@
+'''
+Memory held per cost result, measured with tracemalloc.
+
+    python -m benchmarks.result_memory
+'''
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable
+from balkony.capital_cost import PumpCost
+from balkony.capital_cost.core import EquipmentCostResultArray
+
+@dataclass(frozen=True)
+class DictResult:
+    '''
+    Previous layout of EquipmentCostResult: an instance __dict__ plus a
+    status dict of message tuples per result.
+    '''
+    status: dict[str, tuple[str, bool]]
+    value: float
+    CEPCI: float
+
+def legacy(result) -> DictResult:
+    return DictResult(status=result.status,
+                      CEPCI=result.CEPCI,
+                      value=result.value)
+
+def measure(build: Callable[[], object], count: int) -> float:
+    tracemalloc.start()
+    held = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size/count
+
+def main(count: int = 100_000) -> None:
+    pump = PumpCost(PumpCost.Type.Centrifugal)
+    results = [pump.bare_module(1.0 + i % 500, 1.0 + i % 90) for i in range(count)]
+    cases = {
+        'dict status (before)': lambda: [legacy(pump.bare_module(1.0 + i % 500, 1.0 + i % 90)) for i in range(count)],
+        'slotted bitfield': lambda: [pump.bare_module(1.0 + i % 500, 1.0 + i % 90) for i in range(count)],
+        'EquipmentCostResultArray': lambda: EquipmentCostResultArray(results),
+    }
+    print(f"{'layout':<28}{'bytes/result':>14}")
+    for name, build in cases.items():
+        print(f"{name:<28}{measure(build, count):>14.1f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from balkony.capital_cost import (BlenderCost, CentrifugeCost, CompressorCost, ConveyorCost, CrystallizerCost, DriveCost,
+                                  DryerCost, DustCollectorCost, EvaporatorCost, FanCost, FilterCost, FurnanceCost,
+                                  HeatExchangerCost, HeaterCost, MixerCost, PackingCost, PumpCost, ReactorCost, ScreenCost,
+                                  TankCost, TowerCost, TrayCost, TurbineCost, VaporizerCost, VesselCost)
+
+TOLERANCE = 1e-9
+
+CASES = [
+    (BlenderCost(BlenderCost.Type.Kneader), {'volume': [0.1, 1.0, 5.0]}, {}),
+    (CentrifugeCost(CentrifugeCost.Type.Belt), {'area': [0.2, 10.0, 400.0]}, {}),
+    (CompressorCost(CompressorCost.Type.Rotary, CompressorCost.Material.NiAlloy), {'power': [10.0, 500.0, 1000.0]}, {}),
+    (ConveyorCost(ConveyorCost.Type.SolidBowl), {'diameter': [0.2, 1.0, 3.0]}, {}),
+    (CrystallizerCost(), {'volume': [1.0, 10.0, 40.0]}, {}),
+    (DriveCost(DriveCost.Type.GasTurbine), {'power': [5000.0, 10000.0, 30000.0]}, {}),
+    (DryerCost(DryerCost.Type.Drum), {'area': [0.1, 20.0, 60.0]}, {}),
+    (DustCollectorCost(DustCollectorCost.Type.Baghouse), {'volume': [0.05, 50.0, 400.0]}, {}),
+    (EvaporatorCost(EvaporatorCost.Type.LongTube, EvaporatorCost.Material.Titanium), {'area': [50.0, 500.0, 20000.0]}, {'pressure': [5.0, 50.0, 200.0]}),
+    (FanCost(FanCost.Type.AxialTube, FanCost.Material.NiAlloy), {'flowrate': [0.5, 50.0, 150.0]}, {'rise_pressure': [0.5, 2.0, 5.0]}),
+    (FilterCost(FilterCost.Type.Plate), {'area': [0.1, 40.0, 100.0]}, {}),
+    (FurnanceCost(FurnanceCost.Type.PyrolysisFurnace), {'duty': [2000.0, 50000.0, 200000.0]}, {'pressure': [5.0, 100.0, 300.0], 'deltaTemp': [0.0, 50.0, 100.0]}),
+    (HeatExchangerCost(HeatExchangerCost.Type.DoublePipe, HeatExchangerCost.Material.CS_SS), {'area': [0.5, 5.0, 20.0]}, {'pressure': [10.0, 60.0, 400.0]}),
+    (HeaterCost(HeaterCost.Type.SteamBoiler), {'duty': [1000.0, 5000.0, 10000.0]}, {'pressure': [5.0, 50.0, 150.0], 'deltaTemp': [0.0, 20.0, 80.0]}),
+    (MixerCost(MixerCost.Type.Propeller), {'power': [3.0, 100.0, 600.0]}, {}),
+    (PackingCost(material=PackingCost.Material.Ceramic), {'volume': [0.01, 10.0, 700.0]}, {}),
+    (PumpCost(PumpCost.Type.Reciprocating, PumpCost.Material.Titanium), {'power': [0.05, 50.0, 300.0]}, {'pressure': [5.0, 50.0, 150.0]}),
+    (ReactorCost(ReactorCost.Type.Fermenter), {'volume': [0.05, 10.0, 50.0]}, {}),
+    (ScreenCost(ScreenCost.Type.Stationary), {'area': [1.0, 5.0, 20.0]}, {}),
+    (TankCost(TankCost.Type.APIFloatingRoof, TankCost.Material.Titanium), {'volume': [500.0, 5000.0, 50000.0]}, {'pressure': [5.0, 50.0, 200.0]}),
+    (TowerCost(material=TowerCost.Material.NiAlloy), {'volume': [0.1, 50.0, 600.0]}, {'pressure': [-0.8, 1.0, 30.0], 'diameter': [1.0, 2.0, 4.0]}),
+    (TrayCost(TrayCost.Type.Sieve, TrayCost.Material.StainlessSteel), {'area': [0.05, 2.0, 15.0]}, {'num_trays': [5, 20, 40]}),
+    (TurbineCost(TurbineCost.Type.AxialGas), {'power': [50.0, 1000.0, 5000.0]}, {}),
+    (VaporizerCost(VaporizerCost.Type.JacketedVessels, VaporizerCost.Material.GlassNi), {'volume': [0.5, 50.0, 150.0]}, {'pressure': [2.0, 100.0, 400.0]}),
+    (VesselCost(VesselCost.Type.Horizontal, VesselCost.Material.StainlessSteel), {'volume': [0.05, 50.0, 700.0]}, {'pressure': [-0.8, 1.0, 30.0], 'diameter': [1.0, 2.0, 4.0]}),
+]
+
+def _row(inputs, i):
+    return {name: values[i] for name, values in inputs.items()}
+
+@pytest.mark.parametrize("equipment, sizes, extra", CASES)
+def test_purchased_many_matches_scalar(equipment, sizes, extra):
+    inputs = {**sizes, **({'num_trays': extra['num_trays']} if 'num_trays' in extra else {})}
+    batch = equipment.purchased_many(**inputs, CEPCI=600)
+
+    for i in range(3):
+        scalar = equipment.purchased(**_row(inputs, i), CEPCI=600)
+        assert abs(batch.value[i] - scalar.value) <= TOLERANCE*scalar.value
+        assert batch.result(i).status == scalar.status
+
+@pytest.mark.parametrize("equipment, sizes, extra", CASES)
+def test_bare_module_many_matches_scalar(equipment, sizes, extra):
+    inputs = {**sizes, **extra}
+    batch = equipment.bare_module_many(**{name: np.array(values) for name, values in inputs.items()})
+
+    assert len(batch) == 3
+    for i in range(3):
+        scalar = equipment.bare_module(**_row(inputs, i))
+        assert abs(batch.value[i] - scalar.value) <= TOLERANCE*scalar.value
+        assert batch.result(i).status == scalar.status
+
+def test_bare_module_many_broadcasts_scalar_pressure():
+    pump = PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.StainlessSteel)
+    batch = pump.bare_module_many(np.array([0.5, 10.0, 500.0]), 150.0)
+
+    assert batch.status['size'].tolist() == [1, 0, 2]
+    assert batch.status['pressure'].tolist() == [2, 2, 2]
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from balkony.capital_cost import DriveCost, HeatExchangerCost, PumpCost, TrayCost, VesselCost
+from balkony.capital_cost.budget import max_size, max_size_many
+from balkony.capital_cost.core import CostStatus
+
+TOLERANCE = 1e-9
+
+@pytest.mark.parametrize("estimator, budget, inputs", [
+    (HeatExchangerCost(HeatExchangerCost.Type.FixedTube, HeatExchangerCost.Material.StainlessSteel), 5e5, {'pressure': 30.0}),
+    (HeatExchangerCost(HeatExchangerCost.Type.FloatingHead), 2e5, {'pressure': 10.0}),
+    (PumpCost(PumpCost.Type.Centrifugal), 1e5, {'pressure': 20.0}),
+    (VesselCost(VesselCost.Type.Vertical), 2e5, {'pressure': 10.0, 'diameter': 2.0}),
+    (TrayCost(TrayCost.Type.Sieve), 2e4, {'num_trays': 12}),
+])
+def test_inverse_of_bare_module(estimator, budget, inputs):
+    result = max_size(estimator, budget, CEPCI=600, **inputs)
+
+    assert estimator.bare_module(result.size, **inputs, CEPCI=600).value == pytest.approx(budget, rel=TOLERANCE)
+    assert result.code == estimator.bare_module(result.size, **inputs, CEPCI=600).code
+
+def test_inverse_of_purchased():
+    sizes = np.geomspace(1.0, 1000.0, 50)
+    exchanger = HeatExchangerCost(HeatExchangerCost.Type.FixedTube)
+    result = max_size_many(exchanger, exchanger.purchased_many(sizes, 500).value, 'purchased', CEPCI=500)
+
+    vertex = 10**(0.303/(2*0.1634))
+    assert result.size[sizes > vertex] == pytest.approx(sizes[sizes > vertex], rel=TOLERANCE)
+    assert (result.size[sizes < vertex] > vertex).all()
+    assert (result.code[result.size < 10] == CostStatus.SIZE_BELOW).all()
+
+def test_branches():
+    exchanger = HeatExchangerCost(HeatExchangerCost.Type.FixedTube)
+    turbine = DriveCost(DriveCost.Type.GasTurbine)
+    peak = 10**(-13.2175/(2*-1.5279))
+
+    assert np.isnan(max_size(exchanger, 100.0, pressure=1.0).size)
+    assert max_size(exchanger, 100.0, pressure=1.0).code == CostStatus.INVALID_INPUT
+    assert max_size(turbine, 1e12).size == pytest.approx(peak, rel=TOLERANCE)
+    assert max_size(turbine, 1e12).code == CostStatus.OK
+
+def test_flags():
+    exchanger = HeatExchangerCost(HeatExchangerCost.Type.FixedTube)
+    batch = max_size_many(exchanger, [1e5, 1e8, -1.0, 1e5], pressure=[30.0, 30.0, 30.0, 500.0])
+
+    assert batch.code.tolist() == [CostStatus.OK, CostStatus.SIZE_ABOVE, CostStatus.INVALID_INPUT,
+                                   CostStatus.PRESSURE_ABOVE]
+    assert batch.result(1).status['size'] == ('Warning - Above maximum size', False)
+    with pytest.raises(Exception):
+        max_size(exchanger, 1e5, pressure=1.0, area=10.0)
+    with pytest.raises(Exception):
+        max_size(exchanger, 1e5, 'total_module', pressure=1.0)
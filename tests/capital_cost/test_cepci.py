@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from balkony.capital_cost import PumpCost, VesselCost
+from balkony.capital_cost.cepci import CEPCI_ANNUAL, cepci, escalate
+from balkony.capital_cost.plant import PlantCostModel
+
+TOLERANCE = 1e-9
+
+def test_annual_values():
+    assert cepci(2001) == 394.3
+    assert cepci(2019) == 607.5
+    assert cepci(np.array([1990, 2023])).tolist() == [357.6, 797.9]
+    assert len(CEPCI_ANNUAL) == 34
+
+def test_monthly_values_are_interpolated():
+    assert cepci(2019, 7) == pytest.approx(607.5 + (596.2 - 607.5)/24, rel=TOLERANCE)
+    assert cepci(2019, 6) == pytest.approx(603.1 + (607.5 - 603.1)*23/24, rel=TOLERANCE)
+    assert cepci(1990, 1) == 357.6
+    assert cepci(2023, 12) == 797.9
+    assert cepci([2019, 2019], [6, 7]).tolist() == pytest.approx([cepci(2019, 6), cepci(2019, 7)])
+
+@pytest.mark.parametrize("year, month", [(1989, None), (2024, None), (2020, 0), (2020, 13)])
+def test_out_of_table(year, month):
+    with pytest.raises(Exception):
+        cepci(year, month)
+
+def test_rescale_matches_reevaluation():
+    vessel = VesselCost(VesselCost.Type.Vertical, VesselCost.Material.StainlessSteel)
+    result = vessel.bare_module(30.0, 10.0, 2.0).rescale(cepci(2022))
+    expected = vessel.bare_module(30.0, 10.0, 2.0, cepci(2022))
+
+    assert result.CEPCI == expected.CEPCI
+    assert result.code == expected.code
+    assert result.value == pytest.approx(expected.value, rel=TOLERANCE)
+    assert escalate(vessel.purchased(30.0), 2022).value == pytest.approx(vessel.purchased(30.0, 816.0).value, rel=TOLERANCE)
+
+def test_batch_rescale_matches_reevaluation():
+    pump = PumpCost(PumpCost.Type.Centrifugal)
+    power, pressure = np.array([5.0, 50.0, 500.0]), np.array([1.0, 20.0, 40.0])
+    target = cepci(np.array([2004, 2014, 2023]))
+    batch = pump.bare_module_many(power, pressure, 500.0).rescale(target)
+
+    assert batch.value == pytest.approx(pump.bare_module_many(power, pressure, target).value, rel=TOLERANCE)
+    assert batch.CEPCI.tolist() == target.tolist()
+    assert batch.code.tolist() == pump.bare_module_many(power, pressure).code.tolist()
+
+def test_plant_cepci_change_rescales_items(monkeypatch):
+    plant = PlantCostModel()
+    plant.add('P-101', PumpCost(PumpCost.Type.Centrifugal), power=50.0, pressure=20.0)
+    plant.add('P-102', PumpCost(PumpCost.Type.Centrifugal), power=50.0, pressure=20.0, CEPCI=397)
+    before = plant.bare_module
+    monkeypatch.setattr(PlantCostModel, '_evaluate', lambda self, item: pytest.fail('re-evaluated'))
+
+    plant.CEPCI = cepci(2023)
+
+    assert plant.bare_module == pytest.approx(before/2*(1 + 797.9/397), rel=TOLERANCE)
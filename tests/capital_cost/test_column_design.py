@@ -0,0 +1,52 @@
+import math
+import numpy as np
+import pytest
+from balkony.capital_cost import ColumnCost, PackingCost, TrayCost
+from balkony.capital_cost.column_design import optimize_column, reflux_ratio
+from balkony.capital_cost.core import CostStatus
+
+TOLERANCE = 1e-9
+SPEC = {'pressure': 2.0, 'min_stages': 8.0, 'min_reflux': 1.2, 'distillate': 0.02, 'latent_heat': 30000.0, 'vapor_flux': 0.05}
+
+def test_reflux_ratio():
+    reflux = reflux_ratio([5.0, 8.0, 12.0, 20.0, 40.0, 1000.0], 8.0, 1.2)
+
+    assert np.isnan(reflux[:2]).all()
+    assert reflux[2] > reflux[3] > reflux[4]
+    assert reflux[-1] == pytest.approx(1.2)
+    Y, X = (12.0 - 8.0)/13.0, (reflux[2] - 1.2)/(reflux[2] + 1)
+    assert Y == pytest.approx(0.75*(1 - X**0.5668), rel=TOLERANCE)
+
+@pytest.mark.parametrize("column", [ColumnCost(internals=TrayCost(TrayCost.Type.Valve)), ColumnCost(condenser=None)])
+def test_matches_brute_force(column):
+    trays, diameters = np.arange(1, 61), np.geomspace(0.5, 3.0, 40)
+    design = optimize_column(column, **SPEC, trays=trays, diameters=diameters)
+
+    best = math.inf
+    for n in trays:
+        reflux = float(reflux_ratio(0.7*n, 8.0, 1.2))
+        vapor = 0.02*(reflux + 1)
+        for diameter in diameters:
+            if np.isnan(reflux) or math.pi/4*diameter**2*0.05 < vapor:
+                continue
+            duties = {name + '_duty': vapor*30000.0 for name in ('reboiler', 'condenser') if name in column.exchangers}
+            result = column.bare_module(diameter, 0.6*n + 3.0, 2.0, num_trays=int(n), **duties)
+            if result.code == CostStatus.OK:
+                best = min(best, result.value)
+    assert design.result.value == pytest.approx(best, rel=TOLERANCE)
+    assert design.result.code == CostStatus.OK
+    assert design.height == pytest.approx(0.6*design.num_trays + 3.0)
+    assert math.pi/4*design.diameter**2*0.05 >= 0.02*(design.reflux + 1)
+
+def test_grid():
+    design = optimize_column(ColumnCost(), **SPEC)
+
+    assert design.value.shape == (150, 200)
+    assert np.isnan(design.value[:11]).all()
+    assert np.nanmin(design.value) <= design.result.value
+
+def test_invalid():
+    with pytest.raises(Exception):
+        optimize_column(ColumnCost(internals=PackingCost()), **SPEC)
+    with pytest.raises(Exception):
+        optimize_column(ColumnCost(), **SPEC, trays=np.arange(1, 11))
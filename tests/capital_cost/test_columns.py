@@ -0,0 +1,74 @@
+import math
+import numpy as np
+import pytest
+from balkony.capital_cost import ColumnCost, HeatExchangerCost, PackingCost, TowerCost, TrayCost
+from balkony.capital_cost.core import CostStatus
+
+TOLERANCE = 1e-9
+
+def test_items_match_components():
+    column = ColumnCost(shell=TowerCost(material=TowerCost.Material.StainlessSteel), internals=TrayCost(TrayCost.Type.Valve))
+    result = column.bare_module(2.0, 20.0, 5.0, reboiler_duty=1000.0, condenser_duty=800.0, num_trays=30, CEPCI=600)
+    section = math.pi*2.0**2/4
+
+    assert result.items['shell'] == TowerCost(material=TowerCost.Material.StainlessSteel).bare_module(section*20.0, 5.0, 2.0, 600)
+    assert result.items['internals'] == TrayCost(TrayCost.Type.Valve).bare_module(section, 30, 600)
+    assert result.items['reboiler'] == HeatExchangerCost(HeatExchangerCost.Type.KettleReboiler).bare_module(1000.0/(0.85*20.0), 5.0, 600)
+    assert result.items['condenser'] == HeatExchangerCost(HeatExchangerCost.Type.FixedTube).bare_module(800.0/(0.85*15.0), 5.0, 600)
+    assert result.value == pytest.approx(sum(item.value for item in result.items.values()), rel=TOLERANCE)
+    assert result.total.checks == ('size', 'pressure')
+
+def test_status_combines_items():
+    result = ColumnCost().bare_module(2.0, 20.0, 5.0, reboiler_duty=3000.0, condenser_duty=800.0, num_trays=30)
+
+    assert result.items['reboiler'].code == CostStatus.SIZE_ABOVE
+    assert result.code == CostStatus.SIZE_ABOVE
+    assert result.status['size'] == ('Warning - Above maximum size', False)
+
+def test_packed_column():
+    column = ColumnCost(internals=PackingCost(material=PackingCost.Material.Ceramic), reboiler=None, condenser=None)
+    result = column.purchased(1.0, 10.0)
+
+    assert list(result.items) == ['shell', 'internals']
+    assert result.items['internals'] == PackingCost(material=PackingCost.Material.Ceramic).purchased(math.pi/4*10.0)
+    assert column.purchased(1.0, 10.0, packed_volume=5.0).items['internals'] == PackingCost(material=PackingCost.Material.Ceramic).purchased(5.0)
+
+@pytest.mark.parametrize("method", ['purchased', 'bare_module'])
+def test_many_matches_scalar(method):
+    rng = np.random.default_rng(3)
+    diameter, height = rng.uniform(0.5, 4.0, 200), rng.uniform(5.0, 50.0, 200)
+    pressure, trays = rng.uniform(0.0, 20.0, 200), rng.integers(5, 60, 200)
+    reboiler, condenser = rng.uniform(200.0, 3000.0, 200), rng.uniform(200.0, 3000.0, 200)
+    inputs = (diameter, height, pressure) if method == 'bare_module' else (diameter, height)
+    batch = getattr(ColumnCost(), method + '_many')(*inputs, reboiler, condenser, num_trays=trays, CEPCI=550)
+
+    assert len(batch) == 200
+    for i in range(0, 200, 23):
+        scalar = getattr(ColumnCost(), method)(*(value[i] for value in inputs), reboiler[i], condenser[i], num_trays=int(trays[i]), CEPCI=550)
+        row = batch.result(i)
+        assert row.items.keys() == scalar.items.keys()
+        for name in scalar.items:
+            assert row.items[name].value == pytest.approx(scalar.items[name].value, rel=TOLERANCE)
+            assert row.items[name].code == scalar.items[name].code
+        assert batch.total.result(i).value == pytest.approx(scalar.value, rel=TOLERANCE)
+        assert batch.total.result(i).code == scalar.code
+
+def test_components():
+    column = ColumnCost(internals=PackingCost(), condenser=None)
+
+    assert column.internals is PackingCost()
+    assert column.exchangers == {'reboiler': HeatExchangerCost(HeatExchangerCost.Type.KettleReboiler)}
+    with pytest.raises(Exception):
+        column.internals = TrayCost(TrayCost.Type.Sieve)
+
+def test_invalid():
+    with pytest.raises(Exception):
+        ColumnCost(internals=TowerCost())
+    with pytest.raises(Exception):
+        ColumnCost().bare_module(2.0, 20.0, 5.0, 1000.0, 800.0)
+    with pytest.raises(Exception):
+        ColumnCost().bare_module(2.0, 20.0, 5.0, condenser_duty=800.0, num_trays=10)
+    with pytest.raises(Exception):
+        ColumnCost(reboiler=None).bare_module(2.0, 20.0, 5.0, 1000.0, 800.0, num_trays=10)
+    with pytest.raises(Exception):
+        ColumnCost(internals=PackingCost()).bare_module(2.0, 20.0, 5.0, 1000.0, 800.0, num_trays=10)
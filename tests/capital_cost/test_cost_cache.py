@@ -0,0 +1,56 @@
+import threading
+import pytest
+from balkony.capital_cost import HeatExchangerCost, PumpCost
+from balkony.capital_cost.core import CachedCost, LRUCache
+
+def test_lru_eviction_and_counters():
+    cache = LRUCache(maxsize=2)
+    cache.get_or_compute('a', lambda: 1)
+    cache.get_or_compute('b', lambda: 2)
+    cache.get_or_compute('a', lambda: 0)
+    cache.get_or_compute('c', lambda: 3)
+
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+    assert cache.info() == (1, 3, 2, 2)
+
+def test_invalid_size():
+    with pytest.raises(Exception):
+        LRUCache(maxsize=0)
+
+def test_cached_results_match_estimator():
+    pump = PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.StainlessSteel)
+    cached = CachedCost(pump, maxsize=16)
+
+    first = cached.bare_module(50.0, 20.0)
+    second = cached.bare_module(50.0, 20.0)
+
+    assert first is second
+    assert first == pump.bare_module(50.0, 20.0)
+    assert cached.purchased(50.0, CEPCI=600) == pump.purchased(50.0, CEPCI=600)
+    assert cached.cache_info().hits == 1 and cached.cache_info().misses == 2
+
+def test_invalidate_and_delegation():
+    exchanger = HeatExchangerCost(HeatExchangerCost.Type.FixedTube)
+    cached = CachedCost(exchanger)
+    result = cached.bare_module(100.0, 10.0)
+    cached.invalidate()
+
+    assert cached.bare_module(100.0, 10.0) is not result
+    assert cached.cache_info().size == 1
+    assert cached.type is HeatExchangerCost.Type.FixedTube
+    assert cached.bare_module_many([100.0], [10.0]).value[0] == pytest.approx(result.value)
+
+def test_shared_across_threads():
+    cached = CachedCost(PumpCost(PumpCost.Type.Centrifugal), maxsize=8)
+    def work():
+        for i in range(200):
+            cached.bare_module(float(1 + i % 10), 5.0)
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = cached.cache_info()
+    assert info.hits + info.misses == 1600
+    assert info.size == 8
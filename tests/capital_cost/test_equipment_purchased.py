@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from array import array
+from balkony.capital_cost.core import EquipmentProperties, EquipmentPurchased
+
+TOLERANCE = 1e-9
+
+@pytest.fixture
+def equipment():
+    return EquipmentPurchased(EquipmentProperties(data=(3.3892, 0.0536, 0.1538),
+                                                  unit='kW',
+                                                  min_size=1.0,
+                                                  max_size=300.0))
+
+def test_cost_many_matches_scalar(equipment):
+    sizes = np.array([0.5, 1.0, 10.0, 150.0, 300.0, 450.0])
+    batch = equipment.cost_many(sizes)
+
+    assert len(batch) == len(sizes)
+    for i, size in enumerate(sizes):
+        scalar = equipment.cost(size)
+        assert abs(batch.value[i] - scalar.value) <= TOLERANCE*scalar.value
+        assert batch.result(i).status == scalar.status
+
+def test_cost_many_range_codes(equipment):
+    batch = equipment.cost_many([0.5, 1.0, 300.0, 450.0])
+
+    assert batch.status['size'].tolist() == [1, 0, 0, 2]
+
+@pytest.mark.parametrize("CEPCI", [397, 600.0, np.array([397.0, 500.0, 800.0])])
+def test_cost_many_cepci(equipment, CEPCI):
+    sizes = array('d', [5.0, 50.0, 250.0])
+    batch = equipment.cost_many(sizes, CEPCI)
+
+    for i, size in enumerate(sizes):
+        scalar = equipment.cost(size, float(np.broadcast_to(CEPCI, (3,))[i]))
+        assert abs(batch.value[i] - scalar.value) <= TOLERANCE*scalar.value
+        assert batch.result(i).CEPCI == scalar.CEPCI
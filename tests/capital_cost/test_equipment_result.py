@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from balkony.capital_cost import BlenderCost, PumpCost
+from balkony.capital_cost.core import EquipmentCostResult, EquipmentCostResultArray
+from balkony.capital_cost.core.status import SIZE_ABOVE, PRESSURE_ABOVE, PRESSURE_BELOW, SIZE_PRESSURE_CHECK
+from balkony.capital_cost.pressure.core.pressure_result import PressureResult
+
+def test_status_is_derived_from_code():
+    result = EquipmentCostResult(code=SIZE_ABOVE | PRESSURE_BELOW, checks=SIZE_PRESSURE_CHECK, value=1.0, CEPCI=397)
+
+    assert result.status == {'size': ("Warning - Above maximum size", False),
+                             'pressure': ('Warning - Lower pressure limit.', False)}
+    assert EquipmentCostResult(code=0, value=1.0, CEPCI=397).status == {'size': ("OK", True)}
+
+def test_results_are_slotted():
+    result = PumpCost(PumpCost.Type.Centrifugal).bare_module(10.0, 5.0)
+
+    assert not hasattr(result, '__dict__')
+    with pytest.raises(AttributeError):
+        result.value = 0.0
+
+def test_result_array_round_trip():
+    pump = PumpCost(PumpCost.Type.Centrifugal)
+    results = [pump.bare_module(0.5, 5.0), pump.bare_module(10.0, 5.0), pump.bare_module(400.0, 5.0, CEPCI=600.0),
+               BlenderCost(BlenderCost.Type.Kneader).bare_module(1.0)]
+    collection = EquipmentCostResultArray(results)
+
+    assert len(collection) == len(results)
+    assert list(collection) == results
+    assert [row.status for row in collection] == [result.status for result in results]
+    assert collection.value.tolist() == [result.value for result in results]
+
+def test_result_array_to_batch():
+    pump = PumpCost(PumpCost.Type.Centrifugal)
+    collection = EquipmentCostResultArray()
+    for power in (0.5, 10.0, 400.0):
+        collection.append(pump.bare_module(power, 5.0))
+    batch = collection.to_batch()
+
+    assert batch.status['size'].tolist() == [1, 0, 2]
+    assert batch.status['pressure'].tolist() == [0, 0, 0]
+    assert np.array_equal(batch.value, collection.value)
+    assert batch.result(2) == collection[2]
+
+def test_legacy_status_constructors():
+    status = {'size': ("Warning - Above maximum size", False), 'pressure': ('Warning - Lower pressure limit.', False)}
+    expected = EquipmentCostResult(code=SIZE_ABOVE | PRESSURE_BELOW, checks=SIZE_PRESSURE_CHECK, value=1.0, CEPCI=397)
+
+    assert EquipmentCostResult(status=status, value=1.0, CEPCI=397) == expected
+    assert EquipmentCostResult(status, 1.0, 397) == expected
+    assert EquipmentCostResult.from_status(status, 1.0, 397) == expected
+    assert EquipmentCostResult(status={'size': ("OK", True)}, value=1.0, CEPCI=397).status == {'size': ("OK", True)}
+    assert PressureResult(status=('Warning - Upper pressure limit.', False), value=1.2) == PressureResult(code=PRESSURE_ABOVE, value=1.2)
+    assert PressureResult(('OK', True), 1.0).code == 0
+    assert PressureResult.from_status(('OK', True), 1.0).status == ('OK', True)
+    with pytest.raises(Exception):
+        EquipmentCostResult(status={'size': ('Fine', True)}, value=1.0, CEPCI=397)
+    with pytest.raises(Exception):
+        EquipmentCostResult(code=0, status=status, value=1.0, CEPCI=397)
+
+def test_result_array_mixed_checks():
+    results = [PumpCost(PumpCost.Type.Centrifugal).bare_module(10.0, 5.0), BlenderCost(BlenderCost.Type.Kneader).bare_module(1.0)]
+    batch = EquipmentCostResultArray(results).to_batch()
+
+    assert batch.checks == SIZE_PRESSURE_CHECK
+    assert batch.status['pressure'].tolist() == [0, -1]
+    assert [batch.result(i) for i in range(2)] == results
+    assert batch.filter(0).result(1) == results[1]
+    assert EquipmentCostResultArray(results[1:]).to_batch().checks == ('size',)
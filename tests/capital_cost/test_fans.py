@@ -40,7 +40,7 @@ def test_within_limits(fixture, size, CEPCI, pressure, request):
     equipment, parameters, Fbm = request.getfixturevalue(fixture)
     K1, K2, K3 = parameters
     purchased_value = calculate_purchased(K1, K2, K3, size, CEPCI)
-    pressure_fac = FanPressure(equipment._type).factor(pressure).value
+    pressure_fac = FanPressure(equipment.type).factor(pressure).value
     bare_value = calculate_bare_module_pressure(purchased_value, Fbm, pressure_fac)
 
     purchased = equipment.purchased(size)
@@ -67,7 +67,7 @@ def test_below_limits(fixture, size, CEPCI, pressure, request):
     equipment, parameters, Fbm = request.getfixturevalue(fixture)
     K1, K2, K3 = parameters
     purchased_value = calculate_purchased(K1, K2, K3, size, CEPCI)
-    pressure_fac = FanPressure(equipment._type).factor(pressure).value
+    pressure_fac = FanPressure(equipment.type).factor(pressure).value
     bare_value = calculate_bare_module_pressure(purchased_value, Fbm, pressure_fac)
 
     purchased = equipment.purchased(size)
@@ -93,7 +93,7 @@ def test_above_limits(fixture, size, CEPCI, pressure, request):
     equipment, parameters, Fbm = request.getfixturevalue(fixture)
     K1, K2, K3 = parameters
     purchased_value = calculate_purchased(K1, K2, K3, size, CEPCI)
-    pressure_fac = FanPressure(equipment._type).factor(pressure).value
+    pressure_fac = FanPressure(equipment.type).factor(pressure).value
     bare_value = calculate_bare_module_pressure(purchased_value, Fbm, pressure_fac)
 
     purchased = equipment.purchased(size)
@@ -0,0 +1,64 @@
+import math
+import numpy as np
+import pytest
+from balkony.capital_cost import VesselCost
+from balkony.capital_cost.core import CostStatus, Structure
+from balkony.capital_cost.geometry import optimize_vessel, optimize_vessel_many
+
+TOLERANCE = 1e-9
+
+def brute(volume, pressure, type, material, ratio=(2.5, 5.0)):
+    estimator = VesselCost(type, material)
+    costs = [estimator.bare_module(volume, pressure, (4*volume/(math.pi*r))**(1/3)).value for r in np.linspace(*ratio, 501)]
+    return min(costs)
+
+@pytest.mark.parametrize("volume, pressure", [(10.0, 1.0), (10.0, 30.0), (100.0, 5.0), (1.0, -0.8), (50.0, 2.0), (5.0, 0.5)])
+def test_minimum_cost(volume, pressure):
+    design = optimize_vessel(volume, pressure, VesselCost.Type.Horizontal, VesselCost.Material.StainlessSteel)
+
+    assert math.pi*design.diameter**2*design.length/4 == pytest.approx(volume, rel=TOLERANCE)
+    assert 2.5 - TOLERANCE <= design.ratio <= 5.0 + TOLERANCE
+    assert design.result.value == pytest.approx(brute(volume, pressure, VesselCost.Type.Horizontal, VesselCost.Material.StainlessSteel), rel=TOLERANCE)
+
+def test_ties_keep_stubbiest():
+    assert optimize_vessel(1.0, -0.8).ratio == pytest.approx(2.5)
+    assert optimize_vessel(5.0, 0.5).ratio == pytest.approx(2.5)
+    assert optimize_vessel(100.0, 5.0).ratio == pytest.approx(5.0)
+
+    # Between both: the largest diameter that still has the minimum wall thickness.
+    design = optimize_vessel(20.0, 2.0)
+    assert 2.5 < design.ratio < 5.0
+    assert design.diameter == pytest.approx(Structure().breakpoints(2.0, 1.0)['diameter'][0], rel=TOLERANCE)
+
+def test_many_matches_scalar():
+    rng = np.random.default_rng(7)
+    volume = rng.uniform(0.05, 700.0, 300)
+    pressure = rng.uniform(-1.0, 40.0, 300)
+    types = rng.choice(list(VesselCost.Type), 300)
+    materials = rng.choice([material.name for material in VesselCost.Material], 300)
+    batch = optimize_vessel_many(volume, pressure, types, materials, ratio=(2.0, 4.0))
+
+    for i in range(0, 300, 37):
+        design = optimize_vessel(volume[i], pressure[i], types[i], VesselCost.Material[materials[i]], ratio=(2.0, 4.0))
+        assert batch.design(i).diameter == pytest.approx(design.diameter, rel=TOLERANCE)
+        assert batch.design(i).length == pytest.approx(design.length, rel=TOLERANCE)
+        assert batch.design(i).result == design.result
+
+def test_size_range():
+    batch = optimize_vessel_many([0.05, 10.0, 700.0], 5.0)
+
+    assert list(batch.result.code) == [CostStatus.SIZE_BELOW, CostStatus.OK, CostStatus.SIZE_ABOVE]
+
+def test_empty():
+    batch = optimize_vessel_many([], 1.0, material=[])
+
+    assert len(batch) == 0
+    assert list(batch.result.status) == ['size']
+    assert batch.result.status['size'].shape == (0,)
+    assert batch.result.count(CostStatus.OK) == 0
+
+def test_invalid():
+    with pytest.raises(Exception):
+        optimize_vessel(10.0, 5.0, ratio=(5.0, 2.0))
+    with pytest.raises(Exception):
+        optimize_vessel_many([1.0, 2.0], 5.0, material=[VesselCost.Material.CarbonSteel])
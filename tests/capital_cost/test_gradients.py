@@ -0,0 +1,100 @@
+import inspect
+import math
+import numpy as np
+import pytest
+import balkony.capital_cost as capital_cost
+from balkony.capital_cost import (BlenderCost, FanCost, FurnanceCost, HeatExchangerCost, HeaterCost, PumpCost, TowerCost,
+                                  TrayCost, VesselCost)
+from balkony.capital_cost.gradients import gradient, gradient_many
+
+TOLERANCE = 1e-6
+
+CASES = [
+    (BlenderCost(BlenderCost.Type.Kneader), {'volume': 2.0}),
+    (PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.StainlessSteel), {'power': 50.0, 'pressure': 20.0, 'CEPCI': 600}),
+    (HeatExchangerCost(HeatExchangerCost.Type.FixedTube), {'area': 200.0, 'pressure': 30.0}),
+    (FanCost(FanCost.Type.CentrifugalRadial), {'flowrate': 5.0, 'rise_pressure': 3.0}),
+    (FurnanceCost(FurnanceCost.Type.ReformerFurnace), {'duty': 5000.0, 'pressure': 20.0, 'deltaTemp': 100.0}),
+    (HeaterCost(HeaterCost.Type.SteamBoiler), {'duty': 500.0, 'pressure': 5.0, 'deltaTemp': 50.0}),
+    (VesselCost(VesselCost.Type.Vertical), {'volume': 30.0, 'pressure': 10.0, 'diameter': 2.0}),
+    (TowerCost(), {'volume': 30.0, 'pressure': 10.0, 'diameter': 2.0}),
+    (TrayCost(TrayCost.Type.Valve), {'area': 3.0, 'num_trays': 12}),
+    (TrayCost(TrayCost.Type.Sieve), {'area': 3.0, 'num_trays': 30}),
+]
+
+INPUTS = {'pressure': 5.0, 'diameter': 2.0, 'rise_pressure': 3.0, 'num_trays': 10}
+
+EQUIPMENTS = [(getattr(capital_cost, name), type) for name in capital_cost.__all__ if name != 'ColumnCost'
+              for type in getattr(capital_cost, name).Type]
+
+@pytest.mark.parametrize("cls, type", EQUIPMENTS, ids=lambda item: getattr(item, '__name__', getattr(item, 'name', None)))
+@pytest.mark.parametrize("method", ['purchased', 'bare_module'])
+def test_every_equipment(cls, type, method):
+    estimator = cls(type)
+    names = [name for name in inspect.signature(getattr(estimator, method)).parameters if name != 'CEPCI']
+    inputs = {name: INPUTS[name] for name in names[1:] if name in INPUTS}
+    result = gradient(estimator, method, size=math.sqrt(type.value['min_size']*type.value['max_size']), **inputs)
+
+    assert set(result.partials) == set(names)
+    assert all(math.isfinite(partial) for partial in result.partials.values())
+
+@pytest.mark.parametrize("estimator, inputs", CASES)
+def test_partials_match_finite_differences(estimator, inputs):
+    result = gradient(estimator, **inputs)
+
+    assert result.value == estimator.bare_module(**inputs).value
+    assert set(result.partials) == set(inputs) - {'CEPCI'}
+    for key, partial in result.partials.items():
+        step = 1e-6*inputs[key]
+        upper = estimator.bare_module(**{**inputs, key: inputs[key] + step}).value
+        lower = estimator.bare_module(**{**inputs, key: inputs[key] - step}).value
+        assert partial == pytest.approx((upper - lower)/(2*step), rel=TOLERANCE, abs=TOLERANCE)
+
+@pytest.mark.parametrize("estimator, inputs", CASES)
+def test_gradient_many_matches_scalar(estimator, inputs):
+    size = next(iter(inputs))
+    sizes = np.array([0.5, 1.0, 2.0])*inputs[size]
+    batch = gradient_many(estimator, **{**inputs, size: sizes})
+
+    for i, value in enumerate(sizes):
+        scalar = gradient(estimator, **{**inputs, size: value})
+        for key, partial in scalar.partials.items():
+            assert batch.partials[key][i] == pytest.approx(partial, rel=1e-12)
+        for key, points in scalar.breakpoints.items():
+            assert tuple(batch.breakpoints[key][i]) == pytest.approx(points)
+
+def test_purchased_gradient():
+    pump = PumpCost(PumpCost.Type.Centrifugal)
+    result = gradient(pump, 'purchased', size=20.0, CEPCI=600)
+
+    assert result.value == pump.purchased(20.0, 600).value
+    assert result.partials['power'] == pytest.approx(pump.equipment.derivative(20.0, 600), rel=1e-12)
+    assert gradient(TrayCost(TrayCost.Type.Valve), 'purchased', area=3.0, num_trays=12).partials['num_trays'] == \
+        pytest.approx(TrayCost(TrayCost.Type.Valve).purchased(3.0, 1).value, rel=1e-12)
+
+def test_breakpoints():
+    pump = gradient(PumpCost(PumpCost.Type.Centrifugal), power=50.0, pressure=20.0)
+    vessel = gradient(VesselCost(VesselCost.Type.Vertical), volume=30.0, pressure=10.0, diameter=2.0)
+    structure = VesselCost.Structure()
+
+    assert pump.breakpoints == {'power': (), 'pressure': (10.0,)}
+    assert gradient(TrayCost(TrayCost.Type.Valve), area=3.0, num_trays=12).breakpoints['num_trays'] == (20.0,)
+    assert vessel.breakpoints['pressure'][0] == -0.5
+    assert structure.pressure_factor(vessel.breakpoints['pressure'][1], 2.0) == pytest.approx(1.0)
+    assert structure.pressure_factor(10.0, vessel.breakpoints['diameter'][0]) == pytest.approx(1.0)
+
+def test_flat_segments():
+    assert gradient(PumpCost(PumpCost.Type.Centrifugal), power=50.0, pressure=5.0).partials['pressure'] == 0.0
+    assert gradient(VesselCost(VesselCost.Type.Vertical), volume=30.0, pressure=-0.8, diameter=2.0).partials['diameter'] == 0.0
+    assert gradient(TrayCost(TrayCost.Type.Valve), 'bare_module', area=3.0, num_trays=30).partials['num_trays'] == \
+        pytest.approx(TrayCost(TrayCost.Type.Valve).bare_module(3.0, 30).value/30, rel=1e-12)
+
+def test_invalid_inputs():
+    batch = gradient_many(PumpCost(PumpCost.Type.Centrifugal), power=np.array([-1.0, 50.0]), pressure=np.array([20.0, -1.0]))
+
+    assert np.isnan(batch.partials['power']).tolist() == [True, True]
+    assert np.isnan(batch.partials['pressure']).tolist() == [True, True]
+    with pytest.raises(Exception):
+        gradient(PumpCost(PumpCost.Type.Centrifugal), 'total_module', power=50.0, pressure=20.0)
+    with pytest.raises(Exception):
+        gradient(PumpCost(PumpCost.Type.Centrifugal), power=50.0)
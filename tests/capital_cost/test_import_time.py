@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+import balkony.capital_cost as capital_cost
+import balkony.capital_cost.pressure as pressure
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BUDGET_US = 100_000
+
+def _import_time(statement: str) -> tuple[set[str], int]:
+    '''
+    Runs statement in a fresh interpreter with -X importtime, with numpy
+    already imported, and returns the imported balkony modules and the sum
+    of their self import times (us).
+    '''
+    env = {**os.environ, 'PYTHONPATH': ROOT + os.pathsep + os.environ.get('PYTHONPATH', '')}
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import numpy\n{statement}'],
+                             capture_output=True, text=True, env=env, cwd=ROOT, check=True)
+    modules, total = set(), 0
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, _, name = line[len('import time:'):].split('|')
+        if name.strip().startswith('balkony'):
+            modules.add(name.strip())
+            total += int(self_time)
+    return modules, total
+
+def test_single_class_imports_only_its_modules():
+    modules, _ = _import_time('from balkony.capital_cost import PumpCost')
+
+    equipment = {module for module in modules if module.count('.') == 2 and not module.endswith(('core', 'pressure'))}
+    assert equipment == {'balkony.capital_cost.pumps'}
+    assert {module for module in modules if module.endswith('_pressure')} == {'balkony.capital_cost.pressure.pumps_pressure'}
+
+def test_single_class_cold_start_budget():
+    _, single = _import_time('from balkony.capital_cost import PumpCost')
+    _, everything = _import_time('from balkony.capital_cost import *')
+
+    assert single < everything
+    assert single < BUDGET_US
+
+def test_every_name_resolves():
+    for name in capital_cost.__all__:
+        assert getattr(capital_cost, name).__name__ == name
+        assert name in dir(capital_cost)
+    for name in pressure.__all__:
+        assert getattr(pressure, name).__name__ == name
@@ -0,0 +1,85 @@
+import inspect
+import threading
+import pytest
+from balkony.capital_cost import BlenderCost, HeatExchangerCost, PumpCost, TowerCost, VesselCost
+from balkony.capital_cost.pressure import PumpPressure
+
+def test_same_arguments_share_instance():
+    pump = PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.StainlessSteel)
+
+    assert PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.StainlessSteel) is pump
+    assert PumpCost(type=PumpCost.Type.Centrifugal, material=PumpCost.Material.StainlessSteel) is pump
+    assert PumpCost(PumpCost.Type.Centrifugal) is PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.CarbonSteel)
+    assert BlenderCost(BlenderCost.Type.Kneader) is BlenderCost(type=BlenderCost.Type.Kneader)
+
+def test_different_arguments_are_distinct():
+    assert HeatExchangerCost(HeatExchangerCost.Type.FixedTube) is not HeatExchangerCost(HeatExchangerCost.Type.FixedTube, tube_only=False)
+    assert VesselCost(VesselCost.Type.Vertical) is not VesselCost(VesselCost.Type.Vertical, struct=VesselCost.Structure(max_stress=1000))
+    assert TowerCost(struct=TowerCost.Structure()) is TowerCost()
+
+def test_pressure_objects_are_shared():
+    assert PumpCost(PumpCost.Type.Centrifugal).pressure is PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.NiAlloy).pressure
+    assert PumpPressure('Centrifugal') is PumpCost(PumpCost.Type.Centrifugal).pressure
+
+def test_invalid_material_still_raises():
+    for _ in range(2):
+        with pytest.raises(Exception):
+            PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.Titanium)
+
+def test_concurrent_construction_returns_one_instance():
+    instances = []
+    threads = [threading.Thread(target=lambda: instances.append(HeatExchangerCost(HeatExchangerCost.Type.Bayonet,
+                                                                                  HeatExchangerCost.Material.NiAlloy)))
+               for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(instance is instances[0] for instance in instances)
+
+def test_instances_are_frozen():
+    pump = PumpCost(PumpCost.Type.Centrifugal)
+
+    with pytest.raises(Exception):
+        pump._material = PumpCost.Material.NiAlloy
+    with pytest.raises(Exception):
+        del pump._equipment
+    with pytest.raises(Exception):
+        PumpPressure('Centrifugal')._properties = None
+    assert PumpCost(PumpCost.Type.Centrifugal).material is PumpCost.Material.CarbonSteel
+
+def test_public_properties():
+    pump = PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.NiAlloy)
+    vessel = VesselCost(VesselCost.Type.Vertical, struct=VesselCost.Structure(max_stress=1000))
+
+    assert (pump.type, pump.material, pump.pressure) == (PumpCost.Type.Centrifugal, PumpCost.Material.NiAlloy, PumpPressure('Centrifugal'))
+    assert pump.equipment.properties.max_size == PumpCost.Type.Centrifugal.value['max_size']
+    assert vessel.structure == VesselCost.Structure(max_stress=1000)
+    assert not hasattr(BlenderCost(BlenderCost.Type.Kneader), 'material')
+    with pytest.raises(Exception):
+        pump.material = PumpCost.Material.CarbonSteel
+
+def test_caches_are_bounded(monkeypatch):
+    monkeypatch.setattr(VesselCost, 'maxsize', 8)
+    for stress in range(100):
+        VesselCost(VesselCost.Type.Vertical, struct=VesselCost.Structure(max_stress=900 + stress))
+        VesselCost(VesselCost.Type.Horizontal, struct=VesselCost.Structure(max_stress=900 + stress))
+
+    assert len(VesselCost._instances) <= 8
+    assert len(VesselCost._calls) <= 8
+    assert VesselCost(VesselCost.Type.Vertical) is VesselCost(type=VesselCost.Type.Vertical)
+
+def test_arguments():
+    exchanger = HeatExchangerCost(HeatExchangerCost.Type.FixedTube, tube_only=False)
+
+    assert HeatExchangerCost.arguments(exchanger) == {'type': HeatExchangerCost.Type.FixedTube,
+                                                      'material': HeatExchangerCost.Material.CarbonSteel,
+                                                      'tube_only': False}
+
+def test_signature_is_the_constructor():
+    parameters = inspect.signature(HeatExchangerCost).parameters
+
+    assert list(parameters) == ['type', 'material', 'tube_only']
+    assert parameters['tube_only'].default is True
+    assert list(inspect.signature(VesselCost).parameters) == ['type', 'material', 'struct']
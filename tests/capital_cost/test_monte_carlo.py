@@ -0,0 +1,89 @@
+import math
+import numpy as np
+import pytest
+from balkony.capital_cost import BlenderCost, PumpCost, VesselCost
+from balkony.capital_cost.core import CostStatus
+from balkony.capital_cost.distributions import Fixed, LogNormal, Normal, Triangular, Uniform
+from balkony.capital_cost.monte_carlo import MonteCarlo
+
+TOLERANCE = 1e-9
+
+@pytest.fixture
+def model():
+    mc = MonteCarlo(seed=7, block_size=1000)
+    mc.add('P-101', PumpCost(PumpCost.Type.Centrifugal), power=Normal(50.0, 5.0), pressure=Uniform(10.0, 20.0), CEPCI=600)
+    mc.add('V-101', VesselCost(VesselCost.Type.Vertical), size=Triangular(10.0, 20.0, 30.0), pressure=LogNormal(5.0, 0.2), diameter=2.0)
+    return mc
+
+def test_fixed_inputs_match_scalar():
+    mc = MonteCarlo()
+    mc.add('P-101', PumpCost(PumpCost.Type.Centrifugal), power=50.0, pressure=Fixed(20.0))
+    result = mc.run(2500)
+    expected = PumpCost(PumpCost.Type.Centrifugal).bare_module(50.0, 20.0).value
+
+    assert result.items['P-101'].count == 2500
+    assert result.total.mean == pytest.approx(expected, rel=TOLERANCE)
+    assert result.total.std == pytest.approx(0.0, abs=TOLERANCE*expected)
+
+def test_statistics_match_stored_samples(model):
+    result = model.run(2500)
+    blocks = [model.evaluate(block, n) for block, n in model.blocks(2500)]
+    pump = np.concatenate([block['P-101'].value for block in blocks])
+    total = np.concatenate([block['P-101'].value + block['V-101'].value for block in blocks])
+
+    assert [n for _, n in model.blocks(2500)] == [1000, 1000, 500]
+    assert result.items['P-101'].mean == pytest.approx(pump.mean(), rel=TOLERANCE)
+    assert result.items['P-101'].std == pytest.approx(pump.std(ddof=1), rel=1e-7)
+    assert result.total.mean == pytest.approx(total.mean(), rel=TOLERANCE)
+    assert result.total.std == pytest.approx(total.std(ddof=1), rel=1e-7)
+    assert (result.total.min, result.total.max) == (total.min(), total.max())
+
+def test_seeded_runs_are_reproducible(model):
+    assert model.run(2000) == model.run(2000)
+    other = MonteCarlo(seed=8, block_size=1000)
+    other.add('P-101', PumpCost(PumpCost.Type.Centrifugal), power=Normal(50.0, 5.0), pressure=Uniform(10.0, 20.0), CEPCI=600)
+    assert other.run(2000).items['P-101'] != model.run(2000).items['P-101']
+
+def test_coefficient_perturbation():
+    mc = MonteCarlo()
+    mc.add('B-101', BlenderCost(BlenderCost.Type.Kneader), volume=2.0, coefficients={'K1': 0.1, 'K3': 0.05})
+    log_size = math.log10(2.0)
+    expected = BlenderCost(BlenderCost.Type.Kneader).bare_module(2.0).value*10**(0.1 + 0.05*log_size**2)
+
+    assert mc.run(10).total.mean == pytest.approx(expected, rel=TOLERANCE)
+
+def test_invalid_samples_are_flagged():
+    mc = MonteCarlo(seed=1)
+    mc.add('P-101', PumpCost(PumpCost.Type.Centrifugal), power=Normal(2.0, 2.0), pressure=10.0)
+    result = mc.run(5000)
+    invalid = result.flags['P-101'][CostStatus.INVALID_INPUT]
+
+    assert 0 < invalid < 5000
+    assert result.items['P-101'].count == 5000 - invalid
+    assert result.total.count == 5000 - invalid
+
+def test_invalid_definitions():
+    mc = MonteCarlo()
+    with pytest.raises(Exception):
+        mc.add('P-101', PumpCost(PumpCost.Type.Centrifugal), power=10.0)
+    with pytest.raises(Exception):
+        mc.add('P-101', PumpCost(PumpCost.Type.Centrifugal), power=10.0, pressure=1.0, coefficients={'K4': 0.1})
+    with pytest.raises(Exception):
+        mc.run(10)
+    with pytest.raises(Exception):
+        MonteCarlo(method='total_module')
+
+@pytest.mark.parametrize("distribution", [Normal(10.0, 2.0), LogNormal(10.0, 0.3), Uniform(5.0, 15.0), Triangular(5.0, 8.0, 15.0)])
+def test_distribution_ppf_matches_samples(distribution):
+    samples = distribution.sample(np.random.default_rng(0), 200_000)
+
+    for q in (0.1, 0.5, 0.9):
+        assert distribution.ppf(q) == pytest.approx(np.quantile(samples, q), rel=0.01)
+
+def test_quantiles(model):
+    result = model.run(5000)
+    blocks = [model.evaluate(block, n) for block, n in model.blocks(5000)]
+    total = np.concatenate([block['P-101'].value + block['V-101'].value for block in blocks])
+
+    for value, q in zip(result.total[-3:], (0.1, 0.5, 0.9)):
+        assert value == pytest.approx(np.quantile(total, q, method='lower'), rel=0.01)
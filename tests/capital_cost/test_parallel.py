@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from balkony.capital_cost import PumpCost, TrayCost, VesselCost
+from balkony.capital_cost.distributions import Normal, Triangular, Uniform
+from balkony.capital_cost.monte_carlo import MonteCarlo
+from balkony.capital_cost.parallel import ParallelRunner
+
+@pytest.fixture(scope='module')
+def runner():
+    with ParallelRunner(workers=2) as runner:
+        yield runner
+
+@pytest.fixture
+def model():
+    mc = MonteCarlo(seed=3, block_size=500)
+    mc.add('P-101', PumpCost(PumpCost.Type.Centrifugal), power=Normal(50.0, 5.0), pressure=Uniform(10.0, 20.0))
+    mc.add('V-101', VesselCost(VesselCost.Type.Vertical), size=Triangular(10.0, 20.0, 30.0), pressure=5.0, diameter=2.0)
+    return mc
+
+def test_batch_matches_serial(runner):
+    pump = PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.StainlessSteel)
+    rng = np.random.default_rng(0)
+    power, pressure = rng.uniform(0.5, 400.0, 2500), rng.uniform(1.0, 200.0, 2500)
+    result = runner.batch(pump, shard_size=1000, power=power, pressure=pressure, CEPCI=600)
+    expected = pump.bare_module_many(power, pressure, 600)
+
+    assert np.array_equal(result.value, expected.value)
+    assert np.array_equal(result.code, expected.code)
+    assert result.checks == expected.checks
+    assert np.all(result.CEPCI == 600)
+
+def test_batch_purchased(runner):
+    trays = TrayCost(TrayCost.Type.Valve)
+    area = np.linspace(0.5, 12.0, 300)
+    result = runner.batch(trays, method='purchased', shard_size=128, area=area, num_trays=np.full(300, 12))
+
+    assert np.array_equal(result.value, trays.purchased_many(area, 12).value)
+
+def test_monte_carlo_matches_serial(runner, model):
+    result = runner.monte_carlo(model, 5200, blocks_per_shard=3)
+    expected = model.run(5200)
+
+    assert result.items['P-101'].count == expected.items['P-101'].count
+    assert result.total.mean == pytest.approx(expected.total.mean, rel=1e-12)
+    assert result.total.std == pytest.approx(expected.total.std, rel=1e-9)
+    assert (result.total.min, result.total.max) == (expected.total.min, expected.total.max)
+
+def test_monte_carlo_independent_of_workers(runner, model):
+    with ParallelRunner(workers=1) as single:
+        assert single.monte_carlo(model, 5200, blocks_per_shard=3) == runner.monte_carlo(model, 5200, blocks_per_shard=3)
+
+def test_empty_batch(runner):
+    pump = PumpCost(PumpCost.Type.Centrifugal)
+    result = runner.batch(pump, power=np.array([]), pressure=5.0)
+    expected = pump.bare_module_many(np.array([]), 5.0)
+
+    assert len(result) == 0
+    assert result.value.shape == expected.value.shape
+    assert result.code.shape == expected.code.shape
+
+def test_invalid_batch(runner):
+    with pytest.raises(Exception):
+        runner.batch(PumpCost(PumpCost.Type.Centrifugal), power=[1.0, 2.0], pressure=[1.0, 2.0, 3.0])
+    with pytest.raises(Exception):
+        runner.batch(PumpCost(PumpCost.Type.Centrifugal), method='total', power=[1.0], pressure=[1.0])
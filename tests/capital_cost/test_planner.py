@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from balkony.capital_cost import BlenderCost, FanCost, HeatExchangerCost, PumpCost, TrayCost, VesselCost
+from balkony.capital_cost.planner import EquipmentPlanner
+
+TOLERANCE = 1e-9
+
+@pytest.fixture
+def table():
+    return [
+        {'type': PumpCost.Type.Centrifugal, 'material': PumpCost.Material.StainlessSteel, 'size': 50.0, 'pressure': 20.0},
+        {'type': HeatExchangerCost.Type.FixedTube, 'size': 200.0, 'pressure': 30.0, 'tube_only': False},
+        {'type': BlenderCost.Type.Kneader, 'size': 1.0, 'CEPCI': 600.0},
+        {'type': 'Centrifugal', 'equipment': PumpCost, 'material': 'StainlessSteel', 'size': 500.0, 'pressure': 5.0},
+        {'type': FanCost.Type.AxialVane, 'size': 30.0, 'pressure': 2.0},
+        {'type': TrayCost.Type.Valve, 'material': TrayCost.Material.NiAlloy, 'size': 3.0, 'num_trays': 12},
+        {'type': VesselCost.Type.Vertical, 'size': 30.0, 'pressure': 10.0, 'diameter': 2.0},
+        {'type': HeatExchangerCost.Type.FixedTube, 'size': 150.0, 'pressure': 3.0},
+    ]
+
+@pytest.fixture
+def expected():
+    pump = PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.StainlessSteel)
+    return [
+        pump.bare_module(50.0, 20.0),
+        HeatExchangerCost(HeatExchangerCost.Type.FixedTube, tube_only=False).bare_module(200.0, 30.0),
+        BlenderCost(BlenderCost.Type.Kneader).bare_module(1.0, 600.0),
+        pump.bare_module(500.0, 5.0),
+        FanCost(FanCost.Type.AxialVane).bare_module(30.0, 2.0),
+        TrayCost(TrayCost.Type.Valve, TrayCost.Material.NiAlloy).bare_module(3.0, 12),
+        VesselCost(VesselCost.Type.Vertical).bare_module(30.0, 10.0, 2.0),
+        HeatExchangerCost(HeatExchangerCost.Type.FixedTube).bare_module(150.0, 3.0),
+    ]
+
+def test_rows_are_grouped(table):
+    planner = EquipmentPlanner(table)
+
+    assert len(planner) == 8
+    assert planner.num_groups == 7
+
+def test_bare_module_in_original_order(table, expected):
+    result = EquipmentPlanner(table).bare_module()
+
+    for i, scalar in enumerate(expected):
+        assert abs(result.value[i] - scalar.value) <= TOLERANCE*scalar.value
+        assert result.result(i).status == scalar.status
+        assert result.CEPCI[i] == scalar.CEPCI
+    assert result.status['pressure'].tolist() == [0, 0, -1, 0, 0, -1, -1, 0]
+    assert result.status['size'].tolist() == [0, 0, 0, 2, 0, 0, 0, 0]
+
+def test_unchecked_pressure():
+    result = EquipmentPlanner([{'type': BlenderCost.Type.Kneader, 'size': 1.0}, {'type': TrayCost.Type.Valve, 'size': 3.0, 'num_trays': 5}]).bare_module()
+
+    assert result.checks == ('size',)
+    assert result.checked is None
+    assert 'pressure' not in result.status
+
+def test_columnar_table(table, expected):
+    columns = {name: [row.get(name, np.nan) for row in table] for name in ('type', 'equipment', 'material', 'size', 'pressure',
+                                                                            'tube_only', 'CEPCI', 'num_trays', 'diameter')}
+    result = EquipmentPlanner(columns).purchased()
+
+    pump = PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.StainlessSteel)
+    assert result.value[0] == pytest.approx(pump.purchased(50.0).value)
+    assert result.value[5] == pytest.approx(TrayCost(TrayCost.Type.Valve).purchased(3.0, 12).value)
+
+def test_missing_required_input():
+    planner = EquipmentPlanner([{'type': PumpCost.Type.Centrifugal, 'size': 50.0}])
+
+    with pytest.raises(Exception):
+        planner.bare_module()
+    assert planner.purchased().value[0] == pytest.approx(PumpCost(PumpCost.Type.Centrifugal).purchased(50.0).value)
@@ -0,0 +1,107 @@
+import math
+import pytest
+from balkony.capital_cost import BlenderCost, FurnanceCost, HeatExchangerCost, PumpCost, TrayCost, VesselCost
+from balkony.capital_cost.core import CachedCost, CostStatus
+from balkony.capital_cost.plant import PlantCostModel
+
+TOLERANCE = 1e-9
+
+@pytest.fixture
+def plant():
+    model = PlantCostModel(CEPCI=600)
+    model.add('P-101', PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.StainlessSteel), power=50.0, pressure=20.0)
+    model.add('P-102', PumpCost(PumpCost.Type.Centrifugal), size=10.0, pressure=5.0)
+    model.add('E-101', HeatExchangerCost(HeatExchangerCost.Type.FixedTube), area=200.0, pressure=30.0)
+    model.add('V-101', VesselCost(VesselCost.Type.Vertical, VesselCost.Material.StainlessSteel), volume=30.0, pressure=10.0, diameter=2.0)
+    model.add('T-101', TrayCost(TrayCost.Type.Valve), area=3.0, num_trays=12)
+    return model
+
+def test_totals(plant):
+    pumps = [PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.StainlessSteel).bare_module(50.0, 20.0, 600),
+             PumpCost(PumpCost.Type.Centrifugal).bare_module(10.0, 5.0, 600)]
+    bare = [*pumps,
+            HeatExchangerCost(HeatExchangerCost.Type.FixedTube).bare_module(200.0, 30.0, 600),
+            VesselCost(VesselCost.Type.Vertical, VesselCost.Material.StainlessSteel).bare_module(30.0, 10.0, 2.0, 600),
+            TrayCost(TrayCost.Type.Valve).bare_module(3.0, 12, 600)]
+    base = [PumpCost(PumpCost.Type.Centrifugal).bare_module(50.0, 1.0, 600),
+            PumpCost(PumpCost.Type.Centrifugal).bare_module(10.0, 1.0, 600),
+            HeatExchangerCost(HeatExchangerCost.Type.FixedTube).bare_module(200.0, 1.0, 600),
+            VesselCost(VesselCost.Type.Vertical).bare_module(30.0, 1.0, 2.0, 600),
+            TrayCost(TrayCost.Type.Valve).bare_module(3.0, 12, 600)]
+    bare_module = math.fsum(result.value for result in bare)
+
+    assert len(plant) == 5
+    assert plant.subtotals()['PumpCost'].count == 2
+    assert plant.subtotals()['PumpCost'].bare_module == pytest.approx(pumps[0].value + pumps[1].value, rel=TOLERANCE)
+    assert plant.bare_module == pytest.approx(bare_module, rel=TOLERANCE)
+    assert plant.total_module == pytest.approx(1.18*bare_module, rel=TOLERANCE)
+    assert plant.grass_roots == pytest.approx(1.18*bare_module + 0.5*math.fsum(result.value for result in base), rel=TOLERANCE)
+    assert plant.item('T-101').purchased == TrayCost(TrayCost.Type.Valve).purchased(3.0, 12, 600)
+
+def test_update_reevaluates_only_dirty_items(plant, monkeypatch):
+    plant.grass_roots
+    calls = []
+    evaluate = PlantCostModel._evaluate
+    monkeypatch.setattr(PlantCostModel, '_evaluate', lambda self, item: calls.append(item.name) or evaluate(self, item))
+
+    plant.update('P-102', power=20.0)
+
+    assert plant.item('P-102', evaluate=False).inputs == {'power': 20.0, 'pressure': 5.0}
+    assert plant.subtotals()['PumpCost'].bare_module == pytest.approx(
+        PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.StainlessSteel).bare_module(50.0, 20.0, 600).value
+        + PumpCost(PumpCost.Type.Centrifugal).bare_module(20.0, 5.0, 600).value, rel=TOLERANCE)
+    plant.grass_roots
+    assert calls == ['P-102']
+
+def test_change_estimator_and_remove(plant):
+    plant.update('P-102', FurnanceCost(FurnanceCost.Type.ReformerFurnace), size=5000.0, pressure=10.0)
+    assert plant.subtotals()['PumpCost'].count == 1
+    assert plant.subtotals()['FurnanceCost'].count == 1
+
+    plant.remove('P-101')
+    assert 'PumpCost' not in plant.subtotals()
+    assert 'P-101' not in plant
+
+def test_cepci_change_marks_items_dirty(plant):
+    before = plant.bare_module
+    plant.CEPCI = 1200
+
+    assert plant.bare_module == pytest.approx(2*before, rel=TOLERANCE)
+
+def test_flagged(plant):
+    plant.add('B-101', BlenderCost(BlenderCost.Type.Kneader), volume=10.0)
+
+    assert plant.flagged() == ['B-101']
+    assert plant.flagged(CostStatus.PRESSURE_BELOW | CostStatus.PRESSURE_ABOVE) == []
+
+def test_invalid_inputs():
+    plant = PlantCostModel()
+    with pytest.raises(Exception):
+        plant.add('P-101', PumpCost(PumpCost.Type.Centrifugal), power=10.0)
+    with pytest.raises(Exception):
+        plant.add('P-101', PumpCost(PumpCost.Type.Centrifugal), power=10.0, pressure=5.0, head=3.0)
+    plant.add('P-101', PumpCost(PumpCost.Type.Centrifugal), power=10.0, pressure=5.0)
+    with pytest.raises(Exception):
+        plant.add('P-101', PumpCost(PumpCost.Type.Centrifugal), power=10.0, pressure=5.0)
+    with pytest.raises(Exception):
+        plant.update('P-999', power=1.0)
+
+def test_cached_estimator():
+    pump = PumpCost(PumpCost.Type.Centrifugal, PumpCost.Material.StainlessSteel)
+    cached, plain = PlantCostModel(CEPCI=600), PlantCostModel(CEPCI=600)
+    cached.add('P-101', CachedCost(pump), power=50.0, pressure=10.0)
+    plain.add('P-101', pump, power=50.0, pressure=10.0)
+
+    assert cached.grass_roots == plain.grass_roots
+    assert cached.item('P-101').estimator is pump
+    assert list(cached.subtotals()) == ['PumpCost']
+    with pytest.raises(Exception):
+        cached.add('P-102', CachedCost(pump), power=50.0, head=10.0)
+    cached.update('P-101', CachedCost(PumpCost(PumpCost.Type.Reciprocating)), power=20.0, pressure=5.0)
+    assert cached.bare_module == pytest.approx(PumpCost(PumpCost.Type.Reciprocating).bare_module(20.0, 5.0, 600).value, rel=TOLERANCE)
+
+def test_base_estimator():
+    plant = PlantCostModel()
+
+    assert plant.base_estimator(HeatExchangerCost(HeatExchangerCost.Type.UTube, HeatExchangerCost.Material.Titanium, tube_only=False)) \
+        is HeatExchangerCost(HeatExchangerCost.Type.UTube)
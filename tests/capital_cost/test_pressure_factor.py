@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from balkony.capital_cost.pressure import (EvaporatorPressure, FanPressure, FurnacePressure, HeatExchangerPressure,
+                                           HeaterPressure, PumpPressure, TankPressure, VaporizerPressure)
+
+TOLERANCE = 1e-9
+
+@pytest.mark.parametrize("pressure", [
+    EvaporatorPressure(),
+    FanPressure('CentrifugalRadial'),
+    FanPressure('AxialTube'),
+    FurnacePressure('ReformerFurnace'),
+    HeatExchangerPressure('DoublePipe', True),
+    HeatExchangerPressure('TeflonTube', True),
+    HeatExchangerPressure('SpiralTube', False),
+    HeatExchangerPressure('FixedTube', True),
+    HeaterPressure('SteamBoiler'),
+    PumpPressure('Centrifugal'),
+    TankPressure(),
+    VaporizerPressure(),
+])
+def test_factor_many_matches_scalar(pressure):
+    pressures = np.array([0.5, 1.0, 4.0, 5.0, 10.0, 15.0, 19.0, 40.0, 99.0, 100.0, 150.0, 250.0, 300.0, 400.0, 1000.0])
+    batch = pressure.factor_many(pressures)
+
+    assert len(batch) == len(pressures)
+    for i, value in enumerate(pressures):
+        scalar = pressure.factor(value)
+        assert abs(batch.value[i] - scalar.value) <= TOLERANCE*scalar.value
+        assert batch.result(i).status == scalar.status
+
+def test_factor_many_status_codes():
+    batch = PumpPressure('Centrifugal').factor_many([5.0, 10.0, 100.0, 150.0])
+
+    assert batch.status.tolist() == [0, 0, 0, 2]
+
+def test_factor_many_keeps_shape():
+    pressures = np.linspace(1.0, 200.0, 12).reshape(3, 4)
+    batch = HeatExchangerPressure('DoublePipe', True).factor_many(pressures)
+
+    assert batch.value.shape == (3, 4)
+    assert batch.value[2, 3] == pytest.approx(HeatExchangerPressure('DoublePipe', True).factor(200.0).value)
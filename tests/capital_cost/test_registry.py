@@ -0,0 +1,56 @@
+import math
+import numpy as np
+import pytest
+from balkony.capital_cost import BlenderCost, HeatExchangerCost, PumpCost, VesselCost
+from balkony.capital_cost.registry import EQUIPMENT, registry
+
+TOLERANCE = 1e-9
+
+def test_every_type_is_registered():
+    assert registry.num_types == sum(len(cls.Type) for cls in EQUIPMENT)
+    for cls in EQUIPMENT:
+        for type in cls.Type:
+            type_id = registry.type_id(type)
+            assert registry.type(type_id) is type
+            assert (registry.K1[type_id], registry.K2[type_id], registry.K3[type_id]) == type.value['data']
+            assert registry.min_size[type_id] == type.value['min_size']
+            assert registry.max_size[type_id] == type.value['max_size']
+
+def test_coefficients():
+    pump = registry.type_id(PumpCost.Type.Centrifugal)
+    blender = registry.type_id(BlenderCost.Type.Kneader)
+
+    assert registry.B1[pump] == 1.89 and registry.B2[pump] == 1.35
+    assert math.isnan(registry.Fbare[pump])
+    assert registry.Fbare[blender] == 1.12
+    assert math.isnan(registry.B1[blender])
+
+def test_material_factor_matrix():
+    teflon = registry.type_id(HeatExchangerCost.Type.TeflonTube)
+    air_cooler = registry.type_id(HeatExchangerCost.Type.AirCooler)
+    copper, titanium = registry.material_id(HeatExchangerCost.Material.Copper), registry.material_id('Titanium')
+    vessel = registry.type_id(VesselCost.Type.Vertical)
+
+    assert registry.material_factor(air_cooler, copper) == 1.1
+    assert registry.material_factor(vessel, titanium) == VesselCost.Material.Titanium.value
+    assert registry.is_valid([teflon, teflon], [copper, titanium]).tolist() == [False, True]
+    assert registry.material_id(PumpCost.Material.CarbonSteel) == registry.material_id(VesselCost.Material.CarbonSteel)
+
+def test_type_ids_of_class():
+    ids = registry.type_ids(PumpCost)
+
+    assert [registry.type(id) for id in ids] == list(PumpCost.Type)
+
+def test_heterogeneous_purchased_matches_classes():
+    types = [PumpCost.Type.Centrifugal, HeatExchangerCost.Type.FixedTube, BlenderCost.Type.Kneader, PumpCost.Type.Centrifugal]
+    sizes = np.array([50.0, 2000.0, 1.0, 0.5])
+    batch = registry.purchased_many([registry.type_id(type) for type in types], sizes, CEPCI=550)
+
+    for i, (type, size) in enumerate(zip(types, sizes)):
+        scalar = registry.equipment_of(type)(type).purchased(size, 550)
+        assert abs(batch.value[i] - scalar.value) <= TOLERANCE*scalar.value
+        assert batch.result(i).status == scalar.status
+
+def test_arrays_are_read_only():
+    with pytest.raises(ValueError):
+        registry.K1[0] = 0.0
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from balkony.capital_cost import BlenderCost, CompressorCost, HeatExchangerCost, PumpCost, TrayCost, VesselCost
+from balkony.capital_cost.core import CostStatus
+from balkony.capital_cost.selector import ConfigurationSelector
+
+TOLERANCE = 1e-12
+
+@pytest.mark.parametrize("equipment, inputs", [
+    (HeatExchangerCost, {'pressure': np.array([1.0, 20.0, 60.0, 150.0, 250.0])}),
+    (VesselCost, {'pressure': 10.0, 'diameter': 2.0}),
+    (TrayCost, {'num_trays': 12}),
+    (BlenderCost, {}),
+])
+def test_costs_match_estimators(equipment, inputs):
+    sizes = np.array([2.0, 15.0, 80.0, 400.0, 5000.0])
+    selector = ConfigurationSelector(equipment)
+    value, code = selector.costs(sizes, CEPCI=600, **inputs)
+
+    assert value.shape == (len(sizes), len(selector.candidates))
+    for j, (type, material) in enumerate(selector.candidates):
+        estimator = equipment(type) if material is None else equipment(type, material)
+        batch = estimator.bare_module_many(sizes, **inputs, CEPCI=600)
+        assert value[:, j] == pytest.approx(batch.value, rel=TOLERANCE)
+        assert (code[:, j] == batch.code).all()
+
+def test_only_valid_pairs():
+    candidates = ConfigurationSelector(HeatExchangerCost).candidates
+
+    assert all(type.name in material.value for type, material in candidates)
+    assert len(candidates) == sum(type.name in material.value for type in HeatExchangerCost.Type for material in HeatExchangerCost.Material)
+
+def test_select_ranks_in_range_candidates():
+    sizes = np.array([50.0, 500.0, 0.01])
+    pressures = np.array([10.0, 30.0, 10.0])
+    selector = ConfigurationSelector(HeatExchangerCost)
+    selection = selector.select(sizes, k=5, pressure=pressures)
+    value, code = selector.costs(sizes, pressure=pressures)
+
+    assert selection.index.shape == (3, 5)
+    for row in range(2):
+        expected = np.sort(value[row][code[row] == CostStatus.OK])[:5]
+        assert selection.value[row] == pytest.approx(expected, rel=TOLERANCE)
+        for (type, material), cost in selection.ranking(row):
+            assert HeatExchangerCost(type, material).bare_module(sizes[row], pressures[row]).value == pytest.approx(cost, rel=TOLERANCE)
+    assert selection.ranking(2) == []
+    assert (selection.index[2] == -1).all()
+
+def test_several_classes():
+    selector = ConfigurationSelector((PumpCost, CompressorCost))
+    selection = selector.select([50.0, 1000.0], k=len(selector.candidates), pressure=20.0)
+
+    assert {candidate.type for candidate in selector.candidates} == set(PumpCost.Type) | set(CompressorCost.Type)
+    assert all(np.diff(selection.value[1][selection.index[1] >= 0]) >= 0)
+
+def test_constructor_options():
+    sizes, pressure = np.array([50.0, 500.0]), 60.0
+    shell = ConfigurationSelector(HeatExchangerCost, tube_only=False)
+    value, _ = shell.costs(sizes, pressure=pressure)
+
+    assert not np.allclose(value, ConfigurationSelector(HeatExchangerCost).costs(sizes, pressure=pressure)[0], equal_nan=True)
+    for j, (type, material) in enumerate(shell.candidates):
+        expected = HeatExchangerCost(type, material, tube_only=False).bare_module_many(sizes, pressure).value
+        assert value[:, j] == pytest.approx(expected, rel=TOLERANCE, nan_ok=True)
+    assert ConfigurationSelector((PumpCost, HeatExchangerCost), tube_only=False).candidates
+    with pytest.raises(Exception):
+        ConfigurationSelector(HeatExchangerCost, tube_ony=False)
+
+def test_invalid_inputs():
+    with pytest.raises(Exception):
+        ConfigurationSelector(HeatExchangerCost).costs([10.0])
+    with pytest.raises(Exception):
+        ConfigurationSelector(BlenderCost).costs([10.0], pressure=1.0)
+    with pytest.raises(Exception):
+        ConfigurationSelector(BlenderCost).select([10.0], k=0)
+    with pytest.raises(Exception):
+        ConfigurationSelector(BlenderCost, 'total_module')
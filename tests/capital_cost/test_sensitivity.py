@@ -0,0 +1,55 @@
+import pytest
+from balkony.capital_cost import BlenderCost, PumpCost
+from balkony.capital_cost.distributions import Normal, Uniform
+from balkony.capital_cost.monte_carlo import MonteCarlo
+from balkony.capital_cost.sensitivity import Sensitivity
+
+@pytest.fixture
+def model():
+    mc = MonteCarlo()
+    mc.add('B-101', BlenderCost(BlenderCost.Type.Kneader), volume=Uniform(0.5, 3.0))
+    mc.add('P-101', PumpCost(PumpCost.Type.Centrifugal), power=Normal(50.0, 2.0), pressure=Uniform(10.0, 20.0),
+           coefficients={'K1': Normal(0.0, 0.01)})
+    return mc
+
+def test_tornado(model):
+    result = Sensitivity(model).tornado()
+    blender, pump = BlenderCost(BlenderCost.Type.Kneader), PumpCost(PumpCost.Type.Centrifugal)
+
+    assert result.base == pytest.approx(blender.bare_module(1.75).value + pump.bare_module(50.0, 15.0).value, rel=1e-9)
+    assert result.evaluations == 9
+    assert [(bar.item, bar.input) for bar in result.bars][0] == ('B-101', 'volume')
+    assert [bar.swing for bar in result.bars] == sorted((bar.swing for bar in result.bars), reverse=True)
+    volume = result.bars[0]
+    assert (volume.low, volume.high) == pytest.approx((0.75, 2.75))
+    assert volume.high_cost - volume.low_cost == pytest.approx(blender.bare_module(2.75).value - blender.bare_module(0.75).value, rel=1e-9)
+    assert result.seconds_per_evaluation > 0
+
+def test_sobol_additive_model(model):
+    result = Sensitivity(model).sobol(samples=8192, seed=1)
+
+    assert result.factors == [('B-101', 'volume'), ('P-101', 'power'), ('P-101', 'pressure'), ('P-101', 'K1')]
+    assert result.evaluations == 8192*6
+    assert result.ranking()[0][0] == ('B-101', 'volume')
+    # Costs add up over items and inputs barely interact, so first-order
+    # and total-effect indices agree and sum to about one.
+    assert result.first == pytest.approx(result.total, abs=0.03)
+    assert result.total.sum() == pytest.approx(1.0, abs=0.05)
+
+def test_sobol_by_item(model):
+    by_input = Sensitivity(model).sobol(samples=4096, seed=2)
+    by_item = Sensitivity(model).sobol(samples=4096, seed=2, by='item')
+
+    assert by_item.factors == [('B-101',), ('P-101',)]
+    assert by_item.total[0] == pytest.approx(by_input.total[0], rel=1e-12)
+    assert by_item.total[1] == pytest.approx(by_input.total[1:].sum(), abs=0.02)
+
+def test_requires_uncertain_inputs():
+    mc = MonteCarlo()
+    mc.add('P-101', PumpCost(PumpCost.Type.Centrifugal), power=50.0, pressure=10.0)
+    with pytest.raises(Exception):
+        Sensitivity(mc)
+
+def test_invalid_grouping(model):
+    with pytest.raises(Exception):
+        Sensitivity(model).sobol(by='equipment')
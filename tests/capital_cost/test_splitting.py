@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from balkony.capital_cost import CompressorCost, HeatExchangerCost, TankCost
+from balkony.capital_cost.core import CostStatus
+from balkony.capital_cost.splitting import split, split_many
+
+TOLERANCE = 1e-12
+
+def brute_force(estimator, size, **inputs):
+    properties = estimator.equipment.properties
+    totals = {units: units*estimator.bare_module(size/units, **inputs).value for units in range(1, 500)
+              if properties.min_size <= size/units <= properties.max_size}
+    return min(totals.items(), key=lambda item: item[1])
+
+@pytest.mark.parametrize("estimator, sizes, inputs", [
+    (CompressorCost(CompressorCost.Type.Centrifugal), [450.0, 2000.0, 3500.0, 9000.0, 50000.0], {}),
+    (TankCost(TankCost.Type.APIFloatingRoof), [5000.0, 50000.0, 200000.0], {'pressure': 0.5}),
+    (HeatExchangerCost(HeatExchangerCost.Type.FloatingHead), [50.0, 900.0, 5000.0], {'pressure': 10.0}),
+])
+def test_split_is_optimal(estimator, sizes, inputs):
+    batch = split_many(estimator, size=np.array(sizes), **inputs)
+
+    for i, size in enumerate(sizes):
+        units, total = brute_force(estimator, size, **inputs)
+        result = split(estimator, size=size, **inputs)
+        assert result.units == units == batch.units[i]
+        assert result.value == pytest.approx(total, rel=TOLERANCE)
+        assert result.unit_size == pytest.approx(size/units, rel=TOLERANCE)
+        assert result.result.code == CostStatus.OK
+
+def test_out_of_reach_rows():
+    compressor = CompressorCost(CompressorCost.Type.Centrifugal)
+    batch = split_many(compressor, power=[100.0, 9000.0, np.nan, -1.0], max_units=2)
+
+    assert batch.units.tolist() == [1, 2, 1, 1]
+    assert batch.result.code.tolist() == [CostStatus.SIZE_BELOW, CostStatus.SIZE_ABOVE, CostStatus.INVALID_INPUT, CostStatus.INVALID_INPUT]
+    assert batch.value[1] == pytest.approx(2*compressor.bare_module(4500.0).value, rel=TOLERANCE)
+    assert np.isnan(batch.value[2:]).all()
+
+def test_purchased_split():
+    tank = TankCost(TankCost.Type.APIFloatingRoof)
+    result = split(tank, 'purchased', volume=100000.0)
+
+    assert result.units > 1
+    assert result.value == pytest.approx(result.units*tank.purchased(result.unit_size).value, rel=TOLERANCE)
+
+def test_invalid_inputs():
+    compressor = CompressorCost(CompressorCost.Type.Centrifugal)
+    with pytest.raises(Exception):
+        split(compressor, 'total_module', power=100.0)
+    with pytest.raises(Exception):
+        split(compressor, max_units=0, power=100.0)
+    with pytest.raises(Exception):
+        split(compressor)
@@ -0,0 +1,76 @@
+import math
+import numpy as np
+import pytest
+from balkony.capital_cost import PumpCost
+from balkony.capital_cost.core import EquipmentCostResultArray
+from balkony.capital_cost.statistics import MomentAccumulator, QuantileAccumulator
+
+@pytest.fixture
+def samples():
+    return np.random.default_rng(0).lognormal(12.0, 1.0, 200_000)
+
+def test_moments_merge(samples):
+    parts = [MomentAccumulator().update(part) for part in np.array_split(samples, 7)]
+    merged = MomentAccumulator()
+    for part in parts:
+        merged.merge(part)
+
+    assert merged.count == len(samples)
+    assert merged.mean == pytest.approx(samples.mean(), rel=1e-12)
+    assert merged.std == pytest.approx(samples.std(ddof=1), rel=1e-10)
+    assert (merged.min, merged.max) == (samples.min(), samples.max())
+
+@pytest.mark.parametrize("alpha", [0.01, 0.05])
+def test_quantiles_within_relative_accuracy(samples, alpha):
+    sketch = QuantileAccumulator(alpha)
+    for part in np.array_split(samples, 10):
+        sketch.update(part)
+
+    for q in (0.0, 0.01, 0.1, 0.5, 0.9, 0.99, 1.0):
+        expected = np.quantile(samples, q, method='lower')
+        assert abs(sketch.quantile(q) - expected) <= alpha*expected
+
+def test_quantile_merge_is_exact(samples):
+    whole = QuantileAccumulator().update(samples)
+    merged = QuantileAccumulator()
+    for part in np.array_split(samples, 5):
+        merged.merge(QuantileAccumulator().update(part))
+
+    assert merged.quantiles(np.linspace(0, 1, 21)) == whole.quantiles(np.linspace(0, 1, 21))
+    with pytest.raises(Exception):
+        merged.merge(QuantileAccumulator(0.05))
+
+def test_signed_values():
+    values = np.random.default_rng(1).normal(0.0, 1.0, 50_000)
+    values[:100] = 0.0
+    sketch = QuantileAccumulator(0.02).update(values)
+
+    for q in (0.05, 0.25, 0.75, 0.95):
+        expected = np.quantile(values, q, method='lower')
+        assert abs(sketch.quantile(q) - expected) <= 0.02*abs(expected)
+    assert sketch.quantile(0.5) == pytest.approx(np.quantile(values, 0.5, method='lower'), abs=0.01)
+
+def test_cost_results_as_input():
+    pump = PumpCost(PumpCost.Type.Centrifugal)
+    power = np.linspace(1.0, 300.0, 500)
+    batch = pump.bare_module_many(power, 10.0)
+    results = [pump.bare_module(value, 10.0) for value in power]
+
+    from_batch = MomentAccumulator().update(batch)
+    from_stream = MomentAccumulator()
+    for result in results:
+        from_stream.update(result)
+
+    assert from_stream.count == from_batch.count == 500
+    assert from_stream.mean == pytest.approx(from_batch.mean, rel=1e-12)
+    assert MomentAccumulator().update(results).mean == pytest.approx(from_batch.mean, rel=1e-12)
+    assert QuantileAccumulator().update(EquipmentCostResultArray(results)).quantiles([0.5]) == QuantileAccumulator().update(batch).quantiles([0.5])
+
+def test_non_finite_values_are_skipped():
+    moments = MomentAccumulator().update([1.0, math.nan, 3.0, math.inf])
+    sketch = QuantileAccumulator().update([1.0, math.nan, 3.0])
+
+    assert (moments.count, moments.mean) == (2, 2.0)
+    assert sketch.count == 2
+    assert math.isnan(QuantileAccumulator().quantile(0.5))
+    assert math.isnan(MomentAccumulator().update([1.0]).std)
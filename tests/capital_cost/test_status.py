@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from balkony.capital_cost import BlenderCost, PumpCost
+from balkony.capital_cost.core import CostStatus
+from balkony.capital_cost.registry import registry
+
+@pytest.fixture
+def batch():
+    pump = PumpCost(PumpCost.Type.Centrifugal)
+    return pump.bare_module_many([0.5, 10.0, 400.0, -1.0, np.nan, 10.0], [5.0, 5.0, 200.0, 5.0, 0.0, 0.0])
+
+def test_scalar_returns_flags():
+    pump = PumpCost(PumpCost.Type.Centrifugal)
+
+    assert pump.bare_module(10.0, 5.0).code == CostStatus.OK
+    assert pump.bare_module(400.0, 200.0).code == CostStatus.SIZE_ABOVE | CostStatus.PRESSURE_ABOVE
+    assert BlenderCost(BlenderCost.Type.Kneader).purchased(0.1).code == CostStatus.SIZE_BELOW
+    with pytest.raises(ValueError):
+        pump.bare_module(-1.0, 5.0)
+
+def test_batch_flags_match_scalar(batch):
+    pump = PumpCost(PumpCost.Type.Centrifugal)
+
+    for i, (power, pressure) in enumerate([(0.5, 5.0), (10.0, 5.0), (400.0, 200.0)]):
+        assert batch.result(i).code == pump.bare_module(power, pressure).code
+        assert batch.result(i).status == pump.bare_module(power, pressure).status
+
+def test_invalid_input_is_flagged(batch):
+    assert batch.code[3:].tolist() == [CostStatus.INVALID_INPUT]*3
+    assert np.isnan(batch.value[3:]).all()
+    assert batch.result(3).status['input'] == ('Error - Invalid input', False)
+    assert registry.purchased_many([registry.type_id(PumpCost.Type.Centrifugal)], [0.0]).code.tolist() == [CostStatus.INVALID_INPUT]
+
+def test_invalid_rows_read_as_invalid(batch):
+    invalid = ('Error - Invalid input', False)
+
+    assert batch.status['size'].tolist() == [1, 0, 2, 3, 3, 3]
+    assert batch.status['pressure'].tolist()[3:] == [3, 3, 3]
+    assert batch.result(4).status == {'size': invalid, 'pressure': invalid, 'input': invalid}
+
+def test_invalid_pressure_result():
+    factors = PumpCost(PumpCost.Type.Centrifugal).pressure.factor_many([5.0, 0.0, np.nan])
+
+    assert factors.status.tolist()[1:] == [3, 3]
+    assert factors.result(1).status == ('Error - Invalid input', False)
+    assert factors.result(0).status == ('OK', True)
+
+def test_count_and_filter(batch):
+    counts = batch.count()
+
+    assert counts[CostStatus.OK] == 1
+    assert counts[CostStatus.SIZE_BELOW] == 1
+    assert counts[CostStatus.SIZE_ABOVE] == 1
+    assert counts[CostStatus.PRESSURE_ABOVE] == 1
+    assert counts[CostStatus.INVALID_INPUT] == 3
+    assert batch.count(CostStatus.SIZE_BELOW | CostStatus.SIZE_ABOVE) == 2
+    assert batch.where(CostStatus.INVALID_INPUT).tolist() == [3, 4, 5]
+
+    warnings = batch.filter(CostStatus.SIZE_BELOW | CostStatus.SIZE_ABOVE)
+    assert len(warnings) == 2
+    assert warnings.value.tolist() == batch.value[[0, 2]].tolist()
+    assert warnings.result(1) == batch.result(2)
+
+def test_filter_keeps_cepci_rows():
+    batch = BlenderCost(BlenderCost.Type.Kneader).purchased_many([0.1, 1.0, 2.0], [397.0, 500.0, 600.0])
+
+    assert batch.filter(CostStatus.OK).CEPCI.tolist() == [500.0, 600.0]
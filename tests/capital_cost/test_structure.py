@@ -0,0 +1,23 @@
+import numpy as np
+from balkony.capital_cost import TowerCost, VesselCost
+from balkony.capital_cost.core import Structure
+
+def test_shared_component():
+    assert VesselCost.Structure is Structure
+    assert TowerCost.Structure is Structure
+    assert TowerCost(struct=Structure()) is TowerCost()
+
+def test_many_matches_scalar():
+    structure = Structure(max_stress=1000)
+    pressures = np.array([-1.0, -0.5, -0.2, 0.0, 1.0, 4.0, 10.0, 50.0, 200.0])
+    diameters = np.array([0.1, 0.5, 1.0, 2.0, 5.0])
+    grid = structure.pressure_factor_many(pressures[:, None], diameters[None, :])
+
+    assert grid.shape == (len(pressures), len(diameters))
+    for i, pressure in enumerate(pressures):
+        for j, diameter in enumerate(diameters):
+            assert grid[i, j] == structure.pressure_factor(pressure, diameter)
+    assert (grid[0] == 1.25).all()
+    assert grid[3, 0] == 1.0
+    assert structure.pressure_factor_many(10.0, 2.0) == structure.pressure_factor(10.0, 2.0)
+    assert np.isnan(structure.pressure_factor_many([np.nan], [2.0])).all()
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from balkony.capital_cost import BlenderCost, HeatExchangerCost, TrayCost, VesselCost
+from balkony.capital_cost.core import CostStatus
+from balkony.capital_cost.sweep import sweep
+
+TOLERANCE = 1e-12
+
+def test_grid_matches_batch():
+    areas = np.array([5.0, 10.0, 200.0, 2000.0])
+    pressures = np.array([1.0, 10.0, 50.0, 200.0])
+    grid = sweep(HeatExchangerCost, area=areas, pressure=pressures, CEPCI=600)
+
+    assert grid.dims == ('type', 'material', 'area', 'pressure')
+    assert grid.shape == (len(HeatExchangerCost.Type), len(HeatExchangerCost.Material), 4, 4)
+    for type in HeatExchangerCost.Type:
+        for material in HeatExchangerCost.Material:
+            cell = grid.sel(type=type, material=material.name)
+            if type.name not in material.value:
+                assert np.isnan(cell.value).all()
+                assert (cell.code == CostStatus.INVALID_INPUT).all()
+                continue
+            batch = HeatExchangerCost(type, material).bare_module_many(areas[:, None], pressures[None, :], 600)
+            assert cell.value == pytest.approx(batch.value, rel=TOLERANCE)
+            assert (cell.code == batch.code).all()
+
+def test_fixed_inputs_drop_axes():
+    grid = sweep(VesselCost, type=VesselCost.Type.Vertical, material=['CarbonSteel', 'Titanium'], size=[1.0, 10.0, 100.0],
+                 pressure=[1.0, 10.0], diameter=2.0)
+
+    assert grid.dims == ('material', 'volume', 'pressure')
+    assert grid.sel(material='Titanium', volume=10.0, pressure=10.0).value == pytest.approx(
+        VesselCost(VesselCost.Type.Vertical, VesselCost.Material.Titanium).bare_module(10.0, 10.0, 2.0).value, rel=TOLERANCE)
+    assert sweep(BlenderCost, size=5.0).dims == ('type',)
+
+def test_purchased_grid():
+    grid = sweep(TrayCost, 'purchased', area=[1.0, 2.0], num_trays=[5, 10, 30])
+
+    assert grid.sel(type='Valve', material='CarbonSteel', area=2.0, num_trays=10).value == pytest.approx(
+        TrayCost(TrayCost.Type.Valve).purchased(2.0, 10).value, rel=TOLERANCE)
+    assert grid.batch.count(CostStatus.INVALID_INPUT) == 0
+
+def test_constructor_options():
+    areas, pressures = [50.0, 500.0], [10.0, 60.0]
+    grid = sweep(HeatExchangerCost, type=HeatExchangerCost.Type.FixedTube, material=HeatExchangerCost.Material.StainlessSteel,
+                 area=areas, pressure=pressures, tube_only=False)
+    shell = HeatExchangerCost(HeatExchangerCost.Type.FixedTube, HeatExchangerCost.Material.StainlessSteel, tube_only=False)
+
+    assert grid.value[:, 1] == pytest.approx(shell.bare_module_many(areas, 60.0).value, rel=TOLERANCE)
+    assert grid.value[1, 1] != pytest.approx(HeatExchangerCost(HeatExchangerCost.Type.FixedTube, HeatExchangerCost.Material.StainlessSteel)
+                                             .bare_module(500.0, 60.0).value, rel=1e-3)
+
+    struct = VesselCost.Structure(max_stress=600)
+    grid = sweep(VesselCost, type=VesselCost.Type.Vertical, material=VesselCost.Material.CarbonSteel, volume=[10.0, 50.0],
+                 pressure=20.0, diameter=[1.0, 3.0], struct=struct)
+    assert grid.value[1] == pytest.approx(VesselCost(VesselCost.Type.Vertical, struct=struct).bare_module_many(50.0, 20.0, [1.0, 3.0]).value,
+                                          rel=TOLERANCE)
+
+def test_invalid_sweeps():
+    grid = sweep(BlenderCost, size=[1.0, 2.0])
+
+    with pytest.raises(Exception):
+        grid.sel(volume=3.0)
+    with pytest.raises(Exception):
+        grid.sel(pressure=1.0)
+    with pytest.raises(Exception):
+        sweep(BlenderCost, pressure=[1.0])
+    with pytest.raises(Exception):
+        sweep(BlenderCost, size=[1.0], material='CarbonSteel')
+    with pytest.raises(Exception):
+        sweep(BlenderCost, 'total_module', size=[1.0])
+    with pytest.raises(Exception):
+        sweep(HeatExchangerCost, area=[10.0], pressure=1.0, tube_ony=False)